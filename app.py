@@ -1,8 +1,11 @@
 import streamlit as st
+from streamlit.runtime.scriptrunner import RerunException, StopException
 import json
-import os
-from PIL import Image
-import pandas as pd
+import page
+from dex import chrono, memoire, surveillance
+from dex.banc import rss_kib
+from dex.localisation import LANGUES
+from dex.sources import DERIVES, FICHIERS, chemin_source, construire, dependances
 
 # Configuration de la page
 st.set_page_config(
@@ -22,52 +25,141 @@ pages = {
     "🔍 Recherche de Monstres": "recherche_monstres", 
     "📦 Objets": "objets",
     "📊 Base de Données": "base_donnees",
+    "⚖️ Comparaison": "comparaison",
+    "📈 Projection": "projection",
+    "🛡️ Équipe": "equipe",
+    "📚 Compétences & Traits": "competences_traits",
+    "🔎 Recherche globale": "recherche_globale",
+    "🗄️ Requêtes SQL": "requetes_sql",
     "🧬 Synthèse": "synthese"
 }
 
 # Sidebar pour la navigation
 st.sidebar.title("Navigation")
 selected_page = st.sidebar.selectbox("Choisir une page", list(pages.keys()))
+st.sidebar.selectbox("Langue", list(LANGUES.keys()), format_func=lambda l: LANGUES[l], key="langue")
+mesures_actives = st.sidebar.checkbox("⏱️ Mesures de rendu", key="mesures_rendu",
+                                      help=f"Temps par section, ajoutés à {chrono.FICHIER_MESURES}")
+memoire_active = st.sidebar.checkbox("🧠 Mémoire", key="memoire",
+                                     help="Tailles des données, des caches et des sessions, et allocations "
+                                          "pendant le rendu (tracemalloc, ralentit l'exécution)")
+chrono.demarrer(pages[selected_page], mesures_actives)
+depart_memoire = memoire.demarrer_suivi() if memoire_active else None
 
-# Fonction pour charger les données JSON
-@st.cache_data
-def charger_json(path):
-    try:
+# Lectures d'un fichier modifié pendant qu'on le lit, avant d'utiliser la dernière
+NB_LECTURES = 3
+
+# Fonction pour charger les données JSON, partagées entre les sessions sans copie ni désérialisation
+# à chaque exécution (les pages ne modifient pas les données). Une entrée par signature du fichier :
+# l'ancienne version d'un fichier modifié sort du cache quand la place manque
+@st.cache_resource(max_entries=2 * len(FICHIERS))
+def lire_json(path, signature=None):
+    for _ in range(NB_LECTURES):
+        avant = surveillance.signature_fichier(path)
         with open(path, encoding="utf-8") as f:
-            return json.load(f)
+            contenu = f.read()
+        # Fichier modifié pendant la lecture (écriture non atomique) : relu
+        if surveillance.signature_fichier(path) == avant:
+            break
+    data = json.loads(contenu)
+    contenus_valides()[path] = data
+    return data
+
+# Dernier contenu valide de chaque fichier, conservé quand une nouvelle version est illisible
+@st.cache_resource
+def contenus_valides():
+    return {}
+
+def charger_json(path, signature=None):
+    try:
+        return lire_json(path, signature)
     except FileNotFoundError:
         st.error(f"Fichier non trouvé: {path}")
         return {}
+    except json.JSONDecodeError as e:
+        # Rien n'est mis en cache : le fichier est relu à l'exécution suivante, une fois corrigé
+        precedent = contenus_valides().get(path)
+        st.warning(f"JSON invalide dans {path} ({e}) : "
+                   + ("version précédente conservée" if precedent is not None else "fichier ignoré"))
+        return precedent if precedent is not None else {}
 
-# Chargement des données
-@st.cache_data
-def charger_donnees():
-    return {
-        "monstres": charger_json("data/monsters.json"),
-        "talents": charger_json("data/talents.json"),
-        "skills": charger_json("data/skills.json"),
-        "traits": charger_json("data/traits.json"),
-        "families": charger_json("data/families.json"),
-        "resistances": charger_json("data/resistances.json"),
-        "maxstats": charger_json("data/maxstats.json")
-    }
+# Structures dérivées, chacune en cache séparément (construites à partir de leurs dépendances) et
+# partagée entre les sessions, clé : signatures des seuls fichiers sources dont elles dépendent
+@st.cache_resource(max_entries=2 * len(DERIVES))
+def charger_derive(nom, signature, _releve):
+    return construire(nom, charger_donnees(DERIVES[nom][0], _releve))
 
-# Chargement des données
-donnees = charger_donnees()
+# Jeux de données demandés et leurs dépendances, dans l'état des fichiers du relevé
+def charger_donnees(noms, releve):
+    return {nom: charger_json(chemin_source(nom), surveillance.cle_fichier(releve, nom)) if nom in FICHIERS
+            else charger_derive(nom, surveillance.cle(releve, nom), releve)
+            for nom in dependances(noms)}
+
+# Relevé des fichiers de données (rechargement à chaud : un fichier modifié est relu, avec
+# ses seules structures dérivées, à l'exécution suivante ; images lues à chaque affichage)
+releve = surveillance.releve()
+releve_precedent = st.session_state.get("releve_donnees")
+if releve_precedent is not None and releve_precedent != releve:
+    modifies = surveillance.changements(releve_precedent, releve)
+    if modifies["files"] or modifies["images"]:
+        st.toast("🔄 Données rechargées : " + ", ".join([FICHIERS[nom] for nom in modifies["files"]] + modifies["images"]))
+st.session_state["releve_donnees"] = releve
+
+# Page sélectionnée, importée à la demande : seuls ses modules et les jeux de données
+# qu'elle déclare (DONNEES) sont chargés, rien pour l'accueil ni la page SQL
+module_page = getattr(page, pages[selected_page])
+donnees = None
+if module_page.DONNEES:
+    with chrono.section("chargement des données"):
+        donnees = charger_donnees(module_page.DONNEES, releve)
+    if "integrite" in donnees and donnees["integrite"]["summary"]["total"]:
+        st.sidebar.caption(f"⚠️ {donnees['integrite']['summary']['total']} référence(s) orpheline(s) dans les données "
+                           "(`python check_integrity.py`)")
 
 # Router vers la page sélectionnée
-if pages[selected_page] == "accueil":
-    from page import accueil
-    accueil.show()
-elif pages[selected_page] == "recherche_monstres":
-    from page import recherche_monstres
-    recherche_monstres.show(donnees)
-elif pages[selected_page] == "objets":
-    from page import objets
-    objets.main()
-elif pages[selected_page] == "base_donnees":
-    from page import base_donnees
-    base_donnees.show(donnees)
-elif pages[selected_page] == "synthese":
-    from page import synthese
-    synthese.show(donnees)
+try:
+    if pages[selected_page] == "objets":
+        module_page.main(donnees)
+    elif donnees is not None:
+        module_page.show(donnees)
+    else:
+        module_page.show()
+except (RerunException, StopException):
+    # st.rerun() / st.stop() interrompent le script : mesures de cette exécution enregistrées quand même
+    chrono.terminer()
+    raise
+
+# Panneau de mesures (temps par section de cette exécution)
+mesures = chrono.terminer()
+if mesures:
+    import pandas as pd
+    with st.sidebar.expander(f"⏱️ Rendu : {mesures['total_ms']:.0f} ms", expanded=True):
+        # Temps propre : hors sections imbriquées (la colonne s'additionne sans double compte)
+        st.dataframe(pd.DataFrame([{"Section": nom, "ms": valeurs["ms"], "Propre (ms)": valeurs["self_ms"],
+                                    "Appels": valeurs["calls"]}
+                                   for nom, valeurs in mesures["sections"].items()]),
+                     use_container_width=True, hide_index=True)
+
+# Panneau mémoire (données, caches, sessions et allocations de cette exécution)
+if depart_memoire is not None:
+    import pandas as pd
+    allocations = memoire.sites_allocation(depart_memoire, 10)
+    f = memoire.formater_octets
+    rss = rss_kib()
+    with st.sidebar.expander(f"🧠 Mémoire : {f(rss * 1024) if rss else 'RSS inconnue'}", expanded=True):
+        if donnees is not None:
+            tailles = memoire.tailles_donnees(donnees)
+            st.caption(f"Données : {f(tailles['total'])}")
+            st.dataframe(pd.DataFrame([{"Jeu": nom, "Taille": f(octets)} for nom, octets in tailles["datasets"].items()]),
+                         use_container_width=True, hide_index=True)
+        caches = memoire.tailles_caches()
+        if caches:
+            st.caption("Caches (taille sérialisée)")
+            st.dataframe(pd.DataFrame([{"Cache": c["cache"].split(".")[-1], "Entrées": c["entries"], "Taille": f(c["bytes"])}
+                                       for c in caches]), use_container_width=True, hide_index=True)
+        sessions = memoire.tailles_sessions()
+        st.caption(f"Session courante : {f(memoire.taille_profonde(st.session_state.to_dict()))}"
+                   + (f" — {len(sessions)} session(s) : {f(sum(s['bytes'] for s in sessions))}" if sessions else ""))
+        st.caption(f"Allocations pendant le rendu (pic {f(allocations['peak_bytes'])})")
+        st.dataframe(pd.DataFrame([{"Site": a["site"], "Taille": f(a["bytes"]), "Blocs": a["count"]}
+                                   for a in allocations["top"]]), use_container_width=True, hide_index=True)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmarks : chargement des données, recherche par nom, jointure maxstats, arbres
+de synthèse et rendu des pages (session Streamlit sans navigateur)
+
+Usage :
+    python benchmark.py --save                 # mesure et enregistre la référence
+    python benchmark.py                        # mesure et compare à la référence
+    python benchmark.py --threshold 0.1 --only page
+    python benchmark.py --no-pages --report -
+
+Code de sortie 1 si une mesure dépasse la référence de plus du seuil. La référence
+(benchmark_baseline.json) dépend de la machine : elle n'est pas versionnée, chaque
+poste enregistre la sienne avec --save.
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+
+from dex.banc import chronometrer, choisir_page, cliquer, comparer, lire_reference, nouvelle_session, pic_memoire, saisir
+from dex.localisation import trouver_cle
+from dex.matrices import construire_matrices
+from dex.sources import charger_sources, construire_donnees
+
+FICHIER_REFERENCE = "benchmark_baseline.json"
+
+# Nombre de monstres les plus profonds (arbre de synthèse) mesurés
+NB_ARBRES = 5
+
+def profondeur(arbre):
+    """Profondeur d'un arbre de synthèse"""
+    if not arbre or not arbre.get("parents"):
+        return 0
+    return 1 + max(profondeur(parent) for combinaison in arbre["parents"] for parent in combinaison)
+
+def benchmarks_donnees():
+    """Benchmarks de la couche de données : nom -> fonction"""
+    from page.recherche_monstres import get_maxstats
+    from page.synthese import get_synthesis_tree
+    
+    sources = charger_sources()
+    donnees = construire_donnees(sources)
+    monstres = donnees["monstres"]
+    noms = [m["name"] for m in monstres.values() if m.get("name")]
+    # Un nom sur dix, en majuscules pour exercer la normalisation
+    echantillon = [n.upper() for n in noms[::10]]
+    
+    profondeurs = {key: profondeur(get_synthesis_tree(key, donnees)) for key in monstres}
+    plus_profonds = sorted(profondeurs, key=lambda key: (-profondeurs[key], key))[:NB_ARBRES]
+    
+    return {
+        "chargement.json": lambda: charger_sources(),
+        "chargement.construction": lambda: construire_donnees(sources),
+        "recherche.trouver_cle": lambda: [trouver_cle(donnees["localisation"], "monstres", n) for n in echantillon],
+        "maxstats.get_maxstats": lambda: [get_maxstats(n, donnees["maxstats"]) for n in noms],
+        "maxstats.construire_matrices": lambda: construire_matrices(monstres, donnees["resistances"], donnees["maxstats"],
+                                                                    donnees["large_differences"]),
+        "synthese.arbres_profonds": lambda: [get_synthesis_tree(key, donnees) for key in plus_profonds],
+    }
+
+def preparer_page(libelle, actions=(), attendu=None):
+    """Session positionnée sur une page ; la mesure porte sur la réexécution
+
+    Un bouton ne vaut True que pendant l'exécution qui suit le clic : l'état préparé
+    doit survivre à une réexécution (la page Synthèse garde sa recherche dans la
+    session). `attendu` : texte qui doit figurer dans la page réexécutée.
+    """
+    session = nouvelle_session()
+    choisir_page(session, libelle)
+    for action, *args in actions:
+        action(session, *args)
+    if attendu is not None and not any(attendu in element.value for element in session.run().markdown):
+        raise RuntimeError(f"{libelle} : « {attendu} » absent après réexécution, la mesure porterait sur une page vide")
+    return lambda: session.run()
+
+def benchmarks_pages():
+    """Rendu des pages : nom -> fonction (réexécution du script dans l'état préparé)"""
+    return {
+        "page.accueil": preparer_page("Accueil"),
+        "page.recherche_monstres": preparer_page("Recherche de Monstres", [(saisir, 0, "Slime")]),
+        "page.base_donnees": preparer_page("Base de Données"),
+        "page.synthese": preparer_page("Synthèse", [(saisir, 0, "Goonache Goodie"), (cliquer, "Rechercher")],
+                                       attendu="Plan de synthèse"),
+    }
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Benchmarks de l'application")
+    parser.add_argument("--baseline", default=FICHIER_REFERENCE, help="Fichier JSON de référence")
+    parser.add_argument("--save", action="store_true", help="Enregistrer les résultats comme nouvelle référence")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Régression tolérée (0.25 = +25 %%)")
+    parser.add_argument("--repeat", type=int, default=5, help="Répétitions par benchmark")
+    parser.add_argument("--only", help="Ne lancer que les benchmarks dont le nom contient ce texte")
+    parser.add_argument("--no-pages", action="store_true", help="Sans les rendus de pages Streamlit")
+    parser.add_argument("--report", help="Écrire les résultats JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    sortie = sys.stderr if args.report == "-" else sys.stdout
+    
+    benchmarks = benchmarks_donnees()
+    if not args.no_pages:
+        benchmarks.update(benchmarks_pages())
+    if args.only:
+        benchmarks = {nom: f for nom, f in benchmarks.items() if args.only in nom}
+    
+    reference = lire_reference(args.baseline)
+    resultats = {}
+    for nom, fonction in benchmarks.items():
+        # Temps et mémoire mesurés séparément (tracemalloc ralentit l'exécution)
+        resultats[nom] = chronometrer(fonction, args.repeat)
+        resultats[nom]["peak_kib"] = pic_memoire(fonction)
+        ancienne = reference.get(nom, {}).get("median_ms")
+        ecart = f" ({resultats[nom]['median_ms'] / ancienne - 1:+.0%})" if ancienne else ""
+        print(f"{nom:32} {resultats[nom]['median_ms']:10.2f} ms{ecart:9} {resultats[nom]['peak_kib']:10.0f} Kio", file=sortie)
+    
+    rapport = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "results": resultats,
+        "regressions": comparer(resultats, reference, args.threshold),
+    }
+    
+    for regression in rapport["regressions"]:
+        print(f"RÉGRESSION {regression['benchmark']} {regression['metric']}: "
+              f"{regression['baseline']} -> {regression['current']} (x{regression['ratio']})", file=sortie)
+    if not reference and not args.save:
+        print(f"Pas de référence ({args.baseline}) : relancer avec --save pour l'enregistrer", file=sortie)
+    
+    if args.save:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({"meta": rapport["meta"], "results": resultats}, f, indent=2, ensure_ascii=False)
+        print(f"Référence enregistrée dans {args.baseline}", file=sortie)
+    
+    if args.report == "-":
+        json.dump(rapport, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(rapport, f, indent=2, ensure_ascii=False)
+    
+    return 1 if rapport["regressions"] and not args.save else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vérification de l'intégrité référentielle des fichiers de data/
+
+Usage :
+    python check_integrity.py                  # liste des références orphelines
+    python check_integrity.py --report -       # rapport JSON sur la sortie standard
+
+Code de sortie 1 si au moins une référence est orpheline.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from dex.integrite import verifier_integrite
+from dex.sources import charger_sources
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Vérification des références entre les fichiers de données")
+    parser.add_argument("--data", default="data", help="Dossier des fichiers JSON")
+    parser.add_argument("--report", help="Écrire le rapport JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    debut = time.perf_counter()
+    
+    try:
+        donnees = charger_sources(args.data)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Erreur lors du chargement des fichiers JSON: {e}", file=sys.stderr)
+        return 2
+    
+    rapport = verifier_integrite(donnees)
+    rapport["duration_seconds"] = round(time.perf_counter() - debut, 4)
+    
+    sortie_resume = sys.stderr if args.report == "-" else sys.stdout
+    for anomalie in rapport["anomalies"]:
+        print(f"{anomalie['path']}: '{anomalie['reference']}' introuvable dans {anomalie['target']}", file=sortie_resume)
+    resume = rapport["summary"]
+    detail = ", ".join(f"{verification}: {nb}" for verification, nb in resume["by_check"].items())
+    print(f"{resume['total']} référence(s) orpheline(s){f' ({detail})' if detail else ''} "
+          f"en {rapport['duration_seconds']}s", file=sortie_resume)
+    
+    if args.report == "-":
+        json.dump(rapport, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(rapport, f, indent=2, ensure_ascii=False)
+    
+    return 1 if resume["total"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# Racine du dépôt dans sys.path pour les tests (import de dex et page)
@@ -0,0 +1 @@
+# Couche de données (chargement, index et calculs partagés par les pages)
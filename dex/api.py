@@ -0,0 +1,585 @@
+"""
+API HTTP en lecture seule (JSON) sur les jeux de données du guide, pour les outils
+qui ne passent pas par Streamlit (bot, scripts d'équipe...).
+
+Serveur asyncio de la bibliothèque standard (HTTP/1.1, connexions persistantes).
+Aucun corps de requête n'est accepté : Content-Length invalide (400), corps (413) ou
+Transfer-Encoding (501) ferment la connexion sans lire la suite.
+Chaque réponse réussie est sérialisée une seule fois puis gardée en cache avec son
+ETag et sa version gzip (les erreurs et /health sont recalculées à chaque fois) :
+une requête répétée ne coûte qu'une recherche dans un dict,
+et un client qui renvoie l'ETag (If-None-Match) reçoit un 304 sans corps. Les
+fichiers sources modifiés sont rechargés en arrière-plan (relevé de
+dex.surveillance) ; l'ancien état sert les requêtes en attendant, puis le cache
+des réponses est vidé.
+
+Routes (GET ou HEAD ; paramètre `lang` pour la langue des noms) :
+    /monsters                      requête filtrée (q, rank, family, talent, skill, trait,
+                                   item, parent, min_<stat>, max_<stat>, sort, limit, offset)
+    /monsters/<nom ou clé>         fiche complète
+    /monsters/<...>/synthesis      plan de synthèse étape par étape (tree=1 : arbre complet)
+    /monsters/<...>/used-in        monstres obtenus à partir de ce monstre ou de sa famille
+    /items/<...>, /skills/<...>, /traits/<...>, /talents/<...>, /families/<...>
+    /search?q=...                  recherche plein texte (monstres, compétences, traits, objets)
+    /health                        état du chargement
+"""
+
+import asyncio
+import functools
+import gzip
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import numpy as np
+
+from dex import surveillance
+from dex.localisation import LANGUE_DEFAUT, LANGUES, cle_recherche, nom, trouver_cle
+from dex.matrices import STATS, classer, colonne, ligne, resistances_monstre
+from dex.recherche import rechercher
+from dex.sources import DOSSIER_DONNEES, FICHIERS, charger_sources, construire_donnees, dependances
+from dex.synthese import etapes_synthese, get_synthesis_tree
+
+HOTE = "127.0.0.1"
+PORT = 8600
+LIMITE_DEFAUT = 50
+LIMITE_MAX = 500
+TAILLE_MIN_GZIP = 1024
+MAX_REPONSES = 4096
+TAILLE_MAX_ENTETE = 16384
+DELAI_INACTIVITE = 30
+
+# Jeux de données servis par l'API
+DONNEES = ("monstres", "families", "items", "skills", "traits", "talents", "matrices", "localisation", "index",
+           "recherche")
+
+# Types de documents de la recherche plein texte <-> noms exposés par l'API
+TYPES_RECHERCHE = {"monster": "monstre", "skill": "skill", "trait": "trait", "item": "objet"}
+DATASETS_RECHERCHE = {"monstre": "monstres", "skill": "skills", "trait": "traits", "objet": "items"}
+
+# Libellés des messages d'erreur
+LIBELLES = {"monstres": "monstre", "items": "objet", "skills": "compétence", "traits": "trait", "talents": "talent",
+            "families": "famille"}
+
+
+class Introuvable(Exception):
+    """Entrée demandée absente des données (réponse 404)"""
+
+
+def charger(dossier=DOSSIER_DONNEES):
+    """Jeux de données de l'API et structures dérivées dont ils dépendent"""
+    sources = charger_sources(dossier, [source for source in dependances(DONNEES) if source in FICHIERS])
+    return construire_donnees(sources, DONNEES)
+
+
+def creer_api(dossier=DOSSIER_DONNEES):
+    """État du serveur : données, relevé des fichiers et cache des réponses"""
+    return {
+        "dossier": dossier,
+        "releve": surveillance.relever(dossier),
+        "donnees": charger(dossier),
+        "charge_le": time.time(),
+        "erreur": None,
+        "rechargement": None,
+        "reponses": OrderedDict(),
+    }
+
+
+def actualiser(api):
+    """Recharger en arrière-plan si un fichier source a changé (l'ancien état sert en attendant)"""
+    if api["rechargement"] is not None:
+        return
+    releve = surveillance.releve(api["dossier"])
+    if releve["fichiers"] == api["releve"]["fichiers"] and releve["versions"] == api["releve"]["versions"]:
+        return
+    # Relevé pris en compte même en cas d'échec : nouvel essai à la prochaine modification
+    api["releve"] = releve
+    api["rechargement"] = asyncio.get_running_loop().run_in_executor(None, charger, api["dossier"])
+
+    def terminer(futur):
+        api["rechargement"] = None
+        if futur.exception() is not None:
+            # Fichier invalide (écriture en cours, JSON cassé) : l'ancien état reste servi
+            api["erreur"] = f"{type(futur.exception()).__name__}: {futur.exception()}"
+        else:
+            api.update(donnees=futur.result(), charge_le=time.time(), erreur=None)
+        api["reponses"] = OrderedDict()
+
+    api["rechargement"].add_done_callback(terminer)
+
+
+def reference(donnees, langue, dataset, key):
+    """{"key", "name"} d'une entrée, nom dans la langue demandée"""
+    if dataset in donnees["localisation"]["noms"]["en"]:
+        return {"key": key, "name": nom(donnees["localisation"], langue, dataset, key)}
+    return {"key": key, "name": donnees[dataset].get(key, {}).get("name", key)}
+
+
+def reference_parent(donnees, langue, key):
+    """Parent de synthèse : famille ("_slime") ou monstre"""
+    if key.startswith("_"):
+        return {**reference(donnees, langue, "families", key), "family": True}
+    return reference(donnees, langue, "monstres", key)
+
+
+def resoudre(donnees, dataset, texte):
+    """Clé d'une entrée à partir de sa clé ou de son nom (dans n'importe quelle langue)"""
+    if texte in donnees[dataset]:
+        return texte
+    if dataset in donnees["localisation"]["recherche"]:
+        key = trouver_cle(donnees["localisation"], dataset, texte)
+    else:
+        cible = cle_recherche(texte)
+        key = next((k for k, entree in donnees[dataset].items()
+                    if cible in (cle_recherche(entree.get("name", k)), cle_recherche(k))), None)
+    if key is None:
+        raise Introuvable(f"{LIBELLES[dataset]} introuvable : {texte}")
+    return key
+
+
+def _stats(valeurs):
+    return None if valeurs is None or np.isnan(valeurs).all() else {
+        stat: (None if np.isnan(v) else int(v)) for stat, v in zip(STATS, valeurs)}
+
+
+def _entier(params, nom_param, defaut, minimum=0, maximum=None):
+    try:
+        valeur = int(params.get(nom_param, defaut))
+    except ValueError:
+        raise ValueError(f"{nom_param} doit être un entier") from None
+    if valeur < minimum or (maximum is not None and valeur > maximum):
+        raise ValueError(f"{nom_param} hors limites ({minimum}..{maximum})")
+    return valeur
+
+
+def resume_monstre(donnees, langue, key):
+    """Résumé d'un monstre (résultats de requête)"""
+    monstre = donnees["monstres"][key]
+    return {
+        **reference(donnees, langue, "monstres", key),
+        "number": monstre.get("number"),
+        "rank": monstre.get("rank"),
+        "family": monstre.get("family"),
+        "max_stats": _stats(ligne(donnees["matrices"], "max_stats", key)),
+    }
+
+
+def fiche_monstre(donnees, langue, key):
+    """Fiche complète d'un monstre"""
+    monstre = donnees["monstres"][key]
+    drops = monstre.get("drops") or {}
+    famille = monstre.get("family")
+    return {
+        **reference(donnees, langue, "monstres", key),
+        "names": {code: nom(donnees["localisation"], code, "monstres", key) for code in LANGUES},
+        "number": monstre.get("number"),
+        "rank": monstre.get("rank"),
+        "family": reference(donnees, langue, "families", famille) if famille else None,
+        "description": monstre.get("description"),
+        "growth": monstre.get("growth"),
+        "max_stats": _stats(ligne(donnees["matrices"], "max_stats", key)),
+        "resistances": {
+            "small": resistances_monstre(donnees["matrices"], key),
+            "large": resistances_monstre(donnees["matrices"], key, grande_taille=True),
+        },
+        "talents": [reference(donnees, langue, "talents", t) for t in monstre.get("talents") or []],
+        "traits": {
+            taille: [{**reference(donnees, langue, "traits", t), "level": niveau}
+                     for t, niveau in ((monstre.get("traits") or {}).get(taille) or {}).items()]
+            for taille in ["small", "large"]
+        },
+        "drops": {rarete: reference(donnees, langue, "items", drops[rarete]) if drops.get(rarete) else None
+                  for rarete in ["normal", "rare"]},
+        "synthesis": [[reference_parent(donnees, langue, parent) for parent in combinaison]
+                      for combinaison in monstre.get("synthesis") or [] if isinstance(combinaison, list)],
+        "used_in": [reference(donnees, langue, "monstres", m) for m in donnees["index"]["synthese"].get(key, [])],
+    }
+
+
+def _ensemble(donnees, params, nom_param, dataset, monstres_de):
+    """Monstres liés à l'entrée désignée par un paramètre (None si le paramètre est absent)"""
+    if nom_param not in params:
+        return None
+    return set(monstres_de(donnees["index"], resoudre(donnees, dataset, params[nom_param])))
+
+
+# Paramètre de requête -> (jeu de données du paramètre, monstres liés à l'entrée)
+FILTRES_INVERSES = {
+    "talent": ("talents", lambda index, k: index["talent_monstres"].get(k, [])),
+    "skill": ("skills", lambda index, k: [e["monstre"] for e in index["skill_monstres"].get(k, [])]),
+    "trait": ("traits", lambda index, k: [e["monstre"] for e in index["trait_monstres"].get(k, [])]
+              + [e["monstre"] for e in index["trait_talent_monstres"].get(k, [])]),
+    "item": ("items", lambda index, k: sum((index["drops"].get(k) or {}).values(), [])),
+    "parent": ("monstres", lambda index, k: index["synthese"].get(k, [])),
+}
+
+
+def requete_monstres(donnees, params, langue):
+    """Monstres filtrés, triés et paginés"""
+    matrices = donnees["matrices"]
+    cles = matrices["cles"]
+    masque = np.ones(len(cles), dtype=bool)
+
+    if "rank" in params:
+        rangs = {rang.strip().upper() for rang in params["rank"].split(",")}
+        masque &= np.array([rang in rangs for rang in matrices["rangs"]])
+    if "family" in params:
+        masque &= matrices["familles"] == resoudre(donnees, "families", params["family"])
+    for nom_param, (dataset, monstres_de) in FILTRES_INVERSES.items():
+        ensemble = _ensemble(donnees, params, nom_param, dataset, monstres_de)
+        if ensemble is not None:
+            masque &= np.array([cle in ensemble for cle in cles])
+    for stat in STATS:
+        for borne in ["min", "max"]:
+            texte = params.get(f"{borne}_{stat}")
+            if texte is None:
+                continue
+            try:
+                seuil = float(texte)
+            except ValueError:
+                raise ValueError(f"{borne}_{stat} doit être un nombre") from None
+            valeurs = colonne(matrices, "max_stats", stat)
+            with np.errstate(invalid="ignore"):
+                masque &= valeurs >= seuil if borne == "min" else valeurs <= seuil
+
+    pertinence = None
+    if params.get("q"):
+        pertinence = [r["key"] for r in rechercher(donnees["recherche"], params["q"], n=None, types={"monstre"})]
+        trouves = set(pertinence)
+        masque &= np.array([cle in trouves for cle in cles])
+
+    tri = params.get("sort") or ("relevance" if pertinence is not None else "number")
+    decroissant = tri.startswith("-")
+    champ = tri.lstrip("-")
+    if champ in STATS:
+        lignes = classer(colonne(matrices, "max_stats", champ), masque=masque, decroissant=decroissant)
+        resultats = [cles[i] for i in lignes]
+    elif champ == "relevance" and pertinence is not None:
+        resultats = [cle for cle in pertinence if masque[matrices["index"][cle]]]
+    elif champ in ("number", "name"):
+        resultats = [cle for cle, garde in zip(cles, masque) if garde]
+        if champ == "number":
+            resultats.sort(key=lambda cle: donnees["monstres"][cle].get("number") or 0, reverse=decroissant)
+        else:
+            noms = donnees["localisation"]["cles_noms"][langue]["monstres"]
+            resultats.sort(key=lambda cle: noms.get(cle, cle), reverse=decroissant)
+    else:
+        raise ValueError(f"tri inconnu : {tri} (number, name, relevance ou une stat : {', '.join(STATS)})")
+
+    limite = _entier(params, "limit", LIMITE_DEFAUT, 1, LIMITE_MAX)
+    decalage = _entier(params, "offset", 0)
+    return {
+        "total": len(resultats),
+        "offset": decalage,
+        "limit": limite,
+        "results": [resume_monstre(donnees, langue, cle) for cle in resultats[decalage:decalage + limite]],
+    }
+
+
+def route_monstre(donnees, params, langue, texte):
+    return fiche_monstre(donnees, langue, resoudre(donnees, "monstres", texte))
+
+
+def route_synthese(donnees, params, langue, texte):
+    """Plan de synthèse dans l'ordre chronologique, comme la page Synthèse"""
+    key = resoudre(donnees, "monstres", texte)
+    arbre = get_synthesis_tree(key, donnees)
+    etapes = []
+    for numero, noeud in enumerate(etapes_synthese(arbre), start=1):
+        if noeud.get("is_family"):
+            action = "capture_family"
+        else:
+            action = "synthesize" if noeud["parents"] else "capture"
+        etapes.append({
+            "step": numero,
+            "action": action,
+            **reference_parent(donnees, langue, noeud["key"]),
+            "rank": None if noeud.get("is_family") else noeud["rank"],
+            "from": [[reference_parent(donnees, langue, parent["key"]) for parent in combinaison]
+                     for combinaison in noeud["parents"]],
+        })
+    contenu = {"monster": reference(donnees, langue, "monstres", key),
+               "synthesizable": bool(donnees["monstres"][key].get("synthesis")), "steps": etapes}
+    if params.get("tree") in ("1", "true"):
+        contenu["tree"] = arbre
+    return contenu
+
+
+def route_utilisations(donnees, params, langue, texte):
+    """Monstres obtenus par synthèse à partir de ce monstre, directement ou via sa famille"""
+    key = resoudre(donnees, "monstres", texte)
+    famille = donnees["monstres"][key].get("family")
+    synthese = donnees["index"]["synthese"]
+    return {
+        "monster": reference(donnees, langue, "monstres", key),
+        "direct": [reference(donnees, langue, "monstres", m) for m in synthese.get(key, [])],
+        "via_family": [reference(donnees, langue, "monstres", m) for m in synthese.get(famille, [])] if famille else [],
+    }
+
+
+def route_objet(donnees, params, langue, texte):
+    key = resoudre(donnees, "items", texte)
+    sources = donnees["index"]["drops"].get(key) or {"normal": [], "rare": []}
+    return {
+        **reference(donnees, langue, "items", key),
+        **{champ: donnees["items"][key].get(champ) for champ in ["type", "description", "buy", "sell"]},
+        "dropped_by": {rarete: [reference(donnees, langue, "monstres", m) for m in monstres]
+                       for rarete, monstres in sources.items()},
+    }
+
+
+def route_competence(donnees, params, langue, texte):
+    key = resoudre(donnees, "skills", texte)
+    index = donnees["index"]
+    return {
+        **reference(donnees, langue, "skills", key),
+        **{champ: donnees["skills"][key].get(champ) for champ in ["type", "description", "mp_cost"]},
+        "talents": [{**reference(donnees, langue, "talents", e["talent"]), "level": e["niveau"]}
+                    for e in index["skill_talents"].get(key, [])],
+        "monsters": [{**reference(donnees, langue, "monstres", e["monstre"]), "talent": e["talent"], "level": e["niveau"]}
+                     for e in index["skill_monstres"].get(key, [])],
+    }
+
+
+def route_trait(donnees, params, langue, texte):
+    key = resoudre(donnees, "traits", texte)
+    index = donnees["index"]
+    return {
+        **reference(donnees, langue, "traits", key),
+        "description": donnees["traits"][key].get("description"),
+        "monsters": [{**reference(donnees, langue, "monstres", e["monstre"]), "size": e["taille"], "level": e["niveau"]}
+                     for e in index["trait_monstres"].get(key, [])],
+        "via_talents": [{**reference(donnees, langue, "monstres", e["monstre"]), "talent": e["talent"],
+                         "levels": e["niveaux"]} for e in index["trait_talent_monstres"].get(key, [])],
+    }
+
+
+def route_talent(donnees, params, langue, texte):
+    key = resoudre(donnees, "talents", texte)
+    talent = donnees["talents"][key]
+    return {
+        **reference(donnees, langue, "talents", key),
+        "skills": [{**reference(donnees, langue, "skills", s), "level": niveau}
+                   for s, niveau in (talent.get("skills") or {}).items()],
+        "traits": [{**reference(donnees, langue, "traits", t), "levels": niveaux}
+                   for t, niveaux in (talent.get("traits") or {}).items()],
+        "monsters": [reference(donnees, langue, "monstres", m) for m in donnees["index"]["talent_monstres"].get(key, [])],
+    }
+
+
+def route_famille(donnees, params, langue, texte):
+    key = resoudre(donnees, "families", texte)
+    membres = [cle for cle, garde in zip(donnees["matrices"]["cles"], donnees["matrices"]["familles"] == key) if garde]
+    return {
+        **reference(donnees, langue, "families", key),
+        "members": [reference(donnees, langue, "monstres", m) for m in membres],
+        "used_in": [reference(donnees, langue, "monstres", m) for m in donnees["index"]["synthese"].get(key, [])],
+    }
+
+
+def route_recherche(donnees, params, langue):
+    if not params.get("q"):
+        raise ValueError("paramètre q requis")
+    types = None
+    if params.get("type"):
+        inconnus = set(params["type"].split(",")) - set(TYPES_RECHERCHE)
+        if inconnus:
+            raise ValueError(f"type inconnu : {', '.join(sorted(inconnus))} ({', '.join(TYPES_RECHERCHE)})")
+        types = {TYPES_RECHERCHE[t] for t in params["type"].split(",")}
+    types_api = {v: k for k, v in TYPES_RECHERCHE.items()}
+    resultats = rechercher(donnees["recherche"], params["q"], n=_entier(params, "limit", 20, 1, LIMITE_MAX), types=types)
+    return {"results": [{"type": types_api[r["type"]], **reference(donnees, langue, DATASETS_RECHERCHE[r["type"]], r["key"]),
+                         "score": round(r["score"], 4)} for r in resultats]}
+
+
+def route_accueil(donnees, params, langue):
+    return {"endpoints": ["/" + "/".join(segment or "{name}" for segment in motif) for motif in ROUTES] + ["/health"]}
+
+
+def route_etat(api):
+    return {
+        "monsters": len(api["donnees"]["monstres"]),
+        "items": len(api["donnees"]["items"]),
+        "loaded_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(api["charge_le"])),
+        "reload_error": api["erreur"],
+    }
+
+
+# Segments du chemin -> fonction (None : segment variable, passé en argument)
+ROUTES = {
+    (): route_accueil,
+    ("monsters",): requete_monstres,
+    ("monsters", None): route_monstre,
+    ("monsters", None, "synthesis"): route_synthese,
+    ("monsters", None, "used-in"): route_utilisations,
+    ("items", None): route_objet,
+    ("skills", None): route_competence,
+    ("traits", None): route_trait,
+    ("talents", None): route_talent,
+    ("families", None): route_famille,
+    ("search",): route_recherche,
+}
+
+
+def router(api, cible):
+    """(statut, contenu) de la requête `cible` (chemin et paramètres)"""
+    morceaux = urlsplit(cible)
+    segments = tuple(unquote(s) for s in morceaux.path.strip("/").split("/") if s)
+    params = dict(parse_qsl(morceaux.query))
+    if segments == ("health",):
+        return 200, route_etat(api)
+    for motif, fonction in ROUTES.items():
+        if len(motif) == len(segments) and all(m is None or m == s for m, s in zip(motif, segments)):
+            langue = params.get("lang", LANGUE_DEFAUT)
+            try:
+                if langue not in LANGUES:
+                    raise ValueError(f"langue inconnue : {langue} ({', '.join(LANGUES)})")
+                return 200, fonction(api["donnees"], params, langue,
+                                     *[s for m, s in zip(motif, segments) if m is None])
+            except Introuvable as erreur:
+                return 404, {"error": str(erreur)}
+            except ValueError as erreur:
+                return 400, {"error": str(erreur)}
+            except Exception as erreur:
+                return 500, {"error": f"{type(erreur).__name__}: {erreur}"}
+    return 404, {"error": f"route inconnue : {morceaux.path}"}
+
+
+def reponse(api, cible):
+    """(statut, ETag, corps, corps gzip ou None), sérialisés une fois par état des données"""
+    reponses = api["reponses"]
+    entree = reponses.get(cible)
+    if entree is not None:
+        reponses.move_to_end(cible)
+        return entree
+    statut, contenu = router(api, cible)
+    corps = json.dumps(contenu, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    etag = '"' + hashlib.blake2b(corps, digest_size=12).hexdigest() + '"'
+    compresse = gzip.compress(corps, compresslevel=6, mtime=0) if len(corps) >= TAILLE_MIN_GZIP else None
+    entree = (statut, etag, corps, compresse)
+    # Erreurs et état du serveur recalculés à chaque requête : seules les réponses 200 des données sont gardées
+    if statut == 200 and urlsplit(cible).path.strip("/") != "health":
+        reponses[cible] = entree
+        if len(reponses) > MAX_REPONSES:
+            reponses.popitem(last=False)
+    return entree
+
+
+def _etag_correspond(etag, valeur):
+    """If-None-Match : liste d'ETags (faibles ou non, version gzip comprise) ou "*" """
+    etiquettes = {e.strip().removeprefix("W/").replace('-gzip"', '"') for e in valeur.split(",")}
+    return "*" in etiquettes or etag.replace('-gzip"', '"') in etiquettes
+
+
+@functools.lru_cache(maxsize=64)
+def accepte_gzip(valeur):
+    """Accept-Encoding autorise-t-il gzip ? (q=0 l'exclut, "*" le couvre)"""
+    qualites = {}
+    for element in valeur.split(","):
+        codage, *parametres = element.split(";")
+        qualite = 1.0
+        for parametre in parametres:
+            nom_parametre, _, valeur_parametre = parametre.partition("=")
+            if nom_parametre.strip().lower() == "q":
+                try:
+                    qualite = float(valeur_parametre)
+                except ValueError:
+                    qualite = 0.0
+        qualites[codage.strip().lower()] = qualite
+    for codage in ("gzip", "x-gzip", "*"):
+        if codage in qualites:
+            return qualites[codage] > 0
+    return False
+
+
+def traiter(api, methode, cible, entetes, garder):
+    """Octets de la réponse HTTP complète à une requête"""
+    supplementaires = ""
+    if methode not in ("GET", "HEAD"):
+        statut, etag, corps, compresse = 405, None, b'{"error":"API en lecture seule (GET, HEAD)"}', None
+        supplementaires = "Allow: GET, HEAD\r\n"
+    else:
+        actualiser(api)
+        statut, etag, corps, compresse = reponse(api, cible)
+
+    # Représentation choisie avant la revalidation : un 304 renvoie l'ETag de la version gzip si elle
+    # aurait été servie, comme le 200 qu'il remplace
+    if compresse is not None and accepte_gzip(entetes.get("accept-encoding", "")):
+        corps = compresse
+        etag = etag[:-1] + '-gzip"'
+        supplementaires += "Content-Encoding: gzip\r\n"
+    if etag:
+        supplementaires += f"ETag: {etag}\r\nCache-Control: no-cache\r\nVary: Accept-Encoding\r\n"
+
+    if statut == 200 and "if-none-match" in entetes and _etag_correspond(etag, entetes["if-none-match"]):
+        # Pas de corps ni de métadonnées de représentation (type, longueur, codage) sur un 304
+        tete = (f"HTTP/1.1 304 {HTTPStatus(304).phrase}\r\n"
+                f"ETag: {etag}\r\nCache-Control: no-cache\r\nVary: Accept-Encoding\r\n"
+                f"Connection: {'keep-alive' if garder else 'close'}\r\n\r\n")
+        return tete.encode("latin-1")
+
+    tete = (f"HTTP/1.1 {statut} {HTTPStatus(statut).phrase}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(corps)}\r\n{supplementaires}"
+            f"Connection: {'keep-alive' if garder else 'close'}\r\n\r\n")
+    return tete.encode("latin-1") + (b"" if methode == "HEAD" else corps)
+
+
+def refus(statut):
+    """Réponse d'erreur sans corps qui ferme la connexion (requête impossible à délimiter ou à servir)"""
+    return (f"HTTP/1.1 {statut} {HTTPStatus(statut).phrase}\r\nContent-Length: 0\r\n"
+            f"Connection: close\r\n\r\n").encode("latin-1")
+
+
+async def servir_connexion(api, lecteur, ecrivain):
+    """Requêtes successives d'une connexion (persistante en HTTP/1.1)"""
+    try:
+        while True:
+            try:
+                entete = await asyncio.wait_for(lecteur.readuntil(b"\r\n\r\n"), DELAI_INACTIVITE)
+            except asyncio.LimitOverrunError:
+                ecrivain.write(refus(431))
+                break
+            except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                break
+            premiere, *lignes = entete.decode("latin-1").split("\r\n")
+            try:
+                methode, cible, version = premiere.split(" ")
+                entetes = {}
+                for ligne_entete in lignes:
+                    if ligne_entete:
+                        nom_entete, valeur = ligne_entete.split(":", 1)
+                        entetes[nom_entete.strip().lower()] = valeur.strip()
+                longueur = int(entetes.get("content-length") or 0)
+                if longueur < 0:
+                    raise ValueError(longueur)
+            except ValueError:
+                ecrivain.write(refus(400))
+                break
+            # API en lecture seule : aucun corps n'est lu (ni chunked, ni Content-Length), la connexion est
+            # fermée plutôt que d'interpréter les octets du corps comme la requête suivante
+            if "transfer-encoding" in entetes:
+                ecrivain.write(refus(501))
+                break
+            if longueur:
+                ecrivain.write(refus(413))
+                break
+            connexion = entetes.get("connection", "").lower()
+            garder = connexion != "close" if version == "HTTP/1.1" else connexion == "keep-alive"
+            ecrivain.write(traiter(api, methode, cible, entetes, garder))
+            await ecrivain.drain()
+            if not garder:
+                break
+    except ConnectionError:
+        pass
+    finally:
+        ecrivain.close()
+
+
+async def demarrer(api, hote=HOTE, port=PORT):
+    """Serveur asyncio en écoute (port 0 : port libre choisi par le système)"""
+    return await asyncio.start_server(lambda l, e: servir_connexion(api, l, e), hote, port,
+                                      limit=TAILLE_MAX_ENTETE)
@@ -0,0 +1,161 @@
+"""
+Outils de mesure partagés par les scripts de benchmark et de charge : chronométrage
+répété, pic mémoire (tracemalloc), comparaison à une référence et sessions
+Streamlit sans navigateur (streamlit.testing, importé seulement à l'usage).
+"""
+
+import gc
+import json
+import math
+import os
+import statistics
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+FICHIER_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+SELECTEUR_PAGE = "Choisir une page"
+
+# Écart absolu minimal pour signaler une régression (bruit de mesure sur les petites valeurs)
+PLANCHERS = {"median_ms": 1.0, "peak_kib": 64.0}
+
+
+def chronometrer(fonction, repetitions=5, echauffement=1):
+    """Temps d'exécution de `fonction` sur plusieurs répétitions (ms)"""
+    for _ in range(echauffement):
+        fonction()
+    durees = []
+    for _ in range(repetitions):
+        gc.collect()
+        debut = time.perf_counter()
+        fonction()
+        durees.append((time.perf_counter() - debut) * 1000)
+    return {
+        "min_ms": round(min(durees), 3),
+        "median_ms": round(statistics.median(durees), 3),
+        "mean_ms": round(statistics.fmean(durees), 3),
+        "runs": repetitions,
+    }
+
+
+def pic_memoire(fonction):
+    """Pic d'allocation Python pendant un appel de `fonction` (Kio)"""
+    gc.collect()
+    deja_actif = tracemalloc.is_tracing()
+    if not deja_actif:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        fonction()
+        pic = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not deja_actif:
+            tracemalloc.stop()
+    return round((pic - base) / 1024, 1)
+
+
+def rss_kib():
+    """Mémoire résidente actuelle du processus (Kio), None si indisponible"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def rss_max_kib():
+    """Pic de mémoire résidente du processus (Kio), None si indisponible"""
+    if resource is None:
+        return None
+    pic = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Octets sous macOS, Kio sous Linux
+    return pic // 1024 if os.uname().sysname == "Darwin" else pic
+
+
+def temps_cpu():
+    """Temps CPU (utilisateur + système) consommé par le processus, en secondes"""
+    temps = os.times()
+    return temps.user + temps.system
+
+
+def centiles(valeurs, niveaux=(50, 90, 95, 99)):
+    """Centiles (méthode du rang le plus proche) d'une liste de durées"""
+    if not valeurs:
+        return {}
+    triees = sorted(valeurs)
+    return {f"p{n}": round(triees[max(0, math.ceil(n / 100 * len(triees)) - 1)], 3) for n in niveaux}
+
+
+def comparer(resultats, reference, seuil):
+    """Régressions : mesures dépassant la référence de plus de `seuil` (0.25 = +25 %)"""
+    regressions = []
+    for nom, mesure in resultats.items():
+        ancienne = reference.get(nom)
+        if not ancienne:
+            continue
+        for cle, plancher in PLANCHERS.items():
+            if not ancienne.get(cle) or mesure.get(cle) is None:
+                continue
+            if mesure[cle] > ancienne[cle] * (1 + seuil) and mesure[cle] - ancienne[cle] > plancher:
+                regressions.append({
+                    "benchmark": nom,
+                    "metric": cle,
+                    "baseline": ancienne[cle],
+                    "current": mesure[cle],
+                    "ratio": round(mesure[cle] / ancienne[cle], 3),
+                })
+    return regressions
+
+
+def lire_reference(chemin):
+    """Résultats de référence ({} si le fichier n'existe pas)"""
+    if not os.path.exists(chemin):
+        return {}
+    with open(chemin, encoding="utf-8") as f:
+        return json.load(f).get("results", {})
+
+
+def nouvelle_session(timeout=60):
+    """Session Streamlit sans navigateur, après la première exécution de l'application"""
+    from streamlit.testing.v1 import AppTest
+
+    session = AppTest.from_file(FICHIER_APP, default_timeout=timeout)
+    session.run()
+    return session
+
+
+def _verifier(session):
+    if session.exception:
+        raise RuntimeError(session.exception[0].value)
+    return session
+
+
+def choisir_page(session, libelle):
+    """Sélectionner la page dont le libellé contient `libelle` et réexécuter"""
+    selecteur = next(s for s in session.sidebar.selectbox if s.label == SELECTEUR_PAGE)
+    option = next(o for o in selecteur.options if libelle in o)
+    selecteur.set_value(option)
+    return _verifier(session.run())
+
+
+def saisir(session, index, texte):
+    """Saisir un texte dans le champ `index` de la page et réexécuter"""
+    session.text_input[index].input(texte)
+    return _verifier(session.run())
+
+
+def choisir(session, libelle, valeur):
+    """Choisir `valeur` dans la liste déroulante de la page intitulée `libelle`"""
+    next(s for s in session.selectbox if s.label == libelle).set_value(valeur)
+    return _verifier(session.run())
+
+
+def cliquer(session, libelle):
+    """Cliquer sur le premier bouton dont le libellé contient `libelle`"""
+    next(b for b in session.button if libelle in b.label).click()
+    return _verifier(session.run())
@@ -0,0 +1,48 @@
+"""
+Catalogue des objets précalculé au chargement : ordre d'affichage, regroupement
+par catégorie, clés de recherche et descriptions courtes.
+"""
+
+from dex.localisation import cle_recherche
+
+TOUTES_CATEGORIES = "Toutes les catégories"
+
+# Longueur maximale de la description affichée dans la grille
+LONGUEUR_RESUME = 100
+
+
+def construire_catalogue(items):
+    """Précalculer le tri, les catégories et les clés de recherche des objets"""
+    ordre = sorted(items, key=lambda key: items[key].get("name", key))
+    categories = {}
+    resumes = {}
+    for key in ordre:
+        categories.setdefault(items[key].get("type", "Autres"), []).append(key)
+        description = items[key].get("description") or "Aucune description disponible"
+        resumes[key] = description[:LONGUEUR_RESUME] + "..." if len(description) > LONGUEUR_RESUME else description
+    return {
+        "ordre": ordre,
+        "categories": categories,
+        "categories_triees": sorted(categories),
+        "cles_recherche": {key: cle_recherche(items[key].get("name", key)) for key in ordre},
+        "resumes": resumes,
+    }
+
+
+def filtrer_catalogue(catalogue, categorie=TOUTES_CATEGORIES, recherche=""):
+    """Clés des objets d'une catégorie dont le nom contient la recherche, dans l'ordre d'affichage"""
+    if categorie == TOUTES_CATEGORIES:
+        keys = catalogue["ordre"]
+    else:
+        keys = catalogue["categories"].get(categorie, [])
+    recherche = cle_recherche(recherche)
+    if recherche:
+        keys = [key for key in keys if recherche in catalogue["cles_recherche"][key]]
+    return keys
+
+
+def paginer(keys, page, par_page):
+    """Tranche d'une page (numérotée à partir de 1) et nombre total de pages"""
+    nb_pages = max(1, -(-len(keys) // par_page))
+    page = min(max(page, 1), nb_pages)
+    return keys[(page - 1) * par_page:page * par_page], page, nb_pages
@@ -0,0 +1,134 @@
+"""
+Mesure du temps de rendu par section de page.
+
+Une mesure est ouverte au début de chaque exécution du script (`demarrer`) et
+close à la fin (`terminer`), qui ajoute une ligne JSON au fichier de mesures.
+Entre les deux, les pages marquent leurs sections :
+- `etape("talents")` clôt la section en cours et ouvre la suivante (pas de
+  réindentation du code de la page) ;
+- `with section("arbre"):` pour un bloc précis ;
+- `@mesurer("images")` sur une fonction appelée plusieurs fois (temps cumulé et
+  nombre d'appels).
+
+Les sections peuvent s'imbriquer (une section dans une étape, une fonction
+mesurée dans une section) : chacune rapporte son temps total et son temps propre,
+hors sections imbriquées. La somme des temps propres ne compte chaque instant
+qu'une fois.
+
+Les mesures sont rangées par thread (Streamlit exécute chaque session dans son
+propre thread). Désactivées, chaque appel se réduit à un test sur None.
+"""
+
+import contextlib
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+
+FICHIER_MESURES = "metrics/render_times.jsonl"
+
+_etat = threading.local()
+_NUL = contextlib.nullcontext()
+
+
+def _courantes():
+    return getattr(_etat, "mesures", None)
+
+
+def _enregistrer(mesures, nom, duree, imbrique):
+    """Cumuler une section close (`imbrique` : temps passé dans ses sections imbriquées)"""
+    cumul = mesures["sections"].setdefault(nom, [0.0, 0.0, 0])
+    cumul[0] += duree
+    cumul[1] += duree - imbrique
+    cumul[2] += 1
+    # Temps imbriqué de la section englobante : section ouverte, sinon étape en cours
+    parent = mesures["pile"][-1] if mesures["pile"] else mesures["etape"]
+    if parent is not None:
+        parent[-1] += duree
+
+
+def _clore_etape(mesures):
+    if mesures["etape"] is not None:
+        nom, debut, imbrique = mesures["etape"]
+        mesures["etape"] = None
+        _enregistrer(mesures, nom, time.perf_counter() - debut, imbrique)
+
+
+def demarrer(page, actif=True):
+    """Ouvrir les mesures de l'exécution en cours (aucune si `actif` est faux)"""
+    _etat.mesures = ({"page": page, "debut": time.perf_counter(), "sections": {}, "etape": None, "pile": []}
+                     if actif else None)
+
+
+def actif():
+    """Des mesures sont-elles en cours pour ce thread ?"""
+    return _courantes() is not None
+
+
+def etape(nom):
+    """Clore la section en cours et ouvrir la section `nom`"""
+    mesures = _courantes()
+    if mesures is None:
+        return
+    _clore_etape(mesures)
+    mesures["etape"] = [nom, time.perf_counter(), 0.0]
+
+
+@contextlib.contextmanager
+def _section(mesures, nom):
+    imbrique = [0.0]
+    mesures["pile"].append(imbrique)
+    debut = time.perf_counter()
+    try:
+        yield
+    finally:
+        duree = time.perf_counter() - debut
+        mesures["pile"].pop()
+        _enregistrer(mesures, nom, duree, imbrique[0])
+
+
+def section(nom):
+    """Mesurer un bloc : `with section("arbre"):`"""
+    mesures = _courantes()
+    if mesures is None:
+        return _NUL
+    return _section(mesures, nom)
+
+
+def mesurer(nom):
+    """Décorateur : temps cumulé et nombre d'appels d'une fonction"""
+    def decorateur(fonction):
+        @functools.wraps(fonction)
+        def enveloppe(*args, **kwargs):
+            mesures = _courantes()
+            if mesures is None:
+                return fonction(*args, **kwargs)
+            with _section(mesures, nom):
+                return fonction(*args, **kwargs)
+        return enveloppe
+    return decorateur
+
+
+def terminer(fichier=FICHIER_MESURES):
+    """Clore les mesures, les ajouter au fichier (JSON Lines) et les renvoyer (None si inactives)"""
+    mesures = _courantes()
+    if mesures is None:
+        return None
+    _clore_etape(mesures)
+    _etat.mesures = None
+    resultat = {
+        "page": mesures["page"],
+        "timestamp": datetime.datetime.now().isoformat(timespec="milliseconds"),
+        "total_ms": round((time.perf_counter() - mesures["debut"]) * 1000, 3),
+        "sections": {
+            nom: {"ms": round(duree * 1000, 3), "self_ms": round(propre * 1000, 3), "calls": appels}
+            for nom, (duree, propre, appels) in mesures["sections"].items()
+        },
+    }
+    if fichier:
+        os.makedirs(os.path.dirname(os.path.abspath(fichier)), exist_ok=True)
+        with open(fichier, "a", encoding="utf-8") as f:
+            f.write(json.dumps(resultat, ensure_ascii=False) + "\n")
+    return resultat
@@ -0,0 +1,123 @@
+"""
+Écriture atomique et versionnée des fichiers de données.
+
+Chaque écriture :
+1. archive la version actuelle du fichier dans data/backups/ (gzip, horodatée),
+   en ne gardant que les NB_SAUVEGARDES plus récentes ;
+2. écrit le nouveau contenu dans un fichier temporaire du même dossier,
+   fsync, puis le renomme atomiquement sur la cible (un lecteur voit l'ancien
+   ou le nouveau fichier, jamais un fichier à moitié écrit) ;
+3. met à jour data/version.json : empreinte de chaque fichier écrit, sur
+   laquelle les caches de l'application sont indexés avec la date de
+   modification (dex.surveillance), et identifiant de version rapporté par les
+   scripts d'import. Les exports (SQLite, Arrow) enregistrent, eux, l'empreinte
+   du contenu des fichiers sources (dex.sources.empreinte_sources).
+"""
+
+import datetime
+import glob
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+NB_SAUVEGARDES = 5
+DOSSIER_SAUVEGARDES = "backups"
+FICHIER_VERSION = "version.json"
+
+
+def _fsync_dossier(dossier):
+    """Rendre le renommage durable (sans effet sur les systèmes qui ne le permettent pas)"""
+    try:
+        fd = os.open(dossier, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def ecrire_atomique(chemin, contenu):
+    """Écrire des octets dans un fichier temporaire puis le renommer sur la cible"""
+    dossier = os.path.dirname(os.path.abspath(chemin))
+    fd, temporaire = tempfile.mkstemp(dir=dossier, prefix=f".{os.path.basename(chemin)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(contenu)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(chemin):
+            shutil.copymode(chemin, temporaire)
+        else:
+            # mkstemp crée le fichier en 0600 : appliquer les droits habituels
+            masque = os.umask(0)
+            os.umask(masque)
+            os.chmod(temporaire, 0o666 & ~masque)
+        os.replace(temporaire, chemin)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+    _fsync_dossier(dossier)
+
+
+def sauvegarder(chemin, nb_sauvegardes=NB_SAUVEGARDES):
+    """Archiver le fichier actuel (gzip) et supprimer les archives les plus anciennes"""
+    if not os.path.exists(chemin):
+        return None
+    dossier = os.path.join(os.path.dirname(os.path.abspath(chemin)), DOSSIER_SAUVEGARDES)
+    os.makedirs(dossier, exist_ok=True)
+    horodatage = datetime.datetime.now().strftime("%Y%m%dT%H%M%S%f")
+    archive = os.path.join(dossier, f"{os.path.basename(chemin)}.{horodatage}.gz")
+    with open(chemin, "rb") as source:
+        ecrire_atomique(archive, gzip.compress(source.read()))
+
+    archives = sorted(glob.glob(os.path.join(dossier, f"{glob.escape(os.path.basename(chemin))}.*.gz")))
+    for ancienne in archives[:-nb_sauvegardes] if nb_sauvegardes > 0 else archives:
+        os.remove(ancienne)
+    return archive
+
+
+def lire_version(dossier="data"):
+    """Contenu de version.json ({} si absent ou illisible)"""
+    try:
+        with open(os.path.join(dossier, FICHIER_VERSION), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _tamponner_version(chemin, contenu):
+    """Enregistrer l'empreinte du fichier écrit et recalculer l'identifiant de version"""
+    dossier = os.path.dirname(os.path.abspath(chemin))
+    version = lire_version(dossier)
+    fichiers = version.get("files", {})
+    fichiers[os.path.basename(chemin)] = hashlib.sha1(contenu).hexdigest()
+    identifiant = hashlib.sha1(json.dumps(fichiers, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    version = {
+        "version": identifiant,
+        "updated": datetime.datetime.now().isoformat(timespec="seconds"),
+        "files": fichiers,
+    }
+    ecrire_atomique(os.path.join(dossier, FICHIER_VERSION),
+                    json.dumps(version, indent=4, sort_keys=True).encode("utf-8"))
+    return identifiant
+
+
+def ecrire_json(chemin, data, nb_sauvegardes=NB_SAUVEGARDES, versionner=True):
+    """Sauvegarder, écrire atomiquement un JSON et tamponner la version des données
+
+    versionner=False pour les fichiers dérivés qui ne sont pas des données du guide
+    (crosswalk) : la version des données ne change pas.
+    """
+    contenu = json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    sauvegarder(chemin, nb_sauvegardes)
+    ecrire_atomique(chemin, contenu)
+    if versionner:
+        return _tamponner_version(chemin, contenu)
+    return None
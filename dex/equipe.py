@@ -0,0 +1,179 @@
+"""
+Optimiseur d'équipe par couverture de résistances.
+
+Chaque monstre est réduit à un profil sur les éléments demandés :
+- un masque de bits (bit e à 1 si la résistance à l'élément e atteint le seuil)
+- un total (somme de ses résistances sur ces éléments)
+
+Une équipe est notée d'abord par le nombre d'éléments couverts par au moins un
+membre (OU des masques), puis par la somme des totaux de ses membres. La
+recherche est un parcours en profondeur avec élagage (branch-and-bound), réparti
+sur un pool de processus et borné par un budget de temps.
+"""
+
+import heapq
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+# Poids de la couverture devant le total (un élément couvert prime sur tout total)
+POIDS_COUVERTURE = 1_000_000
+
+# Fréquence (en nœuds) de vérification du budget de temps
+VERIFICATION_BUDGET = 2048
+
+# Part du budget accordée à la recherche dans le processus courant avant de
+# répartir le travail sur le pool (la plupart des requêtes finissent avant)
+PART_SEQUENTIELLE = 0.2
+
+# Pools de processus du module, par nombre de processus : créés à la première
+# répartition puis réutilisés (le démarrage des processus n'est payé qu'une fois)
+_pools = {}
+_verrou_pools = threading.Lock()
+
+
+def pool_processus(processus):
+    """Pool de `processus` processus partagé par les optimisations du processus courant"""
+    with _verrou_pools:
+        pool = _pools.get(processus)
+        if pool is None:
+            pool = _pools[processus] = ProcessPoolExecutor(max_workers=processus)
+        return pool
+
+
+def _oublier_pool(processus, pool):
+    """Retirer un pool cassé (processus tué) : le suivant en recrée un"""
+    with _verrou_pools:
+        if _pools.get(processus) is pool:
+            del _pools[processus]
+
+
+def profils(res, colonnes, seuil):
+    """Masques de bits et totaux des monstres sur les colonnes demandées"""
+    sous_res = np.nan_to_num(res[:, colonnes], nan=0.0)
+    poids_bits = 1 << np.arange(len(colonnes), dtype=np.int64)
+    masques = ((sous_res >= seuil) * poids_bits).sum(axis=1).astype(np.int64)
+    totaux = sous_res.sum(axis=1).astype(np.int64)
+    return masques, totaux
+
+
+def _explorer(masques, totaux, taille, nb_equipes, premiers, echeance, initiales=()):
+    """Parcours branch-and-bound des équipes dont le premier membre est dans `premiers`"""
+    masques = [int(m) for m in masques]
+    totaux = [int(t) for t in totaux]
+    n = len(masques)
+
+    # OU suffixe des masques : meilleure couverture atteignable depuis la position p
+    ou_suffixe = [0] * (n + 1)
+    for p in range(n - 1, -1, -1):
+        ou_suffixe[p] = ou_suffixe[p + 1] | masques[p]
+    # Sommes préfixes des totaux (triés par ordre décroissant par l'appelant)
+    prefixe = [0] * (n + 1)
+    for p in range(n):
+        prefixe[p + 1] = prefixe[p] + totaux[p]
+
+    def borne(masque, total, position, nombre):
+        """Score maximal en ajoutant `nombre` membres pris à partir de `position`"""
+        couverture = bin(masque | ou_suffixe[position]).count("1")
+        return couverture * POIDS_COUVERTURE + total + prefixe[position + nombre] - prefixe[position]
+
+    meilleures = list(initiales)  # tas min de (score, membres)
+    heapq.heapify(meilleures)
+    noeuds = 0
+    for premier in premiers:
+        pile = [((premier,), masques[premier], totaux[premier])]
+        while pile:
+            noeuds += 1
+            if noeuds % VERIFICATION_BUDGET == 0 and time.perf_counter() > echeance:
+                return meilleures, False
+            membres, masque, total = pile.pop()
+            manquants = taille - len(membres)
+            if manquants == 0:
+                score = bin(masque).count("1") * POIDS_COUVERTURE + total
+                if len(meilleures) < nb_equipes:
+                    heapq.heappush(meilleures, (score, membres))
+                elif score > meilleures[0][0]:
+                    heapq.heapreplace(meilleures, (score, membres))
+                continue
+            plancher = meilleures[0][0] if len(meilleures) >= nb_equipes else None
+            # La borne décroît avec l'indice du suivant : on s'arrête au premier échec
+            enfants = []
+            for suivant in range(membres[-1] + 1, n - manquants + 1):
+                if plancher is not None and borne(masque, total, suivant, manquants) <= plancher:
+                    break
+                enfants.append((membres + (suivant,), masque | masques[suivant], total + totaux[suivant]))
+            # Empiler en ordre inverse pour explorer d'abord les meilleurs totaux
+            pile.extend(reversed(enfants))
+    return meilleures, True
+
+
+def optimiser_equipe(matrices, elements, taille=3, nb_equipes=5, seuil=50, grande_taille=False,
+                     masque=None, budget=2.0, processus=None):
+    """Meilleures équipes couvrant les éléments demandés, dans un budget de temps (secondes)"""
+    debut = time.perf_counter()
+    echeance = debut + budget
+    colonnes = [matrices["resistance_index"][e] for e in elements]
+
+    res = matrices["res_large"] if grande_taille else matrices["res"]
+
+    # Candidats : monstres avec des résistances connues (et filtrés par le masque)
+    valides = ~np.isnan(matrices["res"]).all(axis=1)
+    if masque is not None:
+        valides &= masque
+    lignes = np.flatnonzero(valides)
+    masques, totaux = profils(res[lignes], colonnes, seuil)
+
+    # Tri par total décroissant : rend la borne par sommes préfixes exacte
+    ordre = np.argsort(-totaux, kind="stable")
+    lignes, masques, totaux = lignes[ordre], masques[ordre], totaux[ordre]
+
+    resultat = {"equipes": [], "complet": True, "duree": 0.0}
+    if len(lignes) < taille or not colonnes:
+        return resultat
+
+    premiers = list(range(len(lignes) - taille + 1))
+    if processus is None:
+        processus = os.cpu_count() or 1
+
+    echeance_sequentielle = echeance if processus <= 1 else debut + budget * PART_SEQUENTIELLE
+    meilleures, complet = _explorer(masques, totaux, taille, nb_equipes, premiers, echeance_sequentielle)
+    morceaux = [(meilleures, complet)]
+
+    if not complet and processus > 1:
+        # Répartition entrelacée (les premiers indices ont les plus gros sous-arbres),
+        # chaque processus partant des meilleures équipes déjà trouvées comme plancher
+        groupes = [premiers[k::processus] for k in range(processus)]
+        pool = pool_processus(processus)
+        try:
+            futurs = [pool.submit(_explorer, masques, totaux, taille, nb_equipes, groupe, echeance, meilleures)
+                      for groupe in groupes if groupe]
+            morceaux = [f.result() for f in futurs]
+        except BrokenProcessPool:
+            _oublier_pool(processus, pool)
+            raise
+
+    toutes = {}
+    resultat["complet"] = all(complet for _, complet in morceaux)
+    for meilleures, _ in morceaux:
+        for score, membres in meilleures:
+            toutes[membres] = score
+
+    for membres, score in sorted(toutes.items(), key=lambda e: (-e[1], e[0]))[:nb_equipes]:
+        cles = [matrices["cles"][lignes[m]] for m in membres]
+        valeurs = res[[lignes[m] for m in membres]][:, colonnes]
+        masque_equipe = 0
+        for m in membres:
+            masque_equipe |= int(masques[m])
+        resultat["equipes"].append({
+            "membres": cles,
+            "couverts": bin(masque_equipe).count("1"),
+            "total": int(sum(totaux[m] for m in membres)),
+            "meilleures_resistances": dict(zip(elements, np.nanmax(valeurs, axis=0).tolist())),
+            "resistances": {cle: dict(zip(elements, ligne.tolist())) for cle, ligne in zip(cles, valeurs)}
+        })
+    resultat["duree"] = time.perf_counter() - debut
+    return resultat
@@ -0,0 +1,168 @@
+"""
+Import incrémental et idempotent de monster2.json vers monsters.json.
+
+Pour chaque monstre, les valeurs cibles sont calculées à partir de l'entrée
+correspondante de monster2.json ; l'empreinte (hash du contenu) de ces valeurs
+est comparée à celle des valeurs actuelles, et seuls les champs réellement
+différents sont reportés dans le plan de changements. Appliquer le plan puis
+relancer le calcul ne produit plus aucun changement.
+"""
+
+import difflib
+import hashlib
+import json
+
+from dex.reconciliation import joindre, reconcilier
+
+RANGS = {1: "G", 2: "F", 3: "E", 4: "D", 5: "C", 6: "B", 7: "A", 8: "S", 9: "SS", 10: "???"}
+FAMILLES = {1: "_slime", 2: "_dragon", 3: "_nature", 4: "_beast", 5: "_material", 6: "_demon", 7: "_undead", 8: "_special"}
+
+STATS_GROWTH = {"HP": "hp", "MP": "mp", "Att": "atk", "Def": "def", "Agi": "agi", "Wis": "wis"}
+STATS_MAX = {"MaxHP": "max_hp", "MaxMP": "max_mp", "MaxAtt": "max_atk", "MaxDef": "max_def", "MaxAgi": "max_agi", "MaxWis": "max_wis"}
+
+PREFIXE_TRIVIA = "Trivia: "
+
+# Au-delà de ce ratio, une trivia est considérée comme déjà présente dans la description
+SEUIL_DOUBLON = 0.9
+
+
+def empreinte(valeurs):
+    """Hash stable du contenu d'un dict de champs"""
+    contenu = json.dumps(valeurs, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(contenu.encode("utf-8")).hexdigest()
+
+
+def _deja_present(trivia, texte):
+    """La trivia est-elle déjà contenue (ou quasi identique) dans le texte ?"""
+    if trivia in texte:
+        return True
+    matcher = difflib.SequenceMatcher(None, trivia, texte, autojunk=False)
+    return matcher.quick_ratio() >= SEUIL_DOUBLON and matcher.ratio() >= SEUIL_DOUBLON
+
+
+def description_cible(description, trivia):
+    """Description avec la trivia ajoutée une seule fois (fonction pure, donc idempotente)"""
+    texte = (description or "").strip()
+    # Retirer une trivia ajoutée lors d'un import précédent
+    if texte.startswith(PREFIXE_TRIVIA):
+        base = ""
+    else:
+        base = texte.split(f" {PREFIXE_TRIVIA}")[0].rstrip()
+    # Séparateur "?." laissé par l'ancien script d'import
+    if base.endswith(("?.", "!.")):
+        base = base[:-1]
+    trivia = (trivia or "").strip()
+    if not trivia or _deja_present(trivia, base):
+        return base or description
+    if not base:
+        return f"{PREFIXE_TRIVIA}{trivia}"
+    separateur = " " if base[-1] in ".!?" else ". "
+    return f"{base}{separateur}{PREFIXE_TRIVIA}{trivia}"
+
+
+def indexer_source(monster2, crosswalk=None):
+    """Index de monster2.json par nom, identifiant et numéro (et jointure via le crosswalk)"""
+    index = {"name": {}, "identifier": {}, "number": {}, "crosswalk": None}
+    if crosswalk is not None:
+        index["crosswalk"] = joindre(crosswalk, monster2)
+    for entree in monster2:
+        if entree.get("Name"):
+            index["name"].setdefault(entree["Name"].lower(), entree)
+        if entree.get("Identifier"):
+            index["identifier"].setdefault(entree["Identifier"], entree)
+        if entree.get("Number") is not None:
+            index["number"].setdefault(entree["Number"], entree)
+    return index
+
+
+def trouver_source(key, monstre, index):
+    """Entrée de monster2.json correspondant à un monstre
+
+    Avec un crosswalk, simple jointure (un monstre absent n'a pas de correspondance
+    un-à-un) ; sinon recherche par nom, identifiant, puis numéro.
+    """
+    if index["crosswalk"] is not None:
+        return index["crosswalk"].get(key)
+    nom = (monstre.get("name") or "").lower()
+    if nom in index["name"]:
+        return index["name"][nom]
+    for identifiant in [key, key.replace("_", "-")]:
+        if identifiant in index["identifier"]:
+            return index["identifier"][identifiant]
+    return index["number"].get(monstre.get("number"))
+
+
+def valeurs_cibles(monstre, source):
+    """Valeurs attendues des champs importés (seulement ceux que la source renseigne)"""
+    cibles = {}
+    if source.get("Number") is not None:
+        cibles["number"] = source["Number"]
+    if source.get("RankId") is not None:
+        cibles["rank"] = RANGS.get(source["RankId"], "Unknown")
+    if source.get("FamilyId") is not None:
+        cibles["family"] = FAMILLES.get(source["FamilyId"], "_unknown")
+    if source.get("FrenchName") and source["FrenchName"].strip():
+        cibles["french_name"] = source["FrenchName"]
+
+    cibles["description"] = description_cible(monstre.get("description"), source.get("Trivia"))
+
+    growth = {s: source[s2] for s2, s in STATS_GROWTH.items() if source.get(s2) is not None}
+    if growth:
+        cibles["growth"] = {**(monstre.get("growth") or {}), **growth}
+    max_stats = {s: source[s2] for s2, s in STATS_MAX.items() if source.get(s2) is not None}
+    if max_stats:
+        cibles["max_stats"] = {**(monstre.get("max_stats") or {}), **max_stats}
+    return cibles
+
+
+def calculer_changements(monsters, monster2, rapprochement=None):
+    """Plan des changements champ par champ et rapport d'import
+
+    Le rapprochement (voir dex.reconciliation) est recalculé s'il n'est pas fourni.
+    """
+    if rapprochement is None:
+        rapprochement = reconcilier(monsters, monster2)
+    index = indexer_source(monster2, rapprochement["crosswalk"])
+    changements = []
+    non_trouves = []
+    inchanges = 0
+    for key, monstre in monsters.items():
+        source = trouver_source(key, monstre, index)
+        if source is None:
+            non_trouves.append(key)
+            continue
+        cibles = valeurs_cibles(monstre, source)
+        actuelles = {champ: monstre.get(champ) for champ in cibles}
+        if empreinte(cibles) == empreinte(actuelles):
+            inchanges += 1
+            continue
+        champs = {
+            champ: {"old": actuelles[champ], "new": valeur}
+            for champ, valeur in cibles.items()
+            if empreinte({champ: valeur}) != empreinte({champ: actuelles[champ]})
+        }
+        changements.append({"key": key, "name": monstre.get("name"), "fields": champs})
+    incertains = set(rapprochement.get("uncertain", []))
+    for changement in changements:
+        if changement["key"] in incertains:
+            changement["match"] = rapprochement["crosswalk"][changement["key"]]
+    return {
+        "changes": changements,
+        "unmatched": non_trouves,
+        "summary": {
+            "monsters": len(monsters),
+            "changed": len(changements),
+            "unchanged": inchanges,
+            "unmatched": len(non_trouves),
+            "fields_changed": sum(len(c["fields"]) for c in changements),
+        },
+    }
+
+
+def appliquer_changements(monsters, changements):
+    """Appliquer le plan aux données en mémoire (seulement les champs modifiés)"""
+    for changement in changements:
+        monstre = monsters[changement["key"]]
+        for champ, valeurs in changement["fields"].items():
+            monstre[champ] = valeurs["new"]
+    return len(changements)
@@ -0,0 +1,140 @@
+"""
+Export des monstres en tables colonnaires typées (Arrow IPC ou Parquet).
+
+Les dicts imbriqués (croissance, stats maximales, résistances, talents, traits,
+synthèse) sont aplatis une seule fois : une table large `monsters` (identité et
+stats), et des tables longues `resistances`, `talents`, `traits` et `synthesis`.
+Chaque fichier porte l'empreinte des fichiers sources exportés dans ses
+métadonnées de schéma, ce qui permet aux pages de vérifier qu'il est à jour avant
+de le mapper en mémoire.
+"""
+
+import os
+import tempfile
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from dex.matrices import MAX_STATS_CLES, MAXSTATS_CLES, STATS
+
+DOSSIER_ARROW = "data/arrow"
+FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+CLE_EMPREINTE = b"sources_sha1"
+# Jeux de données exportés (dex.sources), dont l'empreinte est enregistrée dans les tables
+SOURCES = ("monstres", "families", "maxstats", "large_differences")
+
+SCHEMAS = {
+    "monsters": pa.schema(
+        [("key", pa.string()), ("name", pa.string()), ("french_name", pa.string()), ("number", pa.int32()),
+         ("rank", pa.string()), ("family", pa.string()), ("family_name", pa.string()),
+         ("drop_normal", pa.string()), ("drop_rare", pa.string())]
+        + [(f"growth_{stat}", pa.int8()) for stat in STATS]
+        + [(f"max_{stat}", pa.int32()) for stat in STATS]
+    ),
+    "resistances": pa.schema([("monster", pa.string()), ("resistance", pa.string()), ("size", pa.string()),
+                              ("value", pa.int16())]),
+    "talents": pa.schema([("monster", pa.string()), ("talent", pa.string()), ("position", pa.int8())]),
+    "traits": pa.schema([("monster", pa.string()), ("trait", pa.string()), ("size", pa.string()),
+                         ("level", pa.int16())]),
+    "synthesis": pa.schema([("monster", pa.string()), ("recipe", pa.int8()), ("position", pa.int8()),
+                            ("parent", pa.string()), ("parent_kind", pa.string())]),
+}
+
+
+def tables_arrow(donnees, empreinte=None):
+    """Tables Arrow aplaties des monstres, avec l'empreinte des sources en métadonnée"""
+    monstres = donnees.get("monstres") or {}
+    familles = donnees.get("families") or {}
+    maxstats_par_nom = {entree["name"].lower(): entree["stats"] for entree in donnees.get("maxstats") or []}
+    large = (donnees.get("large_differences") or {}).get("resistances") or {}
+    affectees, bonus = set(large.get("affected") or []), large.get("bonus", 0)
+
+    colonnes = {nom: {champ.name: [] for champ in schema} for nom, schema in SCHEMAS.items()}
+
+    def ajouter(table, *valeurs):
+        for champ, valeur in zip(colonnes[table], valeurs):
+            colonnes[table][champ].append(valeur)
+
+    for key, monstre in monstres.items():
+        growth = monstre.get("growth") or {}
+        # maxstats.json en priorité, comme dans dex.matrices
+        stats_max = maxstats_par_nom.get((monstre.get("name") or "").lower())
+        if stats_max:
+            max_stats = [stats_max.get(MAXSTATS_CLES[stat]) for stat in STATS]
+        else:
+            max_stats = [(monstre.get("max_stats") or {}).get(MAX_STATS_CLES[stat]) for stat in STATS]
+        drops = monstre.get("drops") or {}
+        famille = monstre.get("family")
+        ajouter("monsters", key, monstre.get("name"), monstre.get("french_name"), monstre.get("number"),
+                monstre.get("rank"), famille, (familles.get(famille) or {}).get("name"),
+                drops.get("normal"), drops.get("rare"), *[growth.get(stat) for stat in STATS], *max_stats)
+
+        for resistance_key, valeur in (monstre.get("resistances") or {}).items():
+            if valeur is None:
+                continue
+            ajouter("resistances", key, resistance_key, "small", valeur)
+            ajouter("resistances", key, resistance_key, "large",
+                    valeur + bonus if resistance_key in affectees else valeur)
+        for position, talent_key in enumerate(monstre.get("talents") or []):
+            ajouter("talents", key, talent_key, position)
+        for taille in ["small", "large"]:
+            for trait_key, niveau in ((monstre.get("traits") or {}).get(taille) or {}).items():
+                ajouter("traits", key, trait_key, taille, niveau)
+        for recette, parents in enumerate(monstre.get("synthesis") or []):
+            for position, parent in enumerate(parents or []):
+                ajouter("synthesis", key, recette, position, parent,
+                        "family" if str(parent).startswith("_") else "monster")
+
+    metadonnees = {CLE_EMPREINTE: (empreinte or "0").encode("utf-8")}
+    return {
+        nom: pa.Table.from_pydict(colonnes[nom], schema=schema.with_metadata(metadonnees))
+        for nom, schema in SCHEMAS.items()
+    }
+
+
+def chemin_table(nom, dossier=DOSSIER_ARROW, format_fichier="arrow"):
+    """Chemin du fichier d'une table exportée"""
+    return os.path.join(dossier, f"{nom}{FORMATS[format_fichier]}")
+
+
+def _ecrire_table(table, chemin, format_fichier):
+    """Écrire dans un fichier temporaire puis renommer atomiquement"""
+    dossier = os.path.dirname(os.path.abspath(chemin))
+    fd, temporaire = tempfile.mkstemp(dir=dossier, prefix=f".{os.path.basename(chemin)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        if format_fichier == "parquet":
+            pq.write_table(table, temporaire)
+        else:
+            with pa.OSFile(temporaire, "wb") as sortie, ipc.new_file(sortie, table.schema) as writer:
+                writer.write_table(table)
+        os.chmod(temporaire, 0o644)
+        os.replace(temporaire, chemin)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+
+
+def exporter_tables(donnees, dossier=DOSSIER_ARROW, format_fichier="arrow", empreinte=None):
+    """Écrire toutes les tables ; renvoie {table: chemin}"""
+    os.makedirs(dossier, exist_ok=True)
+    chemins = {}
+    for nom, table in tables_arrow(donnees, empreinte).items():
+        chemins[nom] = chemin_table(nom, dossier, format_fichier)
+        _ecrire_table(table, chemins[nom], format_fichier)
+    return chemins
+
+
+def lire_table(chemin):
+    """Lire une table : fichier IPC mappé en mémoire (sans copie) ou Parquet"""
+    if chemin.endswith(FORMATS["parquet"]):
+        return pq.read_table(chemin)
+    # Les buffers de la table référencent la projection mémoire, qui reste ouverte avec eux
+    return ipc.open_file(pa.memory_map(chemin, "r")).read_all()
+
+
+def empreinte_table(table):
+    """Empreinte des sources enregistrée à l'export ("0" si absente)"""
+    return ((table.schema.metadata or {}).get(CLE_EMPREINTE) or b"0").decode("utf-8")
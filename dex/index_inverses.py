@@ -0,0 +1,82 @@
+"""
+Index inversés construits au chargement : compétences, talents, traits et objets
+(drops) vers les monstres qui les possèdent, parents de synthèse vers les monstres
+obtenus.
+"""
+
+
+def construire_index(monstres, talents):
+    """Construire les index inversés compétence/talent/trait -> monstres"""
+    talent_monstres = {}
+    trait_monstres = {}
+    drops = {}
+    synthese = {}
+    for monster_key, monstre in monstres.items():
+        # Objets lâchés, séparés entre drop normal et drop rare
+        for rarete in ["normal", "rare"]:
+            item_key = (monstre.get("drops") or {}).get(rarete)
+            if item_key:
+                sources = drops.setdefault(item_key, {"normal": [], "rare": []})
+                sources[rarete].append(monster_key)
+
+        # Parents (monstres ou familles "_famille") -> monstres obtenus par synthèse
+        for combinaison in monstre.get("synthesis") or []:
+            if isinstance(combinaison, list):
+                for parent_key in combinaison:
+                    enfants = synthese.setdefault(parent_key, [])
+                    if monster_key not in enfants:
+                        enfants.append(monster_key)
+
+        for talent_key in monstre.get("talents") or []:
+            talent_monstres.setdefault(talent_key, []).append(monster_key)
+
+        # Traits propres au monstre, par taille
+        for taille in ["small", "large"]:
+            traits_taille = (monstre.get("traits") or {}).get(taille) or {}
+            for trait_key, niveau in traits_taille.items():
+                trait_monstres.setdefault(trait_key, []).append({
+                    "monstre": monster_key,
+                    "taille": taille,
+                    "niveau": niveau
+                })
+
+    skill_talents = {}
+    trait_talents = {}
+    for talent_key, talent in talents.items():
+        for skill_key, niveau in (talent.get("skills") or {}).items():
+            skill_talents.setdefault(skill_key, []).append({"talent": talent_key, "niveau": niveau})
+        # Traits accordés par le talent (liste des paliers de points)
+        for trait_key, niveaux in (talent.get("traits") or {}).items():
+            trait_talents.setdefault(trait_key, []).append({"talent": talent_key, "niveaux": niveaux})
+
+    # Jointures précalculées : compétence -> monstres et trait de talent -> monstres
+    skill_monstres = {}
+    for skill_key, entrees in skill_talents.items():
+        for entree in entrees:
+            for monster_key in talent_monstres.get(entree["talent"], []):
+                skill_monstres.setdefault(skill_key, []).append({
+                    "monstre": monster_key,
+                    "talent": entree["talent"],
+                    "niveau": entree["niveau"]
+                })
+
+    trait_talent_monstres = {}
+    for trait_key, entrees in trait_talents.items():
+        for entree in entrees:
+            for monster_key in talent_monstres.get(entree["talent"], []):
+                trait_talent_monstres.setdefault(trait_key, []).append({
+                    "monstre": monster_key,
+                    "talent": entree["talent"],
+                    "niveaux": entree["niveaux"]
+                })
+
+    return {
+        "talent_monstres": talent_monstres,
+        "skill_talents": skill_talents,
+        "skill_monstres": skill_monstres,
+        "trait_monstres": trait_monstres,
+        "trait_talents": trait_talents,
+        "trait_talent_monstres": trait_talent_monstres,
+        "drops": drops,
+        "synthese": synthese,
+    }
@@ -0,0 +1,99 @@
+"""
+Vérification de l'intégrité référentielle des données.
+
+Chaque clé qui pointe vers un autre jeu de données (talents, compétences, traits,
+objets lâchés, parents de synthèse, familles, résistances, noms de maxstats.json)
+est résolue une seule fois ; les références orphelines sont listées avec leur
+chemin ("monsters.slime.talents[0]") au lieu d'apparaître en clé brute dans l'interface.
+"""
+
+TAILLES = ["small", "large"]
+RARETES = ["normal", "rare"]
+
+
+def _anomalie(verification, chemin, reference, cible):
+    return {"check": verification, "path": chemin, "reference": reference, "target": cible}
+
+
+def _verifier_monstres(donnees, anomalies):
+    monstres = donnees.get("monstres") or {}
+    talents = donnees.get("talents") or {}
+    traits = donnees.get("traits") or {}
+    items = donnees.get("items") or {}
+    familles = donnees.get("families") or {}
+    resistances = donnees.get("resistances") or {}
+
+    for key, monstre in monstres.items():
+        base = f"monsters.{key}"
+        for i, talent_key in enumerate(monstre.get("talents") or []):
+            if talent_key not in talents:
+                anomalies.append(_anomalie("talents", f"{base}.talents[{i}]", talent_key, "talents"))
+
+        for taille in TAILLES:
+            for trait_key in ((monstre.get("traits") or {}).get(taille) or {}):
+                if trait_key not in traits:
+                    anomalies.append(_anomalie("traits", f"{base}.traits.{taille}.{trait_key}", trait_key, "traits"))
+
+        for rarete in RARETES:
+            item_key = (monstre.get("drops") or {}).get(rarete)
+            if item_key and item_key not in items:
+                anomalies.append(_anomalie("drops", f"{base}.drops.{rarete}", item_key, "items"))
+
+        famille = monstre.get("family")
+        if famille and famille not in familles:
+            anomalies.append(_anomalie("families", f"{base}.family", famille, "families"))
+
+        # Un parent de synthèse est un monstre ou une famille ("_slime")
+        for i, recette in enumerate(monstre.get("synthesis") or []):
+            for j, parent in enumerate(recette or []):
+                cible = "families" if str(parent).startswith("_") else "monsters"
+                if parent not in (familles if cible == "families" else monstres):
+                    anomalies.append(_anomalie("synthesis", f"{base}.synthesis[{i}][{j}]", parent, cible))
+
+        for resistance_key in (monstre.get("resistances") or {}):
+            if resistance_key not in resistances:
+                anomalies.append(_anomalie("resistances", f"{base}.resistances.{resistance_key}", resistance_key, "resistances"))
+
+
+def _verifier_talents(donnees, anomalies):
+    skills = donnees.get("skills") or {}
+    traits = donnees.get("traits") or {}
+    for talent_key, talent in (donnees.get("talents") or {}).items():
+        base = f"talents.{talent_key}"
+        for skill_key in (talent.get("skills") or {}):
+            if skill_key not in skills:
+                anomalies.append(_anomalie("skills", f"{base}.skills.{skill_key}", skill_key, "skills"))
+        for trait_key in (talent.get("traits") or {}):
+            if trait_key not in traits:
+                anomalies.append(_anomalie("traits", f"{base}.traits.{trait_key}", trait_key, "traits"))
+
+
+def _verifier_annexes(donnees, anomalies):
+    # maxstats.json est joint aux monstres par nom (insensible à la casse)
+    noms = {(monstre.get("name") or "").lower() for monstre in (donnees.get("monstres") or {}).values()}
+    for i, entree in enumerate(donnees.get("maxstats") or []):
+        if (entree.get("name") or "").lower() not in noms:
+            anomalies.append(_anomalie("maxstats", f"maxstats[{i}].name", entree.get("name"), "monsters"))
+
+    resistances = donnees.get("resistances") or {}
+    affectees = ((donnees.get("large_differences") or {}).get("resistances") or {}).get("affected") or []
+    for i, resistance_key in enumerate(affectees):
+        if resistance_key not in resistances:
+            anomalies.append(_anomalie("resistances", f"largeDifferences.resistances.affected[{i}]",
+                                       resistance_key, "resistances"))
+
+
+def verifier_integrite(donnees):
+    """Liste des références orphelines et décompte par vérification"""
+    anomalies = []
+    _verifier_monstres(donnees, anomalies)
+    _verifier_talents(donnees, anomalies)
+    _verifier_annexes(donnees, anomalies)
+
+    par_verification = {}
+    for anomalie in anomalies:
+        par_verification[anomalie["check"]] = par_verification.get(anomalie["check"], 0) + 1
+    return {
+        "anomalies": anomalies,
+        "summary": {"total": len(anomalies), "by_check": dict(sorted(par_verification.items()))},
+    }
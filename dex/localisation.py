@@ -0,0 +1,67 @@
+"""
+Couche de localisation : noms d'affichage par langue et clés de recherche
+normalisées (minuscules, sans accents ni ponctuation), précalculés au chargement.
+
+Seuls les monstres ont une traduction ("french_name") ; pour les autres jeux de
+données et les monstres sans traduction, le nom anglais sert de repli.
+"""
+
+import re
+import unicodedata
+
+LANGUES = {"fr": "Français", "en": "English"}
+LANGUE_DEFAUT = "fr"
+
+# Jeu de données -> champ contenant le nom traduit, par langue
+CHAMPS_TRADUITS = {
+    "monstres": {"fr": "french_name"},
+    "skills": {},
+    "traits": {},
+    "items": {},
+}
+
+
+def normaliser(texte):
+    """Minuscules sans accents"""
+    texte = unicodedata.normalize("NFKD", texte or "")
+    return "".join(c for c in texte if not unicodedata.combining(c)).lower()
+
+
+def cle_recherche(nom):
+    """Clé de recherche normalisée d'un nom ("Médigluant" -> "medigluant")"""
+    return re.sub(r"[^a-z0-9]+", " ", normaliser(nom)).strip()
+
+
+def construire_localisation(donnees):
+    """Tables des noms par langue et index clé de recherche -> clé"""
+    noms = {langue: {} for langue in LANGUES}
+    cles_noms = {langue: {} for langue in LANGUES}
+    recherche = {}
+    for dataset, champs in CHAMPS_TRADUITS.items():
+        entrees = donnees.get(dataset) or {}
+        for langue in LANGUES:
+            champ = champs.get(langue)
+            noms[langue][dataset] = {
+                key: (entree.get(champ) if champ else None) or entree.get("name", key)
+                for key, entree in entrees.items()
+            }
+            cles_noms[langue][dataset] = {key: cle_recherche(n) for key, n in noms[langue][dataset].items()}
+
+        # Les noms anglais sont prioritaires en cas de collision entre traductions
+        index = {}
+        for langue in ["en"] + [l for l in LANGUES if l != "en"]:
+            for key, cle in cles_noms[langue][dataset].items():
+                index.setdefault(cle, key)
+        recherche[dataset] = index
+
+    return {"noms": noms, "cles_noms": cles_noms, "recherche": recherche}
+
+
+def nom(localisation, langue, dataset, key):
+    """Nom d'affichage d'une entrée dans la langue demandée"""
+    return localisation["noms"].get(langue, localisation["noms"]["en"])[dataset].get(key, key)
+
+
+def trouver_cle(localisation, dataset, texte):
+    """Clé d'une entrée à partir de son nom dans n'importe quelle langue (None si inconnue)"""
+    return localisation["recherche"][dataset].get(cle_recherche(texte))
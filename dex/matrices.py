@@ -0,0 +1,152 @@
+"""
+Matrices colonnaires (NumPy) des statistiques et résistances des monstres.
+
+Chaque monstre occupe une ligne, chaque statistique ou résistance une colonne.
+Les valeurs manquantes sont représentées par NaN. Les résistances effectives en
+grande taille (bonus de largeDifferences.json) sont précalculées dans "res_large".
+"""
+
+import warnings
+
+import numpy as np
+
+# Ordre des colonnes de statistiques (clés de "growth" dans monsters.json)
+STATS = ["hp", "mp", "atk", "def", "agi", "wis"]
+
+# Correspondance avec les clés de maxstats.json et du champ "max_stats"
+MAXSTATS_CLES = {"hp": "hp", "mp": "mp", "atk": "attack", "def": "defense", "agi": "agility", "wis": "wisdom"}
+MAX_STATS_CLES = {"hp": "max_hp", "mp": "max_mp", "atk": "max_atk", "def": "max_def", "agi": "max_agi", "wis": "max_wis"}
+
+
+def _valeur(valeur):
+    """Convertir une valeur JSON en float (NaN si absente)"""
+    return np.nan if valeur is None else float(valeur)
+
+
+def construire_matrices(monstres, resistances_db, maxstats_data, large_differences=None):
+    """Construire les matrices colonnaires et les index clé <-> ligne"""
+    cles = list(monstres.keys())
+    resistances = list(resistances_db.keys())
+    n = len(cles)
+
+    # Jointure par nom avec maxstats.json (source affichée par les pages)
+    maxstats_par_nom = {}
+    for entree in maxstats_data or []:
+        maxstats_par_nom[entree["name"].lower()] = entree["stats"]
+
+    growth = np.full((n, len(STATS)), np.nan)
+    max_stats = np.full((n, len(STATS)), np.nan)
+    res = np.full((n, len(resistances)), np.nan)
+    familles = np.empty(n, dtype=object)
+    rangs = np.empty(n, dtype=object)
+
+    for i, cle in enumerate(cles):
+        monstre = monstres[cle]
+        familles[i] = monstre.get("family")
+        rangs[i] = monstre.get("rank")
+
+        monstre_growth = monstre.get("growth") or {}
+        growth[i] = [_valeur(monstre_growth.get(stat)) for stat in STATS]
+
+        # maxstats.json en priorité, puis le champ "max_stats" du monstre
+        stats_max = maxstats_par_nom.get(monstre.get("name", "").lower())
+        if stats_max:
+            max_stats[i] = [_valeur(stats_max.get(MAXSTATS_CLES[stat])) for stat in STATS]
+        elif monstre.get("max_stats"):
+            max_stats[i] = [_valeur(monstre["max_stats"].get(MAX_STATS_CLES[stat])) for stat in STATS]
+
+        monstre_res = monstre.get("resistances")
+        if monstre_res:
+            res[i] = [_valeur(monstre_res.get(r)) for r in resistances]
+
+    matrices = {
+        "cles": cles,
+        "index": {cle: i for i, cle in enumerate(cles)},
+        "stats": STATS,
+        "stat_index": {stat: j for j, stat in enumerate(STATS)},
+        "resistances": resistances,
+        "resistance_index": {r: j for j, r in enumerate(resistances)},
+        "growth": growth,
+        "max_stats": max_stats,
+        "res": res,
+        "familles": familles,
+        "rangs": rangs,
+    }
+    matrices["res_large"] = resistances_grande_taille(matrices, large_differences)
+    return matrices
+
+
+def resistances_monstre(matrices, cle, grande_taille=False):
+    """Résistances d'un monstre sous forme de dict (None si inconnues)"""
+    i = matrices["index"].get(cle)
+    if i is None:
+        return None
+    valeurs = matrices["res_large" if grande_taille else "res"][i]
+    if np.isnan(valeurs).all():
+        return None
+    return {r: (None if np.isnan(v) else int(v)) for r, v in zip(matrices["resistances"], valeurs)}
+
+
+def tranche(matrices, cles):
+    """Sous-matrices (growth, max_stats, res, res_large) d'une liste de monstres, en une indexation"""
+    lignes = [matrices["index"][cle] for cle in cles]
+    return {nom_matrice: matrices[nom_matrice][lignes] for nom_matrice in ["growth", "max_stats", "res", "res_large"]}
+
+
+def ligne(matrices, nom_matrice, cle):
+    """Obtenir la ligne d'un monstre dans une matrice (None si inconnu)"""
+    i = matrices["index"].get(cle)
+    if i is None:
+        return None
+    return matrices[nom_matrice][i]
+
+
+def colonne(matrices, nom_matrice, nom_colonne):
+    """Obtenir une colonne complète (stat ou résistance) d'une matrice"""
+    if nom_matrice in ("res", "res_large"):
+        j = matrices["resistance_index"][nom_colonne]
+    else:
+        j = matrices["stat_index"][nom_colonne]
+    return matrices[nom_matrice][:, j]
+
+
+def classer(valeurs, n=None, masque=None, decroissant=True):
+    """Indices des lignes triées par valeur (NaN en dernier), filtrées par un masque booléen"""
+    valeurs = np.asarray(valeurs, dtype=float)
+    lignes = np.arange(len(valeurs)) if masque is None else np.flatnonzero(masque)
+    sous_valeurs = valeurs[lignes]
+    cle_tri = -sous_valeurs if decroissant else sous_valeurs
+    cle_tri = np.where(np.isnan(cle_tri), np.inf, cle_tri)
+    ordre = lignes[np.argsort(cle_tri, kind="stable")]
+    return ordre if n is None else ordre[:n]
+
+
+def resume(matrices, nom_matrice, masque=None):
+    """Statistiques agrégées (moyenne, min, max, écart-type) par colonne"""
+    m = matrices[nom_matrice]
+    if masque is not None:
+        m = m[masque]
+    colonnes = matrices["resistances"] if nom_matrice in ("res", "res_large") else matrices["stats"]
+    if len(m) == 0:
+        m = np.full((1, len(colonnes)), np.nan)
+    # Colonnes entièrement vides : NaN sans avertissement
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        moyennes = np.nanmean(m, axis=0)
+        minimums = np.nanmin(m, axis=0)
+        maximums = np.nanmax(m, axis=0)
+        ecarts = np.nanstd(m, axis=0)
+    return {
+        c: {"moyenne": moyennes[j], "min": minimums[j], "max": maximums[j], "ecart_type": ecarts[j]}
+        for j, c in enumerate(colonnes)
+    }
+
+
+def resistances_grande_taille(matrices, large_differences):
+    """Matrice des résistances effectives en grande taille (bonus de largeDifferences.json)"""
+    res = matrices["res"].copy()
+    regle = (large_differences or {}).get("resistances") or {}
+    colonnes = [matrices["resistance_index"][r] for r in regle.get("affected", []) if r in matrices["resistance_index"]]
+    if colonnes:
+        res[:, colonnes] += regle.get("bonus", 0)
+    return res
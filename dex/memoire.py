@@ -0,0 +1,162 @@
+"""
+Empreinte mémoire : taille profonde des jeux de données, entrées des caches
+Streamlit, état des sessions, estimation des images décodées et sites
+d'allocation (tracemalloc) pendant un rendu.
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+# Types dont sys.getsizeof donne déjà la taille complète
+_ATOMIQUES = (str, bytes, bytearray, int, float, bool, complex, type(None))
+
+
+def taille_profonde(objet, vus=None):
+    """Taille en octets d'un objet et de tout ce qu'il référence (objets partagés comptés une fois)"""
+    if vus is None:
+        vus = set()
+    pile = [objet]
+    total = 0
+    while pile:
+        courant = pile.pop()
+        if id(courant) in vus:
+            continue
+        vus.add(id(courant))
+        if isinstance(courant, _ATOMIQUES):
+            total += sys.getsizeof(courant)
+        elif hasattr(courant, "memory_usage") and hasattr(courant, "index"):
+            # DataFrame ou Series pandas (contenu des colonnes object compris)
+            usage = courant.memory_usage(deep=True)
+            total += int(usage.sum() if hasattr(usage, "sum") else usage)
+        elif hasattr(courant, "nbytes") and hasattr(courant, "dtype"):
+            # Tableau NumPy : en-tête et buffer (les tableaux object référencent d'autres objets)
+            total += sys.getsizeof(courant) + (0 if getattr(courant, "base", None) is not None else courant.nbytes)
+            if courant.dtype == object:
+                pile.extend(courant.ravel().tolist())
+        elif hasattr(courant, "getbands") and hasattr(courant, "size"):
+            # Image PIL : taille décodée
+            total += sys.getsizeof(courant) + courant.width * courant.height * len(courant.getbands())
+        elif hasattr(courant, "nbytes") and hasattr(courant, "schema"):
+            # Table Arrow (éventuellement mappée en mémoire)
+            total += courant.nbytes
+        elif isinstance(courant, dict):
+            total += sys.getsizeof(courant)
+            pile.extend(courant.keys())
+            pile.extend(courant.values())
+        elif isinstance(courant, (list, tuple, set, frozenset)):
+            total += sys.getsizeof(courant)
+            pile.extend(courant)
+        else:
+            total += sys.getsizeof(courant)
+            if hasattr(courant, "__dict__"):
+                pile.append(courant.__dict__)
+    return total
+
+
+def tailles_donnees(donnees):
+    """Taille profonde de chaque entrée de `donnees`, et total sans double comptage"""
+    tailles = {nom: taille_profonde(valeur) for nom, valeur in donnees.items()}
+    return {
+        "datasets": dict(sorted(tailles.items(), key=lambda item: -item[1])),
+        "total": taille_profonde(donnees),
+    }
+
+
+def tailles_caches():
+    """Entrées des caches Streamlit (st.cache_data / st.cache_resource) du processus"""
+    try:
+        from streamlit.runtime.caching import get_data_cache_stats_provider, get_resource_cache_stats_provider
+    except ImportError:
+        return []
+    entrees = {}
+    for fournisseur in [get_data_cache_stats_provider(), get_resource_cache_stats_provider()]:
+        # Les fournisseurs regroupent les entrées par fonction : on lit chaque cache quand c'est possible
+        caches = getattr(fournisseur, "_function_caches", None)
+        sources = [cache for par_cle in caches.values() for cache in par_cle.values()] if caches else [fournisseur]
+        for source in sources:
+            for stats in source.get_stats().values():
+                for stat in stats:
+                    entrees.setdefault((stat.category_name, stat.cache_name), []).append(stat.byte_length)
+    return sorted(
+        ({"category": categorie, "cache": nom, "entries": len(tailles), "bytes": sum(tailles), "largest": max(tailles)}
+         for (categorie, nom), tailles in entrees.items()),
+        key=lambda entree: -entree["bytes"],
+    )
+
+
+def tailles_sessions():
+    """Taille de l'état de chaque session active (serveur Streamlit en cours d'exécution)"""
+    try:
+        from streamlit.runtime import Runtime
+    except ImportError:
+        return []
+    if not Runtime.exists():
+        return []
+    sessions = {}
+    for stats in Runtime.instance().stats_mgr.get_stats().values():
+        for stat in stats:
+            if stat.category_name == "st_session_state":
+                sessions[stat.cache_name] = sessions.get(stat.cache_name, 0) + stat.byte_length
+    return sorted(({"session": session, "bytes": octets} for session, octets in sessions.items()),
+                  key=lambda entree: -entree["bytes"])
+
+
+def taille_images(dossier, extensions=(".jpg", ".jpeg", ".png")):
+    """Taille décodée (largeur x hauteur x canaux) des images d'un dossier, lue dans les en-têtes"""
+    from PIL import Image
+
+    total, nb = 0, 0
+    for fichier in sorted(os.listdir(dossier)) if os.path.isdir(dossier) else []:
+        if not fichier.lower().endswith(extensions):
+            continue
+        with Image.open(os.path.join(dossier, fichier)) as image:
+            total += image.width * image.height * len(image.getbands())
+        nb += 1
+    return {"images": nb, "decoded_bytes": total, "mean_bytes": total // nb if nb else 0}
+
+
+def demarrer_suivi():
+    """Démarrer tracemalloc (s'il ne l'est pas déjà) et renvoyer un instantané de départ"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    return tracemalloc.take_snapshot()
+
+
+def _site(frame):
+    """Emplacement court : relatif au projet ou au dossier site-packages"""
+    chemin = frame.filename
+    if "site-packages" + os.sep in chemin:
+        chemin = chemin.split("site-packages" + os.sep, 1)[1]
+    elif os.path.isabs(chemin) and chemin.startswith(os.getcwd() + os.sep):
+        chemin = os.path.relpath(chemin)
+    return f"{chemin}:{frame.lineno}"
+
+
+def sites_allocation(depart, n=15, arreter=True):
+    """Sites qui ont le plus alloué depuis l'instantané `depart` (et pic pendant l'intervalle)"""
+    gc.collect()
+    arrivee = tracemalloc.take_snapshot()
+    pic = tracemalloc.get_traced_memory()[1]
+    if arreter:
+        tracemalloc.stop()
+    filtres = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+    differences = arrivee.filter_traces(filtres).compare_to(depart.filter_traces(filtres), "lineno")
+    return {
+        "peak_bytes": pic,
+        "top": [
+            {"site": _site(d.traceback[0]), "bytes": d.size_diff, "count": d.count_diff}
+            for d in sorted(differences, key=lambda d: -d.size_diff)[:n]
+        ],
+    }
+
+
+def formater_octets(octets):
+    """Taille lisible ("12.3 Mio")"""
+    for unite in ["o", "Kio", "Mio"]:
+        if abs(octets) < 1024:
+            return f"{octets:.0f} {unite}" if unite == "o" else f"{octets:.1f} {unite}"
+        octets /= 1024
+    return f"{octets:.1f} Gio"
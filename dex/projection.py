@@ -0,0 +1,51 @@
+"""
+Projection vectorisée des statistiques des monstres selon le niveau.
+
+Le champ "growth" est une note de 0 à 5 par statistique : plus elle est élevée,
+plus la statistique approche tôt de son maximum. La courbe estimée est
+
+    stat(niveau) = max * (BASE + (1 - BASE) * p ** (3 / (1 + growth)))
+
+avec p = (niveau - 1) / (NIVEAU_MAX - 1). Une note de 2 donne une progression
+linéaire, 5 une progression rapide en début de partie, 0 une progression tardive.
+Le résultat est toujours plafonné par les stats maximales.
+"""
+
+import numpy as np
+
+NIVEAU_MAX = 100
+
+# Part de la stat maximale atteinte au niveau 1
+BASE = 0.05
+
+
+def exposants(matrices):
+    """Exposants de la courbe de progression (matrice n x 6, NaN si growth inconnu)"""
+    return 3.0 / (1.0 + matrices["growth"])
+
+
+def projeter_stats(matrices, niveau, exposants_courbe=None):
+    """Stats projetées de tous les monstres au niveau donné (matrice n x 6)"""
+    if exposants_courbe is None:
+        exposants_courbe = exposants(matrices)
+    niveau = min(max(int(niveau), 1), NIVEAU_MAX)
+    progression = (niveau - 1) / (NIVEAU_MAX - 1)
+    max_stats = matrices["max_stats"]
+    stats = max_stats * (BASE + (1.0 - BASE) * progression ** exposants_courbe)
+    return np.minimum(np.floor(stats), max_stats)
+
+
+def classement(matrices, niveau, stat, n=20, masque=None, exposants_courbe=None):
+    """Top n des monstres pour une stat projetée : liste de (clé, valeur)"""
+    j = matrices["stat_index"][stat]
+    valeurs = projeter_stats(matrices, niveau, exposants_courbe)[:, j]
+    # Growth inconnu : au niveau 100, p ** NaN vaut 1 et la stat serait projetée quand même
+    valides = ~np.isnan(valeurs) & ~np.isnan(matrices["growth"][:, j])
+    if masque is not None:
+        valides &= masque
+    lignes = np.flatnonzero(valides)
+    if n is not None and n < len(lignes):
+        # Sélection partielle puis tri des n meilleurs seulement
+        lignes = lignes[np.argpartition(-valeurs[lignes], n - 1)[:n]]
+    lignes = lignes[np.argsort(-valeurs[lignes], kind="stable")]
+    return [(matrices["cles"][i], valeurs[i]) for i in lignes]
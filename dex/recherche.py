@@ -0,0 +1,127 @@
+"""
+Recherche plein texte : index inversé avec classement BM25.
+
+L'index couvre les noms et descriptions des compétences, traits, objets et
+monstres. Les poids BM25 de chaque couple (terme, document) sont calculés une
+seule fois à la construction ; une requête se réduit à sommer quelques tableaux.
+Le dernier terme de la requête est traité comme un préfixe pour la recherche
+pendant la saisie.
+"""
+
+import bisect
+import heapq
+import re
+
+import numpy as np
+
+from dex.localisation import normaliser
+
+# Paramètres BM25 classiques
+K1 = 1.2
+B = 0.75
+
+# Le nom compte autant que plusieurs occurrences dans la description
+POIDS_NOM = 3
+
+MOTS_VIDES = {"a", "an", "and", "the", "of", "to", "in", "on", "for", "with", "by", "is", "it", "its", "be", "or", "at", "as"}
+
+# Nombre maximal de termes du vocabulaire couverts par un préfixe (les plus fréquents)
+MAX_EXPANSION_PREFIXE = 50
+
+
+def tokeniser(texte):
+    """Découper un texte en termes normalisés (mots vides exclus)"""
+    return [t for t in re.findall(r"[a-z0-9]+", normaliser(texte)) if t not in MOTS_VIDES]
+
+
+def _documents(donnees):
+    """Documents à indexer : (type, clé, nom, description)"""
+    sources = [
+        ("monstre", donnees.get("monstres", {})),
+        ("skill", donnees.get("skills", {})),
+        ("trait", donnees.get("traits", {})),
+        ("objet", donnees.get("items", {})),
+    ]
+    for type_doc, entrees in sources:
+        for key, entree in entrees.items():
+            yield type_doc, key, entree.get("name", key), entree.get("description") or ""
+
+
+def construire_index_recherche(donnees):
+    """Construire l'index inversé BM25 sur les noms et descriptions"""
+    docs = []
+    frequences = {}  # terme -> {doc_id: tf}
+    longueurs = []
+    for doc_id, (type_doc, key, nom, description) in enumerate(_documents(donnees)):
+        docs.append({"type": type_doc, "key": key, "name": nom})
+        termes = tokeniser(nom) * POIDS_NOM + tokeniser(description)
+        longueurs.append(len(termes))
+        for terme in termes:
+            postings = frequences.setdefault(terme, {})
+            postings[doc_id] = postings.get(doc_id, 0) + 1
+
+    n = len(docs)
+    longueurs = np.asarray(longueurs, dtype=float)
+    moyenne = longueurs.mean() if n else 0.0
+    normalisation = K1 * (1 - B + B * longueurs / moyenne) if n else longueurs
+
+    postings = {}
+    for terme, par_doc in frequences.items():
+        doc_ids = np.fromiter(par_doc.keys(), dtype=np.int32, count=len(par_doc))
+        tf = np.fromiter(par_doc.values(), dtype=float, count=len(par_doc))
+        idf = np.log(1 + (n - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+        postings[terme] = (doc_ids, idf * tf * (K1 + 1) / (tf + normalisation[doc_ids]))
+
+    return {
+        "docs": docs,
+        "postings": postings,
+        "vocabulaire": sorted(postings),
+    }
+
+
+def _termes_prefixe(index, prefixe):
+    """Termes du vocabulaire commençant par le préfixe (les plus fréquents si trop nombreux)"""
+    vocabulaire = index["vocabulaire"]
+    debut = bisect.bisect_left(vocabulaire, prefixe)
+    # Termes en [a-z0-9] : "{" suit "z", la plage du préfixe s'arrête avant prefixe + "{"
+    fin = bisect.bisect_left(vocabulaire, prefixe + "{", debut)
+    termes = vocabulaire[debut:fin]
+    if len(termes) > MAX_EXPANSION_PREFIXE:
+        # Classement par nombre de documents (et non par ordre alphabétique) avant troncature
+        termes = heapq.nlargest(MAX_EXPANSION_PREFIXE, termes, key=lambda terme: len(index["postings"][terme][0]))
+    return termes
+
+
+def rechercher(index, requete, n=20, types=None):
+    """Documents les plus pertinents : liste de dicts (type, key, name, score)"""
+    termes = tokeniser(requete)
+    if not termes or not index["docs"]:
+        return []
+
+    scores = np.zeros(len(index["docs"]))
+    for terme in termes[:-1]:
+        if terme in index["postings"]:
+            doc_ids, poids = index["postings"][terme]
+            scores[doc_ids] += poids
+
+    # Dernier terme : correspondance exacte ou, à défaut, par préfixe
+    dernier = termes[-1]
+    extensions = [dernier] if dernier in index["postings"] else _termes_prefixe(index, dernier)
+    if extensions:
+        # Un document ne compte que la meilleure extension du préfixe,
+        # pondérée par la part du terme déjà saisie
+        meilleur = np.zeros(len(index["docs"]))
+        for terme in extensions:
+            doc_ids, poids = index["postings"][terme]
+            meilleur[doc_ids] = np.maximum(meilleur[doc_ids], poids * len(dernier) / len(terme))
+        scores += meilleur
+
+    if types is not None:
+        masque = np.array([doc["type"] in types for doc in index["docs"]])
+        scores[~masque] = 0.0
+
+    candidats = np.flatnonzero(scores > 0)
+    if n is not None and n < len(candidats):
+        candidats = candidats[np.argpartition(-scores[candidats], n - 1)[:n]]
+    candidats = candidats[np.argsort(-scores[candidats], kind="stable")]
+    return [{**index["docs"][i], "score": float(scores[i])} for i in candidats]
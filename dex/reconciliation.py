@@ -0,0 +1,194 @@
+"""
+Rapprochement des entités de monster2.json avec les monstres de monsters.json.
+
+Les entrées de monster2.json sont indexées une seule fois par nom, identifiant,
+numéro et MonsterId (clés normalisées, sans accents ni ponctuation) ainsi que par
+trigrammes de caractères pour les noms approchants ("Robin 'ood" / "Robbin' 'Ood").
+Chaque paire candidate reçoit un score ; l'appariement un-à-un retient les paires
+de meilleur score en premier. Le résultat (crosswalk clé -> MonsterId) est
+persisté avec l'empreinte de monster2.json pour que les imports suivants fassent
+une simple jointure tant que la source n'a pas changé.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+from dex.localisation import normaliser
+
+FICHIER_CROSSWALK = "data/crosswalk.json"
+
+# Score de chaque indice de correspondance
+SCORE_NOM = 1.0
+SCORE_IDENTIFIANT = 0.95
+SCORE_NOM_FRANCAIS = 0.9
+SCORE_NUMERO = 0.5
+# Poids de la similarité par trigrammes (coefficient de Dice entre 0 et 1)
+POIDS_TRIGRAMMES = 0.9
+# Bonus par indice supplémentaire concordant
+BONUS_CORROBORATION = 0.02
+
+SEUIL_TRIGRAMMES = 0.6
+SEUIL_ACCEPTATION = 0.5
+# En dessous de ce score, la correspondance est signalée comme incertaine
+SEUIL_CONFIANCE = 0.9
+
+
+def cle_normalisee(texte):
+    """Clé compacte insensible à la casse, aux accents et à la ponctuation ("Hades' Condor" -> "hadescondor")"""
+    return re.sub(r"[^a-z0-9]+", "", normaliser(str(texte or "")))
+
+
+def trigrammes(cle):
+    """Ensemble des trigrammes d'une clé normalisée (avec bornes)"""
+    cle = f"^{cle}$"
+    return {cle[i:i + 3] for i in range(len(cle) - 2)}
+
+
+def similarite(a, b):
+    """Coefficient de Dice entre deux ensembles de trigrammes"""
+    if not a or not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+
+def empreinte_source(monster2):
+    """Empreinte du contenu de monster2.json (indépendante de la mise en forme du fichier)"""
+    contenu = json.dumps(monster2, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(contenu.encode("utf-8")).hexdigest()
+
+
+def indexer_monster2(monster2):
+    """Index de monster2.json par clé normalisée, numéro, MonsterId et trigramme"""
+    index = {"nom": {}, "identifiant": {}, "nom_francais": {}, "numero": {}, "monster_id": {}, "trigrammes": {}, "grammes": {}}
+    for entree in monster2:
+        monster_id = entree.get("MonsterId")
+        if monster_id is None:
+            continue
+        index["monster_id"][monster_id] = entree
+        for champ, source in [("nom", "Name"), ("identifiant", "Identifier"), ("nom_francais", "FrenchName")]:
+            cle = cle_normalisee(entree.get(source))
+            if cle:
+                index[champ].setdefault(cle, []).append(monster_id)
+        if entree.get("Number") is not None:
+            index["numero"].setdefault(entree["Number"], []).append(monster_id)
+        grammes = trigrammes(cle_normalisee(entree.get("Name")))
+        index["grammes"][monster_id] = grammes
+        for gramme in grammes:
+            index["trigrammes"].setdefault(gramme, set()).add(monster_id)
+    return index
+
+
+def _candidats_approches(index, grammes):
+    """MonsterId partageant assez de trigrammes pour dépasser le seuil de similarité"""
+    communs = {}
+    for gramme in grammes:
+        for monster_id in index["trigrammes"].get(gramme, ()):
+            communs[monster_id] = communs.get(monster_id, 0) + 1
+    # Dice >= seuil implique un nombre minimal de trigrammes communs
+    minimum = SEUIL_TRIGRAMMES * len(grammes) / 2
+    return [monster_id for monster_id, nb in communs.items() if nb >= minimum]
+
+
+def scorer_candidats(key, monstre, index):
+    """Candidats d'un monstre : MonsterId -> (score, méthode principale)
+
+    Le score n'est pas plafonné à 1 pour départager les doublons de nom par les
+    indices concordants (identifiant, numéro...) ; il l'est dans le crosswalk.
+    """
+    indices = {}
+    cles = [
+        ("nom", cle_normalisee(monstre.get("name")), SCORE_NOM),
+        ("identifiant", cle_normalisee(key), SCORE_IDENTIFIANT),
+        ("nom_francais", cle_normalisee(monstre.get("french_name")), SCORE_NOM_FRANCAIS),
+    ]
+    for champ, cle, score in cles:
+        for monster_id in index[champ].get(cle, ()) if cle else ():
+            indices.setdefault(monster_id, {})[champ] = score
+    for monster_id in index["numero"].get(monstre.get("number"), ()):
+        indices.setdefault(monster_id, {})["numero"] = SCORE_NUMERO
+    grammes = trigrammes(cle_normalisee(monstre.get("name")))
+    for monster_id in _candidats_approches(index, grammes):
+        dice = similarite(grammes, index["grammes"][monster_id])
+        if dice >= SEUIL_TRIGRAMMES and dice < 1:
+            indices.setdefault(monster_id, {})["trigrammes"] = round(POIDS_TRIGRAMMES * dice, 4)
+
+    candidats = {}
+    for monster_id, concordances in indices.items():
+        methode = max(concordances, key=concordances.get)
+        score = concordances[methode] + BONUS_CORROBORATION * (len(concordances) - 1)
+        candidats[monster_id] = (round(score, 4), methode)
+    return candidats
+
+
+def reconcilier(monsters, monster2):
+    """Appariement un-à-un monstres -> entrées de monster2.json, par score décroissant"""
+    index = indexer_monster2(monster2)
+    paires = []
+    for key, monstre in monsters.items():
+        for monster_id, (score, methode) in scorer_candidats(key, monstre, index).items():
+            if score >= SEUIL_ACCEPTATION:
+                paires.append((-score, key, monster_id, methode))
+    paires.sort()
+
+    crosswalk = {}
+    attribues = set()
+    for score, key, monster_id, methode in paires:
+        if key in crosswalk or monster_id in attribues:
+            continue
+        entree = index["monster_id"][monster_id]
+        crosswalk[key] = {
+            "monster_id": monster_id,
+            "identifier": entree.get("Identifier"),
+            "number": entree.get("Number"),
+            "score": min(-score, 1.0),
+            "method": methode,
+        }
+        attribues.add(monster_id)
+
+    non_apparies = [key for key in monsters if key not in crosswalk]
+    incertains = sorted(key for key, lien in crosswalk.items() if lien["score"] < SEUIL_CONFIANCE)
+    return {
+        "crosswalk": dict(sorted(crosswalk.items())),
+        "unmatched": non_apparies,
+        "uncertain": incertains,
+        "source_sha1": empreinte_source(monster2),
+        "summary": {
+            "monsters": len(monsters),
+            "sources": len(monster2),
+            "matched": len(crosswalk),
+            "unmatched": len(non_apparies),
+            "uncertain": len(incertains),
+        },
+    }
+
+
+def charger_crosswalk(chemin=FICHIER_CROSSWALK):
+    """Résultat de rapprochement persisté (None s'il n'existe pas encore)"""
+    if not os.path.exists(chemin):
+        return None
+    with open(chemin, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def a_jour(rapprochement, monsters, monster2):
+    """Le rapprochement persisté porte-t-il sur ce monster2.json et couvre-t-il encore tous les monstres ?"""
+    if not rapprochement or rapprochement.get("source_sha1") != empreinte_source(monster2):
+        return False
+    connus = set(rapprochement.get("crosswalk", {})) | set(rapprochement.get("unmatched", []))
+    return set(monsters) <= connus
+
+
+def rapprochement_courant(monsters, monster2, chemin=FICHIER_CROSSWALK):
+    """Rapprochement persisté s'il est à jour, sinon recalculé en mémoire"""
+    rapprochement = charger_crosswalk(chemin)
+    if a_jour(rapprochement, monsters, monster2):
+        return rapprochement
+    return reconcilier(monsters, monster2)
+
+
+def joindre(crosswalk, monster2):
+    """Jointure directe clé de monstre -> entrée de monster2.json via le crosswalk"""
+    par_id = {entree.get("MonsterId"): entree for entree in monster2}
+    return {key: par_id[lien["monster_id"]] for key, lien in crosswalk.items() if lien["monster_id"] in par_id}
@@ -0,0 +1,479 @@
+"""
+Export statique du guide : une page HTML par monstre, par plan de synthèse et par
+objet, la table des monstres et les index, avec des images redimensionnées (WebP).
+
+Le rendu est réparti entre les processus d'un pool : chaque processus charge les
+données une seule fois (initialiseur), puis rend et écrit des lots de pages. Les
+images déjà converties et plus récentes que leur source ne sont pas refaites.
+Le dossier produit se sert depuis n'importe quel serveur de fichiers statiques.
+"""
+
+import html
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import quote
+
+from PIL import Image
+
+from dex.localisation import LANGUE_DEFAUT, nom
+from dex.matrices import STATS, resistances_monstre
+from dex.sources import DOSSIER_DONNEES, FICHIERS, charger_sources, construire_donnees, dependances
+from dex.synthese import etapes_synthese, get_synthesis_tree
+from dex.voisins import monstres_similaires
+# Mêmes extractions que les pages Streamlit
+from page.objets import chemin_image_monstre
+from page.recherche_monstres import get_maxstats, get_skills, get_traits_info
+
+DOSSIER_SITE = "site"
+TAILLE_IMAGE = 256
+TAILLE_VIGNETTE = 96
+# Fichiers WebP écrits par image de monstre : dossier de sortie -> taille maximale
+FORMATS_IMAGES = {"monstres": TAILLE_IMAGE, "vignettes": TAILLE_VIGNETTE}
+QUALITE = 80
+TAILLE_LOT = 32
+
+# Jeux de données utilisés par les pages exportées
+DONNEES = ("monstres", "families", "maxstats", "talents", "skills", "traits", "resistances", "items",
+           "matrices", "localisation", "voisins", "index", "catalogue")
+
+# Icônes copiées telles quelles (déjà petites)
+DOSSIERS_ICONES = ["FamilyIcons", "RankIcons", "ResistanceIcons"]
+
+LIBELLES_STATS = {"hp": "HP", "mp": "MP", "atk": "ATK", "def": "DEF", "agi": "AGI", "wis": "WIS"}
+CLES_MAXSTATS = {"hp": "hp", "mp": "mp", "atk": "attack", "def": "defense", "agi": "agility", "wis": "wisdom"}
+TYPES_COMPETENCES = {"Attack": "Attaque", "Healing": "Soin", "Status": "Statut"}
+ICONES_RESISTANCES = {"instant_death": "death"}
+
+STYLE = """
+body { font-family: system-ui, sans-serif; max-width: 1100px; margin: 0 auto; padding: 1rem; color: #222; }
+nav a { margin-right: 1rem; }
+img { vertical-align: middle; }
+table { border-collapse: collapse; margin: .5rem 0; }
+th, td { border: 1px solid #ccc; padding: .25rem .5rem; text-align: left; }
+.entete { display: flex; gap: 1.5rem; align-items: flex-start; }
+.grille { display: flex; flex-wrap: wrap; gap: 1rem; }
+.grille figure { margin: 0; text-align: center; width: 110px; }
+.positif { color: #2e7d32; font-weight: bold; }
+.negatif { color: #c62828; font-weight: bold; }
+.etape { border-bottom: 1px solid #ddd; padding: .5rem 0; display: flex; gap: 1rem; align-items: center; }
+"""
+
+# Filtre de la table des monstres (pas de serveur : filtrage dans le navigateur)
+SCRIPT_FILTRE = """
+document.getElementById("filtre").addEventListener("input", function () {
+  var texte = this.value.toLowerCase();
+  document.querySelectorAll("#monstres tbody tr").forEach(function (ligne) {
+    ligne.hidden = ligne.textContent.toLowerCase().indexOf(texte) < 0;
+  });
+});
+"""
+
+# Données du processus (chargées par l'initialiseur du pool)
+_etat = {}
+
+
+def e(texte):
+    """Échapper un texte pour le HTML"""
+    return html.escape(str(texte if texte is not None else ""))
+
+
+def lien(chemin):
+    """Chemin relatif encodé pour un attribut href/src"""
+    return quote(chemin)
+
+
+def gabarit(titre, corps, racine="../"):
+    """Document HTML complet avec la feuille de style et la navigation du site"""
+    return f"""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{e(titre)} - DQM Guide</title>
+<link rel="stylesheet" href="{racine}style.css">
+</head>
+<body>
+<nav><a href="{racine}index.html">Accueil</a><a href="{racine}monstres/index.html">Monstres</a><a href="{racine}base.html">Base de données</a><a href="{racine}objets/index.html">Objets</a></nav>
+<h1>{e(titre)}</h1>
+{corps}
+</body>
+</html>
+"""
+
+
+def nom_monstre(key):
+    return nom(_etat["donnees"]["localisation"], _etat["langue"], "monstres", key)
+
+
+def image_monstre(key, racine="../", vignette=False, largeur=None):
+    """Balise <img> d'un monstre ("" si pas d'image)"""
+    if key not in _etat["images"]:
+        return ""
+    dossier = "vignettes" if vignette else "monstres"
+    largeur = largeur or (TAILLE_VIGNETTE if vignette else TAILLE_IMAGE)
+    return (f'<img src="{racine}images/{dossier}/{lien(key)}.webp" width="{largeur}" '
+            f'alt="{e(nom_monstre(key))}" loading="lazy">')
+
+
+def icone(dossier, fichier, texte, largeur=32, racine="../"):
+    """Balise <img> d'une icône copiée ("" si absente)"""
+    if not os.path.exists(os.path.join(_etat["dossier_donnees"], dossier, fichier)):
+        return ""
+    return f'<img src="{racine}images/{dossier}/{lien(fichier)}" width="{largeur}" alt="{e(texte)}" title="{e(texte)}">'
+
+
+def lien_monstre(key, racine="../"):
+    return f'<a href="{racine}monstres/{lien(key)}.html">{e(nom_monstre(key))}</a>'
+
+
+def lien_objet(item_key, racine="../"):
+    items = _etat["donnees"]["items"]
+    if item_key not in items:
+        return e(item_key)
+    return f'<a href="{racine}objets/{lien(item_key)}.html">{e(items[item_key].get("name", item_key))}</a>'
+
+
+def tableau(entetes, lignes, attributs=""):
+    """Table HTML (cellules déjà échappées)"""
+    tete = "".join(f"<th>{entete}</th>" for entete in entetes)
+    corps = "".join("<tr>" + "".join(f"<td>{cellule}</td>" for cellule in ligne) + "</tr>\n" for ligne in lignes)
+    return f"<table{attributs}><thead><tr>{tete}</tr></thead><tbody>\n{corps}</tbody></table>"
+
+
+def nom_parent(parent_key):
+    """Parent de synthèse : lien vers le monstre, ou nom de la famille"""
+    if parent_key.startswith("_"):
+        famille = _etat["donnees"]["families"].get(parent_key, {}).get("name", parent_key)
+        return f"{e(famille)} (famille)"
+    if parent_key in _etat["donnees"]["monstres"]:
+        return lien_monstre(parent_key)
+    return e(parent_key)
+
+
+def page_monstre(key):
+    """Fiche complète d'un monstre"""
+    donnees = _etat["donnees"]
+    monstre = donnees["monstres"][key]
+    famille_key = monstre.get("family") or ""
+    famille = donnees["families"].get(famille_key, {}).get("name", "Inconnue")
+    rang = monstre.get("rank") or "?"
+    sections = []
+
+    infos = [
+        f"<p><b>Numéro :</b> {e(monstre.get('number', '?'))}</p>",
+        f"<p><b>Rang :</b> {icone('RankIcons', f'{rang}.png', rang)} {e(rang)}</p>",
+        f"<p><b>Famille :</b> {icone('FamilyIcons', famille_key.replace('_', '') + '.png', famille)} {e(famille)}</p>",
+    ]
+    if monstre.get("description"):
+        infos.append(f"<p>{e(monstre['description'])}</p>")
+    if monstre.get("synthesis"):
+        infos.append(f'<p><a href="../synthese/{lien(key)}.html">Plan de synthèse complet</a></p>')
+    sections.append(f'<div class="entete">{image_monstre(key)}<div>{"".join(infos)}</div></div>')
+
+    maxstats = get_maxstats(monstre.get("name", ""), donnees["maxstats"])
+    growth = monstre.get("growth")
+    sections.append("<h2>Statistiques</h2>")
+    lignes = []
+    if maxstats:
+        lignes.append(["Maximum"] + [e(maxstats.get(CLES_MAXSTATS[stat], "?")) for stat in STATS])
+    if growth:
+        lignes.append(["Gain par niveau"] + [e(growth.get(stat, "?")) for stat in STATS])
+    sections.append(tableau([""] + [LIBELLES_STATS[stat] for stat in STATS], lignes) if lignes
+                    else "<p>Statistiques non disponibles</p>")
+
+    sections.append("<h2>Talents et compétences</h2>")
+    talents = get_skills(monstre, donnees["talents"], donnees["skills"])
+    for talent in talents:
+        competences = "".join(
+            f"<li><b>{e(skill['name'])}</b> (Niveau {e(skill['level'])}, MP : {e(skill['mp_cost'])}) "
+            f"<code>{e(TYPES_COMPETENCES.get(skill['type'], skill['type']))}</code><br>{e(skill['description'])}</li>"
+            for skill in talent["skills"]
+        )
+        sections.append(f"<details><summary>{e(talent['name'])}</summary><ul>{competences}</ul></details>")
+    if not talents:
+        sections.append("<p>Aucun talent disponible</p>")
+
+    sections.append("<h2>Traits</h2>")
+    traits = get_traits_info(monstre, donnees["traits"])
+    for taille, titre in [("small", "Petite taille"), ("large", "Grande taille")]:
+        elements = "".join(f"<li><b>{e(trait['name'])}</b> (Niv. {e(trait['level'])}) : {e(trait['description'])}</li>"
+                           for trait in traits[taille])
+        sections.append(f"<h3>{titre}</h3>" + (f"<ul>{elements}</ul>" if elements else "<p>Aucun trait</p>"))
+
+    sections.append("<h2>Résistances</h2>")
+    petite = resistances_monstre(donnees["matrices"], key)
+    grande = resistances_monstre(donnees["matrices"], key, grande_taille=True)
+    if petite is not None:
+        lignes = []
+        for resistance_key, valeur in petite.items():
+            nom_resistance = donnees["resistances"].get(resistance_key, {}).get("name", resistance_key)
+            fichier = ICONES_RESISTANCES.get(resistance_key, resistance_key) + ".png"
+            lignes.append([f"{icone('ResistanceIcons', fichier, nom_resistance, 24)} {e(nom_resistance)}",
+                           _valeur_resistance(valeur), _valeur_resistance(grande[resistance_key])])
+        sections.append(tableau(["Résistance", "Petite", "Grande"], lignes))
+    else:
+        sections.append("<p>Données de résistances non disponibles</p>")
+
+    sections.append("<h2>Drops</h2>")
+    drops = monstre.get("drops") or {}
+    sections.append(f"<p><b>Normal :</b> {lien_objet(drops['normal']) if drops.get('normal') else 'Aucun'}<br>"
+                    f"<b>Rare :</b> {lien_objet(drops['rare']) if drops.get('rare') else 'Aucun'}</p>")
+
+    sections.append("<h2>Synthèse</h2>")
+    combinaisons = [" + ".join(nom_parent(parent) for parent in combinaison)
+                    for combinaison in monstre.get("synthesis") or [] if isinstance(combinaison, list)]
+    sections.append("<ul>" + "".join(f"<li>{c}</li>" for c in combinaisons) + "</ul>" if combinaisons
+                    else "<p>Aucune synthèse disponible</p>")
+
+    sections.append("<h2>Monstres similaires</h2>")
+    similaires = monstres_similaires(donnees["voisins"], donnees["matrices"], key, k=5)
+    sections.append('<div class="grille">' + "".join(
+        f"<figure>{image_monstre(s, vignette=True)}<figcaption>{lien_monstre(s)}<br>{similarite:.0%}</figcaption></figure>"
+        for s, similarite in similaires) + "</div>")
+
+    return gabarit(nom_monstre(key), "\n".join(sections))
+
+
+def _valeur_resistance(valeur):
+    if valeur is None:
+        return "?"
+    classe = "positif" if valeur > 0 else "negatif" if valeur < 0 else ""
+    return f'<span class="{classe}">{"+" if valeur > 0 else ""}{valeur}</span>'
+
+
+def page_synthese(key):
+    """Plan de synthèse d'un monstre, étape par étape"""
+    arbre = get_synthesis_tree(key, _etat["donnees"])
+    blocs = []
+    for numero, noeud in enumerate(etapes_synthese(arbre), start=1):
+        if noeud.get("is_family"):
+            titre, visuel = f"Capturer {e(noeud['name'])}", "Famille"
+            detail = "Capturez n'importe quel monstre de cette famille"
+        else:
+            action = "Synthétiser" if noeud["parents"] else "Capturer"
+            titre = f"{action} {lien_monstre(noeud['key'])}"
+            visuel = image_monstre(noeud["key"], vignette=True, largeur=80)
+            detail = ("Obtenu par synthèse de :<br>" + "<br>".join(
+                " + ".join(e(parent["name"]) for parent in combinaison) for combinaison in noeud["parents"])
+                if noeud["parents"] else "Monstre de base (à capturer directement)")
+        blocs.append(f'<div class="etape"><div>{visuel}<br><small>Rang {e(noeud["rank"])}</small></div>'
+                     f"<div><h3>Étape {numero} : {titre}</h3><p>{detail}</p></div></div>")
+    return gabarit(f"Synthèse : {nom_monstre(key)}", "\n".join(blocs) or "<p>Aucune synthèse disponible</p>")
+
+
+def page_objet(item_key):
+    """Fiche d'un objet et monstres qui le lâchent"""
+    donnees = _etat["donnees"]
+    objet = donnees["items"][item_key]
+    sections = []
+    if objet.get("description"):
+        sections.append(f"<p>{e(objet['description'])}</p>")
+    if objet.get("type"):
+        sections.append(f"<p><b>Type :</b> {e(objet['type'])}</p>")
+    sources = donnees["index"]["drops"].get(item_key)
+    sections.append("<h2>Monstres qui lâchent cet objet</h2>")
+    if not sources:
+        sections.append("<p>Aucun monstre connu ne lâche cet objet</p>")
+    for rarete, titre in [("normal", "Drop normal"), ("rare", "Drop rare")]:
+        if sources and sources[rarete]:
+            sections.append(f"<h3>{titre} ({len(sources[rarete])})</h3><div class=\"grille\">" + "".join(
+                f"<figure>{image_monstre(m, vignette=True, largeur=70)}<figcaption>{lien_monstre(m)}</figcaption></figure>"
+                for m in sources[rarete]) + "</div>")
+    return gabarit(objet.get("name", item_key), "\n".join(sections))
+
+
+def page_index_monstres():
+    """Liste des monstres par numéro, avec vignettes"""
+    monstres = _etat["donnees"]["monstres"]
+    cles = sorted(monstres, key=lambda key: (monstres[key].get("number") or 0, key))
+    return gabarit("Monstres", '<div class="grille">' + "".join(
+        f"<figure>{image_monstre(key, vignette=True)}<figcaption>{lien_monstre(key)}</figcaption></figure>"
+        for key in cles) + "</div>")
+
+
+def page_index_objets():
+    """Objets groupés par catégorie"""
+    catalogue = _etat["donnees"]["catalogue"]
+    sections = []
+    for categorie in catalogue["categories_triees"]:
+        elements = "".join(f"<li>{lien_objet(key)} : {e(catalogue['resumes'][key])}</li>"
+                           for key in catalogue["categories"][categorie])
+        sections.append(f"<h2>{e(categorie)}</h2><ul>{elements}</ul>")
+    return gabarit("Objets", "\n".join(sections))
+
+
+def page_base():
+    """Table de tous les monstres (croissance et stats maximales), filtrable"""
+    donnees = _etat["donnees"]
+    matrices = donnees["matrices"]
+    lignes = []
+    for i, key in enumerate(matrices["cles"]):
+        monstre = donnees["monstres"][key]
+        if not monstre.get("name"):
+            continue
+        famille = donnees["families"].get(monstre.get("family") or "", {}).get("name", "Inconnue")
+        lignes.append([lien_monstre(key, racine=""), e(monstre.get("number", "?")), e(monstre.get("rank", "?")), e(famille)]
+                      + [_nombre(v) for v in matrices["growth"][i]] + [_nombre(v) for v in matrices["max_stats"][i]])
+    entetes = (["Nom", "Numéro", "Rang", "Famille"] + [f"{LIBELLES_STATS[s]} Growth" for s in STATS]
+               + [f"{LIBELLES_STATS[s]} Max" for s in STATS])
+    corps = (f'<p><input id="filtre" type="search" placeholder="Filtrer..."> {len(lignes)} monstres</p>'
+             + tableau(entetes, lignes, ' id="monstres"') + f"<script>{SCRIPT_FILTRE}</script>")
+    return gabarit("Base de données", corps, racine="")
+
+
+def _nombre(valeur):
+    return "" if valeur != valeur else str(int(valeur))  # NaN : valeur manquante
+
+
+def page_accueil():
+    monstres, items = _etat["donnees"]["monstres"], _etat["donnees"]["items"]
+    corps = (f"<p>Version statique du guide Dragon Quest Monsters : {len(monstres)} monstres, "
+             f"leurs plans de synthèse et {len(items)} objets.</p>"
+             '<ul><li><a href="monstres/index.html">Tous les monstres</a></li>'
+             '<li><a href="base.html">Base de données (table filtrable)</a></li>'
+             '<li><a href="objets/index.html">Objets</a></li></ul>')
+    return gabarit("Dragon Quest Monsters - Guide", corps, racine="")
+
+
+def optimiser_image(source, cible, taille, qualite=QUALITE):
+    """Redimensionner (au plus `taille` px) et convertir en WebP ; 0 si la cible est à jour, sinon octets écrits"""
+    if os.path.exists(cible) and os.path.getmtime(cible) >= os.path.getmtime(source):
+        return 0
+    with Image.open(source) as image:
+        image = image.convert("RGBA" if image.mode in ("RGBA", "LA", "P") else "RGB")
+        image.thumbnail((taille, taille), Image.LANCZOS)
+        image.save(cible, "WEBP", quality=qualite, method=4)
+    return os.path.getsize(cible)
+
+
+def _initialiser(dossier_donnees, langue):
+    """Charger les données une fois par processus"""
+    sources = charger_sources(dossier_donnees, [nom_source for nom_source in dependances(DONNEES) if nom_source in FICHIERS])
+    donnees = construire_donnees(sources, DONNEES)
+    images = {}
+    for key, monstre in donnees["monstres"].items():
+        chemin = chemin_image_monstre(monstre.get("name") or key, dossier_donnees)
+        if chemin:
+            images[key] = chemin
+    _etat.update(donnees=donnees, langue=langue, images=images, dossier_donnees=dossier_donnees)
+
+
+# Type de page -> (dossier de sortie, rendu)
+RENDUS = {
+    "monstre": ("monstres", page_monstre),
+    "synthese": ("synthese", page_synthese),
+    "objet": ("objets", page_objet),
+}
+
+# Pages uniques -> (fichier, rendu)
+PAGES_UNIQUES = {
+    "index": ("index.html", page_accueil),
+    "monstres": ("monstres/index.html", page_index_monstres),
+    "objets": ("objets/index.html", page_index_objets),
+    "base": ("base.html", page_base),
+}
+
+
+def _ecrire(chemin, contenu):
+    with open(chemin, "w", encoding="utf-8") as f:
+        f.write(contenu)
+    return len(contenu.encode("utf-8"))
+
+
+def _rendre_lot(type_page, cles, sortie):
+    """Rendre et écrire un lot de pages ; renvoie (type, nombre de fichiers, octets)"""
+    if type_page == "page":
+        octets = sum(_ecrire(os.path.join(sortie, PAGES_UNIQUES[cle][0]), PAGES_UNIQUES[cle][1]()) for cle in cles)
+    elif type_page == "image":
+        octets = sum(optimiser_image(_etat["images"][key], os.path.join(sortie, "images", dossier, f"{key}.webp"), taille)
+                     for key in cles for dossier, taille in FORMATS_IMAGES.items())
+        return type_page, len(cles) * len(FORMATS_IMAGES), octets
+    else:
+        dossier, rendu = RENDUS[type_page]
+        octets = sum(_ecrire(os.path.join(sortie, dossier, f"{cle}.html"), rendu(cle)) for cle in cles)
+    return type_page, len(cles), octets
+
+
+def _lots(cles, taille=TAILLE_LOT):
+    return [cles[i:i + taille] for i in range(0, len(cles), taille)]
+
+
+def _fichiers_attendus(taches, dossier_donnees):
+    """Fichiers que l'export écrit dans chaque dossier de sortie (relatif à la racine du site)"""
+    attendus = {dossier: set() for dossier, _ in RENDUS.values()}
+    attendus.update({f"images/{dossier}": set() for dossier in FORMATS_IMAGES})
+    for type_page, cles in taches:
+        if type_page == "image":
+            for dossier in FORMATS_IMAGES:
+                attendus[f"images/{dossier}"].update(f"{key}.webp" for key in cles)
+        elif type_page == "page":
+            for cle in cles:
+                dossier, fichier = os.path.split(PAGES_UNIQUES[cle][0])
+                if dossier:
+                    attendus[dossier].add(fichier)
+        else:
+            attendus[RENDUS[type_page][0]].update(f"{cle}.html" for cle in cles)
+    for dossier in DOSSIERS_ICONES:
+        source = os.path.join(dossier_donnees, dossier)
+        attendus[f"images/{dossier}"] = set(os.listdir(source)) if os.path.isdir(source) else set()
+    return attendus
+
+
+def supprimer_obsoletes(sortie, attendus):
+    """Supprimer les fichiers d'un export précédent que cet export n'a pas écrits
+    (monstre ou objet renommé ou retiré) ; renvoie le nombre de fichiers supprimés"""
+    supprimes = 0
+    for dossier, fichiers in attendus.items():
+        chemin = os.path.join(sortie, dossier)
+        if not os.path.isdir(chemin):
+            continue
+        for entree in os.scandir(chemin):
+            if entree.is_file() and entree.name not in fichiers:
+                os.remove(entree.path)
+                supprimes += 1
+    return supprimes
+
+
+def exporter_site(sortie=DOSSIER_SITE, dossier_donnees=DOSSIER_DONNEES, processus=None, langue=LANGUE_DEFAUT):
+    """Générer le site statique ; renvoie le nombre de fichiers et d'octets écrits par type, le nombre de
+    fichiers obsolètes supprimés et la durée"""
+    debut = time.perf_counter()
+    # Le processus principal charge aussi les données : il répartit le travail
+    _initialiser(dossier_donnees, langue)
+    donnees = _etat["donnees"]
+    for dossier in ["monstres", "synthese", "objets", *[f"images/{dossier}" for dossier in FORMATS_IMAGES]]:
+        os.makedirs(os.path.join(sortie, dossier), exist_ok=True)
+    for dossier in DOSSIERS_ICONES:
+        source = os.path.join(dossier_donnees, dossier)
+        if os.path.isdir(source):
+            shutil.copytree(source, os.path.join(sortie, "images", dossier), dirs_exist_ok=True)
+    _ecrire(os.path.join(sortie, "style.css"), STYLE)
+
+    monstres = sorted(donnees["monstres"])
+    taches = (
+        [("image", lot) for lot in _lots(sorted(_etat["images"]))]
+        + [("monstre", lot) for lot in _lots(monstres)]
+        + [("synthese", lot) for lot in _lots([key for key in monstres if donnees["monstres"][key].get("synthesis")])]
+        + [("objet", lot) for lot in _lots(sorted(donnees["items"]))]
+        + [("page", [nom_page]) for nom_page in PAGES_UNIQUES]
+    )
+
+    processus = processus or os.cpu_count() or 1
+    if processus > 1:
+        with ProcessPoolExecutor(processus, initializer=_initialiser, initargs=(dossier_donnees, langue)) as pool:
+            resultats = list(pool.map(_rendre_lot, *zip(*[(t, lot, sortie) for t, lot in taches])))
+    else:
+        resultats = [_rendre_lot(t, lot, sortie) for t, lot in taches]
+
+    bilan = {}
+    for type_page, nb, octets in resultats:
+        cumul = bilan.setdefault(type_page, {"files": 0, "bytes": 0})
+        cumul["files"] += nb
+        cumul["bytes"] += octets
+    # Les pages d'un monstre ou d'un objet renommé ou retiré depuis l'export précédent pointeraient
+    # encore vers le site : seuls restent les fichiers écrits par cet export
+    supprimes = supprimer_obsoletes(sortie, _fichiers_attendus(taches, dossier_donnees))
+    return {"output": sortie, "workers": processus, "seconds": round(time.perf_counter() - debut, 2),
+            "pages": bilan, "removed": supprimes}
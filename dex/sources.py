@@ -0,0 +1,143 @@
+"""
+Fichiers sources des jeux de données (mêmes clés que le dict `donnees` des pages)
+et construction des structures dérivées (matrices, index...) à partir de ces sources.
+
+Chaque structure dérivée déclare les jeux dont elle dépend (`DERIVES`), ce qui
+permet de ne charger et construire que ce qu'une page utilise. Les modules de
+construction (NumPy...) ne sont importés qu'au premier usage.
+"""
+
+import hashlib
+import json
+import os
+
+DOSSIER_DONNEES = "data"
+
+FICHIERS = {
+    "monstres": "monsters.json",
+    "talents": "talents.json",
+    "skills": "skills.json",
+    "traits": "traits.json",
+    "families": "families.json",
+    "resistances": "resistances.json",
+    "maxstats": "maxstats.json",
+    "large_differences": "largeDifferences.json",
+    "items": "items.json",
+}
+
+
+def _matrices(donnees):
+    # Matrices colonnaires pour les tris, filtres et classements vectorisés
+    from dex.matrices import construire_matrices
+    return construire_matrices(donnees["monstres"], donnees["resistances"], donnees["maxstats"],
+                               donnees["large_differences"])
+
+
+def _index(donnees):
+    # Index inversés compétences / talents / traits / drops -> monstres
+    from dex.index_inverses import construire_index
+    return construire_index(donnees["monstres"], donnees["talents"])
+
+
+def _recherche(donnees):
+    # Index plein texte (BM25) sur les noms et descriptions
+    from dex.recherche import construire_index_recherche
+    return construire_index_recherche(donnees)
+
+
+def _localisation(donnees):
+    # Noms d'affichage et clés de recherche par langue
+    from dex.localisation import construire_localisation
+    return construire_localisation(donnees)
+
+
+def _catalogue(donnees):
+    # Catalogue des objets trié et groupé par catégorie
+    from dex.catalogue import construire_catalogue
+    return construire_catalogue(donnees["items"])
+
+
+def _voisins(donnees):
+    # Plus proches voisins de chaque monstre ("monstres similaires")
+    from dex.voisins import construire_voisins
+    return construire_voisins(donnees["matrices"], donnees["monstres"])
+
+
+def _integrite(donnees):
+    # Références orphelines (détail : python check_integrity.py)
+    from dex.integrite import verifier_integrite
+    return verifier_integrite(donnees)
+
+
+# Structure dérivée -> (jeux dont elle dépend, construction), dans l'ordre de construction
+DERIVES = {
+    "matrices": (("monstres", "resistances", "maxstats", "large_differences"), _matrices),
+    "index": (("monstres", "talents"), _index),
+    "recherche": (("monstres", "skills", "traits", "items"), _recherche),
+    "localisation": (("monstres", "skills", "traits", "items"), _localisation),
+    "catalogue": (("items",), _catalogue),
+    "voisins": (("matrices", "monstres"), _voisins),
+    "integrite": (tuple(FICHIERS), _integrite),
+}
+
+
+def dependances(noms):
+    """Jeux nécessaires pour fournir `noms` (dépendances comprises), sources puis dérivés dans l'ordre de construction"""
+    requis = set()
+    a_visiter = list(noms)
+    while a_visiter:
+        nom = a_visiter.pop()
+        if nom in requis:
+            continue
+        if nom not in FICHIERS and nom not in DERIVES:
+            raise KeyError(f"Jeu de données inconnu : {nom}")
+        requis.add(nom)
+        a_visiter.extend(DERIVES.get(nom, ((), None))[0])
+    return [nom for nom in [*FICHIERS, *DERIVES] if nom in requis]
+
+
+def construire(nom, donnees):
+    """Construire la structure dérivée `nom` à partir des jeux dont elle dépend"""
+    return DERIVES[nom][1](donnees)
+
+
+def chemin_source(nom, dossier=DOSSIER_DONNEES):
+    """Chemin du fichier d'un jeu de données"""
+    return os.path.join(dossier, FICHIERS[nom])
+
+
+def charger_sources(dossier=DOSSIER_DONNEES, noms=None):
+    """Charger les jeux de données demandés (tous par défaut), hors de Streamlit"""
+    sources = {}
+    for nom in noms or FICHIERS:
+        with open(chemin_source(nom, dossier), "r", encoding="utf-8") as f:
+            sources[nom] = json.load(f)
+    return sources
+
+
+def empreinte_sources(dossier=DOSSIER_DONNEES, noms=None):
+    """Empreinte du contenu des fichiers sources demandés (tous par défaut)
+
+    Enregistrée dans les exports (SQLite, Arrow) pour vérifier qu'ils correspondent
+    encore aux fichiers, quelle que soit la façon dont ceux-ci ont été modifiés.
+    """
+    empreinte = hashlib.sha1()
+    for nom in noms or FICHIERS:
+        try:
+            with open(chemin_source(nom, dossier), "rb") as f:
+                contenu = f.read()
+        except OSError:
+            contenu = b""
+        empreinte.update(f"{nom}:{hashlib.sha1(contenu).hexdigest()}\n".encode("utf-8"))
+    return empreinte.hexdigest()[:16]
+
+
+def construire_donnees(sources, noms=None):
+    """Ajouter aux jeux de données chargés les structures précalculées utilisées par les pages
+    (toutes, ou seulement celles nécessaires pour fournir `noms`)"""
+    donnees = dict(sources)
+    requis = set(dependances(noms)) if noms is not None else DERIVES
+    for nom in DERIVES:
+        if nom in requis:
+            donnees[nom] = construire(nom, donnees)
+    return donnees
@@ -0,0 +1,258 @@
+"""
+Export des jeux de données vers une base SQLite normalisée, et accès en lecture seule.
+
+Une table par entité (monstres, talents, compétences, traits, objets, familles,
+résistances), des tables de liaison (talents et traits des monstres, compétences
+et traits des talents, arêtes de synthèse, valeurs de résistance), des index sur
+les colonnes de jointure et de filtre, et une table FTS5 sur les noms et
+descriptions. La base est construite dans un fichier temporaire puis renommée
+atomiquement ; l'application ne l'ouvre qu'en lecture.
+"""
+
+import datetime
+import json
+import os
+import re
+import sqlite3
+import tempfile
+import time
+
+from dex.matrices import MAX_STATS_CLES, MAXSTATS_CLES, STATS
+
+FICHIER_SQLITE = "data/dqm3.sqlite"
+
+# Durée maximale d'une requête libre (secondes) et fréquence de vérification (instructions SQLite)
+DELAI_REQUETE = 2.0
+PAS_VERIFICATION = 10000
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE families (key TEXT PRIMARY KEY, name TEXT);
+CREATE TABLE resistances (key TEXT PRIMARY KEY, name TEXT);
+CREATE TABLE monsters (
+    key TEXT PRIMARY KEY, name TEXT, french_name TEXT, number INTEGER, rank TEXT, family TEXT,
+    description TEXT, drop_normal TEXT, drop_rare TEXT,
+    growth_hp INTEGER, growth_mp INTEGER, growth_atk INTEGER, growth_def INTEGER, growth_agi INTEGER, growth_wis INTEGER,
+    max_hp INTEGER, max_mp INTEGER, max_atk INTEGER, max_def INTEGER, max_agi INTEGER, max_wis INTEGER
+);
+CREATE TABLE talents (key TEXT PRIMARY KEY, name TEXT);
+CREATE TABLE skills (key TEXT PRIMARY KEY, name TEXT, type TEXT, description TEXT, mp_cost INTEGER);
+CREATE TABLE traits (key TEXT PRIMARY KEY, name TEXT, description TEXT);
+CREATE TABLE items (key TEXT PRIMARY KEY, name TEXT, type TEXT, description TEXT, buy INTEGER, sell INTEGER, effects TEXT);
+CREATE TABLE monster_talents (monster TEXT, talent TEXT, position INTEGER);
+CREATE TABLE monster_traits (monster TEXT, trait TEXT, size TEXT, level INTEGER);
+CREATE TABLE monster_resistances (monster TEXT, resistance TEXT, size TEXT, value INTEGER);
+CREATE TABLE talent_skills (talent TEXT, skill TEXT, points INTEGER);
+CREATE TABLE talent_traits (talent TEXT, trait TEXT, points INTEGER);
+CREATE TABLE talent_evolutions (talent TEXT, previous TEXT);
+CREATE TABLE synthesis (monster TEXT, recipe INTEGER, position INTEGER, parent TEXT, parent_kind TEXT);
+CREATE VIRTUAL TABLE search USING fts5(
+    dataset UNINDEXED, key UNINDEXED, name, french_name, description, tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE INDEX idx_monsters_family ON monsters (family);
+CREATE INDEX idx_monsters_rank ON monsters (rank);
+CREATE INDEX idx_monsters_number ON monsters (number);
+CREATE INDEX idx_monsters_drop_normal ON monsters (drop_normal);
+CREATE INDEX idx_monsters_drop_rare ON monsters (drop_rare);
+CREATE INDEX idx_monster_talents_monster ON monster_talents (monster);
+CREATE INDEX idx_monster_talents_talent ON monster_talents (talent);
+CREATE INDEX idx_monster_traits_monster ON monster_traits (monster);
+CREATE INDEX idx_monster_traits_trait ON monster_traits (trait);
+CREATE INDEX idx_monster_resistances_monster ON monster_resistances (monster, size);
+CREATE INDEX idx_monster_resistances_value ON monster_resistances (resistance, size, value);
+CREATE INDEX idx_talent_skills_talent ON talent_skills (talent);
+CREATE INDEX idx_talent_skills_skill ON talent_skills (skill);
+CREATE INDEX idx_talent_traits_talent ON talent_traits (talent);
+CREATE INDEX idx_talent_traits_trait ON talent_traits (trait);
+CREATE INDEX idx_synthesis_monster ON synthesis (monster);
+CREATE INDEX idx_synthesis_parent ON synthesis (parent);
+"""
+
+# Requêtes d'exemple proposées par la page de requêtes
+EXEMPLES = {
+    "Monstres de rang S par famille": (
+        "SELECT family, COUNT(*) AS nb FROM monsters WHERE rank = 'S' GROUP BY family ORDER BY nb DESC"
+    ),
+    "Monstres qui apprennent une compétence": (
+        "SELECT DISTINCT m.name, t.name AS talent, ts.points\n"
+        "FROM talent_skills ts\n"
+        "JOIN monster_talents mt ON mt.talent = ts.talent\n"
+        "JOIN monsters m ON m.key = mt.monster\n"
+        "JOIN talents t ON t.key = ts.talent\n"
+        "WHERE ts.skill = 'kafrizz' ORDER BY ts.points"
+    ),
+    "Immunités au feu et à la glace (grande taille)": (
+        "SELECT m.name, m.rank\n"
+        "FROM monsters m\n"
+        "JOIN monster_resistances f ON f.monster = m.key AND f.resistance = 'fire' AND f.size = 'large'\n"
+        "JOIN monster_resistances g ON g.monster = m.key AND g.resistance = 'ice' AND g.size = 'large'\n"
+        "WHERE f.value >= 100 AND g.value >= 100 ORDER BY m.number"
+    ),
+    "Parents de synthèse les plus utilisés": (
+        "SELECT parent, parent_kind, COUNT(*) AS nb FROM synthesis GROUP BY parent ORDER BY nb DESC LIMIT 20"
+    ),
+}
+
+
+def _lignes_monstres(donnees):
+    """Lignes des tables monsters et des tables de liaison des monstres"""
+    large = (donnees.get("large_differences") or {}).get("resistances") or {}
+    affectees, bonus = set(large.get("affected") or []), large.get("bonus", 0)
+    maxstats_par_nom = {entree["name"].lower(): entree["stats"] for entree in donnees.get("maxstats") or []}
+
+    lignes = {"monsters": [], "monster_talents": [], "monster_traits": [], "monster_resistances": [], "synthesis": []}
+    for key, monstre in (donnees.get("monstres") or {}).items():
+        growth = monstre.get("growth") or {}
+        # maxstats.json en priorité, comme dans dex.matrices
+        stats_max = maxstats_par_nom.get((monstre.get("name") or "").lower())
+        if stats_max:
+            max_stats = [stats_max.get(MAXSTATS_CLES[stat]) for stat in STATS]
+        else:
+            max_stats = [(monstre.get("max_stats") or {}).get(MAX_STATS_CLES[stat]) for stat in STATS]
+        drops = monstre.get("drops") or {}
+        lignes["monsters"].append((
+            key, monstre.get("name"), monstre.get("french_name"), monstre.get("number"), monstre.get("rank"),
+            monstre.get("family"), monstre.get("description"), drops.get("normal"), drops.get("rare"),
+            *[growth.get(stat) for stat in STATS], *max_stats,
+        ))
+        for position, talent_key in enumerate(monstre.get("talents") or []):
+            lignes["monster_talents"].append((key, talent_key, position))
+        for taille in ["small", "large"]:
+            for trait_key, niveau in ((monstre.get("traits") or {}).get(taille) or {}).items():
+                lignes["monster_traits"].append((key, trait_key, taille, niveau))
+        for resistance_key, valeur in (monstre.get("resistances") or {}).items():
+            if valeur is None:
+                continue
+            lignes["monster_resistances"].append((key, resistance_key, "small", valeur))
+            lignes["monster_resistances"].append(
+                (key, resistance_key, "large", valeur + bonus if resistance_key in affectees else valeur))
+        for recette, parents in enumerate(monstre.get("synthesis") or []):
+            for position, parent in enumerate(parents or []):
+                lignes["synthesis"].append(
+                    (key, recette, position, parent, "family" if str(parent).startswith("_") else "monster"))
+    return lignes
+
+
+def _lignes_talents(talents):
+    lignes = {"talents": [], "talent_skills": [], "talent_traits": [], "talent_evolutions": []}
+    for key, talent in talents.items():
+        lignes["talents"].append((key, talent.get("name")))
+        for skill_key, points in (talent.get("skills") or {}).items():
+            lignes["talent_skills"].append((key, skill_key, points))
+        for trait_key, paliers in (talent.get("traits") or {}).items():
+            for points in paliers or []:
+                lignes["talent_traits"].append((key, trait_key, points))
+        for precedent in talent.get("evolution") or []:
+            lignes["talent_evolutions"].append((key, precedent))
+    return lignes
+
+
+def _inserer(conn, table, lignes):
+    if lignes:
+        marqueurs = ", ".join("?" * len(lignes[0]))
+        conn.executemany(f"INSERT INTO {table} VALUES ({marqueurs})", lignes)
+
+
+def remplir(conn, donnees, empreinte=None):
+    """Créer le schéma et insérer tous les jeux de données"""
+    conn.executescript(SCHEMA)
+    tables = {
+        "families": [(key, f.get("name")) for key, f in (donnees.get("families") or {}).items()],
+        "resistances": [(key, r.get("name")) for key, r in (donnees.get("resistances") or {}).items()],
+        "skills": [(key, s.get("name"), s.get("type"), s.get("description"), s.get("mp_cost"))
+                   for key, s in (donnees.get("skills") or {}).items()],
+        "traits": [(key, t.get("name"), t.get("description")) for key, t in (donnees.get("traits") or {}).items()],
+        "items": [(key, i.get("name"), i.get("type"), i.get("description"), i.get("buy"), i.get("sell"),
+                   json.dumps(i["effects"], ensure_ascii=False) if i.get("effects") else None)
+                  for key, i in (donnees.get("items") or {}).items()],
+        **_lignes_monstres(donnees),
+        **_lignes_talents(donnees.get("talents") or {}),
+    }
+    for table, lignes in tables.items():
+        _inserer(conn, table, lignes)
+
+    recherche = [("monstres", key, m.get("name"), m.get("french_name"), m.get("description"))
+                 for key, m in (donnees.get("monstres") or {}).items()]
+    for dataset in ["skills", "traits", "items"]:
+        recherche += [(dataset, key, e.get("name"), None, e.get("description"))
+                      for key, e in (donnees.get(dataset) or {}).items()]
+    _inserer(conn, "search", recherche)
+
+    _inserer(conn, "meta", [
+        ("sources_sha1", empreinte or "0"),
+        ("built", datetime.datetime.now().isoformat(timespec="seconds")),
+    ])
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def exporter_sqlite(donnees, chemin=FICHIER_SQLITE, empreinte=None):
+    """Construire la base dans un fichier temporaire puis la renommer atomiquement sur `chemin`"""
+    dossier = os.path.dirname(os.path.abspath(chemin))
+    fd, temporaire = tempfile.mkstemp(dir=dossier, prefix=f".{os.path.basename(chemin)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        conn = sqlite3.connect(temporaire)
+        try:
+            remplir(conn, donnees, empreinte)
+        finally:
+            conn.close()
+        os.chmod(temporaire, 0o644)
+        os.replace(temporaire, chemin)
+    except BaseException:
+        if os.path.exists(temporaire):
+            os.remove(temporaire)
+        raise
+    return chemin
+
+
+def ouvrir_lecture(chemin=FICHIER_SQLITE):
+    """Connexion en lecture seule (mode=ro + query_only), à fermer par l'appelant"""
+    uri = f"file:{os.path.abspath(chemin)}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+def meta(conn):
+    """Métadonnées de la base (empreinte des sources, date de construction)"""
+    return {ligne["key"]: ligne["value"] for ligne in conn.execute("SELECT key, value FROM meta")}
+
+
+def requete(conn, sql, parametres=(), limite=1000, delai=DELAI_REQUETE):
+    """Exécuter une requête de lecture : (colonnes, lignes), au plus `limite` lignes
+
+    La requête est interrompue au-delà de `delai` secondes (CTE récursive sans fin,
+    produit cartésien...) : sqlite3.OperationalError.
+    """
+    if not re.match(r"\s*(SELECT|WITH|EXPLAIN)\b", sql, re.IGNORECASE):
+        raise ValueError("Seules les requêtes SELECT / WITH / EXPLAIN sont autorisées")
+    echeance = time.monotonic() + delai
+    # Une valeur non nulle renvoyée par le gestionnaire interrompt la requête en cours
+    conn.set_progress_handler(lambda: time.monotonic() > echeance, PAS_VERIFICATION)
+    try:
+        curseur = conn.execute(sql, parametres)
+        colonnes = [description[0] for description in curseur.description or []]
+        return colonnes, [tuple(ligne) for ligne in curseur.fetchmany(limite)]
+    except sqlite3.OperationalError:
+        if time.monotonic() > echeance:
+            raise sqlite3.OperationalError(f"requête interrompue après {delai:g} s") from None
+        raise
+    finally:
+        conn.set_progress_handler(None, 0)
+
+
+def rechercher_texte(conn, texte, n=20):
+    """Recherche plein texte (FTS5, classement bm25) : liste de (dataset, key, name)"""
+    termes = re.findall(r"\w+", texte)
+    if not termes:
+        return []
+    # Chaque terme entre guillemets (pas de syntaxe FTS5 injectée), le dernier en préfixe
+    expression = " ".join(f'"{terme}"' for terme in termes[:-1]) + f' "{termes[-1]}"*'
+    lignes = conn.execute(
+        "SELECT dataset, key, name FROM search WHERE search MATCH ? ORDER BY bm25(search, 0, 0, 3.0, 3.0, 1.0) LIMIT ?",
+        (expression.strip(), n),
+    )
+    return [tuple(ligne) for ligne in lignes]
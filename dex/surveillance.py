@@ -0,0 +1,124 @@
+"""
+Surveillance des fichiers de données par relevé périodique des dates de modification.
+
+`releve()` renvoie la signature (date de modification, taille) de chaque fichier
+source et de chaque dossier d'images, ainsi que la version de chaque fichier
+tamponnée dans data/version.json par les écritures (dex.ecriture), relevées au plus
+une fois par INTERVALLE secondes pour tout le processus. Signature et version
+servent de clés aux caches de l'application : un fichier modifié change la clé de son jeu de données et des
+seules structures dérivées qui en dépendent, reconstruits à l'exécution suivante,
+les autres entrées restant valides. Une exécution en cours garde le relevé pris à
+son début : les sessions ne sont pas interrompues et voient l'ancien ou le nouvel
+état, jamais un mélange des deux.
+
+Un fichier modifié depuis moins de DELAI_STABILITE secondes garde son ancienne
+signature jusqu'à un relevé ultérieur, pour ne pas lire un fichier en cours
+d'écriture (éditeur, copie non atomique).
+"""
+
+import os
+import threading
+import time
+
+from dex.ecriture import lire_version
+from dex.sources import DERIVES, DOSSIER_DONNEES, FICHIERS, chemin_source, dependances, empreinte_sources
+
+INTERVALLE = 2.0
+DELAI_STABILITE = 1.0
+
+# Dossiers d'images servis par les pages
+DOSSIERS_IMAGES = ["MonsterImages", "FamilyIcons", "RankIcons", "ResistanceIcons", "ItemIcons", "SpritesIcons"]
+
+_verrou = threading.Lock()
+_releves = {}
+_empreintes = {}
+
+
+def signature_fichier(chemin):
+    """(date de modification en ns, taille), None si le fichier n'existe pas"""
+    try:
+        infos = os.stat(chemin)
+    except OSError:
+        return None
+    return (infos.st_mtime_ns, infos.st_size)
+
+
+def signature_dossier(chemin):
+    """(date du dossier, nombre de fichiers, modification la plus récente, taille totale), None si absent"""
+    try:
+        date_dossier = os.stat(chemin).st_mtime_ns
+        nb, plus_recente, taille = 0, 0, 0
+        with os.scandir(chemin) as entrees:
+            for entree in entrees:
+                if entree.is_file():
+                    infos = entree.stat()
+                    nb += 1
+                    plus_recente = max(plus_recente, infos.st_mtime_ns)
+                    taille += infos.st_size
+    except OSError:
+        return None
+    return (date_dossier, nb, plus_recente, taille)
+
+
+def relever(dossier=DOSSIER_DONNEES, precedent=None):
+    """Signatures des fichiers sources et des dossiers d'images"""
+    maintenant = time.time_ns()
+    anciennes = (precedent or {}).get("fichiers", {})
+    fichiers = {}
+    for nom in FICHIERS:
+        signature = signature_fichier(chemin_source(nom, dossier))
+        # Fichier en cours d'écriture : ancienne signature jusqu'à ce qu'il soit stable
+        if (nom in anciennes and signature != anciennes[nom] and signature is not None
+                and maintenant - signature[0] < DELAI_STABILITE * 1e9):
+            signature = anciennes[nom]
+        fichiers[nom] = signature
+    # Empreintes tamponnées dans version.json par les écritures de dex.ecriture
+    tampons = lire_version(dossier).get("files", {})
+    versions = {nom: tampons.get(FICHIERS[nom]) for nom in FICHIERS}
+    images = {nom: signature_dossier(os.path.join(dossier, nom)) for nom in DOSSIERS_IMAGES}
+    return {"fichiers": fichiers, "versions": versions, "images": images}
+
+
+def releve(dossier=DOSSIER_DONNEES, intervalle=INTERVALLE):
+    """Dernier relevé du processus, renouvelé au plus une fois par `intervalle` secondes"""
+    with _verrou:
+        instant, dernier = _releves.get(dossier, (None, None))
+        if dernier is None or time.monotonic() - instant >= intervalle:
+            dernier = relever(dossier, dernier)
+            _releves[dossier] = (time.monotonic(), dernier)
+        return dernier
+
+
+def cle_fichier(releve_courant, nom):
+    """Clé de cache d'un fichier source : signature (date, taille) et version tamponnée à l'écriture"""
+    return (releve_courant["fichiers"][nom], releve_courant["versions"].get(nom))
+
+
+def cle(releve_courant, nom):
+    """Clé de cache d'un jeu de données : clés des fichiers sources dont il dépend"""
+    return tuple(cle_fichier(releve_courant, source) for source in dependances([nom]) if source in FICHIERS)
+
+
+def changements(ancien, nouveau):
+    """Fichiers sources, structures dérivées et dossiers d'images modifiés entre deux relevés"""
+    sources = [nom for nom in FICHIERS if cle_fichier(ancien, nom) != cle_fichier(nouveau, nom)]
+    return {
+        "files": sources,
+        "derived": [nom for nom in DERIVES if set(sources) & set(dependances([nom]))],
+        "images": [nom for nom in DOSSIERS_IMAGES if ancien["images"].get(nom) != nouveau["images"].get(nom)],
+    }
+
+
+def empreinte_courante(dossier=DOSSIER_DONNEES, noms=None):
+    """Empreinte du contenu des fichiers sources (dex.sources.empreinte_sources),
+    relue seulement quand leurs signatures changent"""
+    noms = tuple(noms or FICHIERS)
+    signatures = tuple(releve(dossier)["fichiers"][nom] for nom in noms)
+    with _verrou:
+        connue = _empreintes.get((dossier, noms))
+    if connue is not None and connue[0] == signatures:
+        return connue[1]
+    empreinte = empreinte_sources(dossier, noms)
+    with _verrou:
+        _empreintes[(dossier, noms)] = (signatures, empreinte)
+    return empreinte
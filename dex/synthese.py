@@ -0,0 +1,73 @@
+"""
+Arbres de synthèse (parents récursifs d'un monstre) et plan de synthèse dans l'ordre
+chronologique, partagés par la page Synthèse, l'export statique et l'API.
+"""
+
+
+def get_synthesis_tree(monster_key, donnees, visited=None, depth=0):
+    """Obtenir l'arbre de synthèse complet d'un monstre"""
+    if visited is None:
+        visited = set()
+    
+    # Éviter les boucles infinies
+    if monster_key in visited or depth > 5:
+        return None
+    
+    visited.add(monster_key)
+    
+    monster = donnees["monstres"].get(monster_key)
+    if not monster:
+        return None
+    
+    tree = {
+        "key": monster_key,
+        "name": monster.get("name", monster_key),
+        "rank": monster.get("rank", "?"),
+        "synthesis": monster.get("synthesis"),
+        "parents": []
+    }
+    
+    # Si ce monstre a des parents (synthèse), les ajouter récursivement
+    synthesis = monster.get("synthesis")
+    if synthesis and isinstance(synthesis, list):
+        for combination in synthesis:
+            if isinstance(combination, list):
+                parent_combination = []
+                for parent_key in combination:
+                    if parent_key.startswith("_"):
+                        # C'est une famille
+                        family_name = donnees["families"].get(parent_key, {}).get("name", parent_key)
+                        parent_combination.append({
+                            "key": parent_key,
+                            "name": f"{family_name} (Famille)",
+                            "rank": "Famille",
+                            "is_family": True,
+                            "parents": []
+                        })
+                    else:
+                        # C'est un monstre spécifique
+                        parent_tree = get_synthesis_tree(parent_key, donnees, visited.copy(), depth + 1)
+                        if parent_tree:
+                            parent_combination.append(parent_tree)
+                
+                if parent_combination:
+                    tree["parents"].append(parent_combination)
+    
+    return tree
+
+
+def etapes_synthese(arbre, etapes=None):
+    """Nœuds de l'arbre dans l'ordre chronologique (parents avant enfant), comme la page Synthèse"""
+    if etapes is None:
+        etapes = []
+    if not arbre:
+        return etapes
+    # Les parents ne sont détaillés que si l'un d'eux s'obtient lui-même par synthèse
+    seulement_familles = all(parent.get("is_family") or not parent.get("parents")
+                             for combinaison in arbre["parents"] for parent in combinaison)
+    if arbre["parents"] and not seulement_familles:
+        for combinaison in arbre["parents"]:
+            for parent in combinaison:
+                etapes_synthese(parent, etapes)
+    etapes.append(arbre)
+    return etapes
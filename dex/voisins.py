@@ -0,0 +1,92 @@
+"""
+Index des plus proches voisins ("monstres similaires").
+
+Chaque monstre est décrit par un vecteur normalisé regroupant quatre blocs :
+croissance, stats maximales, résistances (centrées-réduites par colonne, valeurs
+manquantes imputées à la moyenne) et traits/talents (indicateurs binaires).
+Chaque bloc pèse autant que les autres. La similarité cosinus entre tous les
+monstres est calculée une seule fois au chargement, et seuls les K meilleurs
+voisins de chaque monstre sont conservés.
+"""
+
+import warnings
+
+import numpy as np
+
+K_MAX = 10
+
+# Poids relatifs des blocs de caractéristiques
+POIDS_BLOCS = {"growth": 1.0, "max_stats": 1.0, "res": 1.0, "traits_talents": 1.0}
+
+
+def _centrer_reduire(m):
+    """Centrer-réduire chaque colonne, NaN remplacés par la moyenne (0)"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        moyennes = np.nanmean(m, axis=0)
+        ecarts = np.nanstd(m, axis=0)
+    moyennes = np.nan_to_num(moyennes)
+    ecarts = np.where(np.nan_to_num(ecarts) > 0, ecarts, 1.0)
+    return np.nan_to_num((m - moyennes) / ecarts)
+
+
+def _normaliser_bloc(m, poids):
+    """Mettre un bloc à l'échelle pour qu'il contribue `poids` à la norme de chaque ligne"""
+    if m.shape[1] == 0:
+        return m
+    normes = np.linalg.norm(m, axis=1, keepdims=True)
+    return poids * np.divide(m, normes, out=np.zeros_like(m), where=normes > 0)
+
+
+def _traits_talents(monstres, cles):
+    """Indicateurs binaires des talents et des traits (petite et grande taille)"""
+    colonnes = {}
+    lignes = []
+    for cle in cles:
+        monstre = monstres[cle]
+        caracteristiques = [f"talent:{t}" for t in monstre.get("talents") or []]
+        for taille in ["small", "large"]:
+            traits_taille = (monstre.get("traits") or {}).get(taille) or {}
+            caracteristiques.extend(f"trait:{t}" for t in traits_taille)
+        lignes.append([colonnes.setdefault(c, len(colonnes)) for c in caracteristiques])
+    m = np.zeros((len(cles), len(colonnes)), dtype=np.float32)
+    for i, js in enumerate(lignes):
+        m[i, js] = 1.0
+    return m
+
+
+def construire_voisins(matrices, monstres, k=K_MAX):
+    """Précalculer les k plus proches voisins (similarité cosinus) de chaque monstre"""
+    cles = matrices["cles"]
+    n = len(cles)
+    blocs = [
+        _normaliser_bloc(_centrer_reduire(matrices["growth"]), POIDS_BLOCS["growth"]),
+        _normaliser_bloc(_centrer_reduire(matrices["max_stats"]), POIDS_BLOCS["max_stats"]),
+        _normaliser_bloc(_centrer_reduire(matrices["res"]), POIDS_BLOCS["res"]),
+        _normaliser_bloc(_traits_talents(monstres, cles), POIDS_BLOCS["traits_talents"]),
+    ]
+    x = _normaliser_bloc(np.hstack(blocs).astype(np.float32), 1.0)
+
+    similarites = x @ x.T
+    np.fill_diagonal(similarites, -np.inf)  # un monstre n'est pas son propre voisin
+
+    k = min(k, n - 1)
+    if k <= 0:
+        return {"voisins": np.zeros((n, 0), dtype=np.int32), "similarites": np.zeros((n, 0), dtype=np.float32)}
+    voisins = np.argpartition(-similarites, k - 1, axis=1)[:, :k]
+    scores = np.take_along_axis(similarites, voisins, axis=1)
+    ordre = np.argsort(-scores, axis=1, kind="stable")
+    return {
+        "voisins": np.take_along_axis(voisins, ordre, axis=1).astype(np.int32),
+        "similarites": np.take_along_axis(scores, ordre, axis=1),
+    }
+
+
+def monstres_similaires(voisins, matrices, cle, k=5):
+    """k monstres les plus proches : liste de (clé, similarité ramenée entre 0 et 1)"""
+    i = matrices["index"].get(cle)
+    if i is None:
+        return []
+    # Le cosinus de vecteurs centrés peut être négatif (monstres dissemblables) : affiché comme 0 %
+    scores = np.clip(voisins["similarites"][i, :k], 0.0, 1.0)
+    return [(matrices["cles"][j], float(s)) for j, s in zip(voisins["voisins"][i, :k], scores)]
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Import incrémental et idempotent de monster2.json vers monsters.json (non interactif)
+
+Usage :
+    python etl_monsters.py                     # simulation, résumé sur la sortie standard
+    python etl_monsters.py --apply             # applique uniquement les champs modifiés
+    python etl_monsters.py --report rapport.json
+    python etl_monsters.py --report -          # rapport JSON sur la sortie standard
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from dex.ecriture import ecrire_json
+from dex.etl import appliquer_changements, calculer_changements
+from dex.reconciliation import FICHIER_CROSSWALK, rapprochement_courant
+
+def load_json_file(filepath):
+    """Charge un fichier JSON"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_report(filepath, rapport):
+    """Écrit le rapport JSON"""
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(rapport, f, indent=2, ensure_ascii=False)
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Import idempotent de monster2.json vers monsters.json")
+    parser.add_argument("--monsters", default="data/monsters.json", help="Fichier cible (monsters.json)")
+    parser.add_argument("--source", default="data/monster2.json", help="Fichier source (monster2.json)")
+    parser.add_argument("--crosswalk", default=FICHIER_CROSSWALK, help="Crosswalk persisté (recalculé s'il manque ou n'est plus à jour)")
+    parser.add_argument("--apply", action="store_true", help="Écrire les changements (sinon simulation)")
+    parser.add_argument("--report", help="Écrire le rapport JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    debut = time.perf_counter()
+    
+    try:
+        monsters_data = load_json_file(args.monsters)
+        monster2_data = load_json_file(args.source)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Erreur lors du chargement des fichiers JSON: {e}", file=sys.stderr)
+        return 1
+    
+    rapprochement = rapprochement_courant(monsters_data, monster2_data, args.crosswalk)
+    rapport = calculer_changements(monsters_data, monster2_data, rapprochement)
+    rapport["applied"] = False
+    
+    if args.apply and rapport["changes"]:
+        appliquer_changements(monsters_data, rapport["changes"])
+        # Écriture atomique, archive de l'ancienne version et nouvelle version des données
+        rapport["data_version"] = ecrire_json(args.monsters, monsters_data)
+        rapport["applied"] = True
+    
+    rapport["duration_seconds"] = round(time.perf_counter() - debut, 4)
+    
+    # Résumé lisible sur stderr quand le rapport JSON occupe stdout
+    sortie_resume = sys.stderr if args.report == "-" else sys.stdout
+    resume = rapport["summary"]
+    print(f"{resume['changed']} monstre(s) modifié(s), {resume['fields_changed']} champ(s), "
+          f"{resume['unchanged']} inchangé(s), {resume['unmatched']} sans correspondance "
+          f"({'appliqué' if rapport['applied'] else 'simulation'}, {rapport['duration_seconds']}s)",
+          file=sortie_resume)
+    
+    if args.report == "-":
+        json.dump(rapport, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        save_report(args.report, rapport)
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
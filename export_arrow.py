@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Export des monstres en tables colonnaires typées pour l'analyse (Arrow IPC ou Parquet)
+
+Tables : monsters (identité, croissance, stats maximales), resistances, talents,
+traits et synthesis (arêtes parent -> enfant).
+
+Usage :
+    python export_arrow.py                          # data/arrow/*.arrow (lu par la page Base de Données)
+    python export_arrow.py --format parquet --output exports/
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from dex.export_arrow import DOSSIER_ARROW, FORMATS, SOURCES, exporter_tables
+from dex.sources import charger_sources, empreinte_sources
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Export Arrow / Parquet des monstres")
+    parser.add_argument("--data", default="data", help="Dossier des fichiers JSON")
+    parser.add_argument("--output", default=DOSSIER_ARROW, help="Dossier de sortie")
+    parser.add_argument("--format", default="arrow", choices=list(FORMATS), help="Format des fichiers")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    debut = time.perf_counter()
+    
+    try:
+        # Empreinte relevée avant la lecture : un fichier modifié entre les deux rend l'export périmé, jamais l'inverse
+        empreinte = empreinte_sources(args.data, SOURCES)
+        donnees = charger_sources(args.data, SOURCES)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Erreur lors du chargement des fichiers JSON: {e}", file=sys.stderr)
+        return 1
+    
+    chemins = exporter_tables(donnees, args.output, args.format, empreinte)
+    for nom, chemin in chemins.items():
+        print(f"{nom}: {chemin}")
+    print(f"{len(chemins)} table(s) écrite(s) en {time.perf_counter() - debut:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Export du guide en site statique (HTML et images WebP) : fiche de chaque monstre,
+plan de synthèse, fiche de chaque objet, table des monstres et index. Un nouvel
+export dans un dossier existant supprime les pages et images qu'il n'a pas écrites
+(monstres ou objets renommés ou retirés).
+
+Usage :
+    python export_site.py                     # dossier site/, un processus par cœur
+    python export_site.py --output /tmp/guide --workers 4 --clean
+    python export_site.py --lang en --report -
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+
+from dex.localisation import LANGUE_DEFAUT, LANGUES
+from dex.memoire import formater_octets
+from dex.site_statique import DOSSIER_SITE, exporter_site
+from dex.sources import DOSSIER_DONNEES
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Export du guide en site statique")
+    parser.add_argument("--output", default=DOSSIER_SITE, help="Dossier de sortie")
+    parser.add_argument("--data", default=DOSSIER_DONNEES, help="Dossier des données")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Nombre de processus de rendu")
+    parser.add_argument("--lang", default=LANGUE_DEFAUT, choices=sorted(LANGUES), help="Langue des noms")
+    parser.add_argument("--clean", action="store_true", help="Vider le dossier de sortie (images comprises) avant l'export ; "
+                        "sans cette option, seuls les fichiers obsolètes sont supprimés et les images à jour sont gardées")
+    parser.add_argument("--report", help="Écrire le bilan JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    sortie = sys.stderr if args.report == "-" else sys.stdout
+
+    if args.clean and os.path.isdir(args.output):
+        shutil.rmtree(args.output)
+    bilan = exporter_site(args.output, args.data, args.workers, args.lang)
+
+    for type_page, cumul in bilan["pages"].items():
+        print(f"{type_page:10} {cumul['files']:>6} fichier(s) {formater_octets(cumul['bytes']):>12}", file=sortie)
+    if bilan["removed"]:
+        print(f"{bilan['removed']} fichier(s) obsolète(s) d'un export précédent supprimé(s)", file=sortie)
+    print(f"Site généré dans {bilan['output']}/ en {bilan['seconds']} s ({bilan['workers']} processus)", file=sortie)
+
+    if args.report == "-":
+        json.dump(bilan, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(bilan, f, indent=2, ensure_ascii=False)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Export des fichiers de data/ vers une base SQLite (tables normalisées, index, FTS5)
+
+Usage :
+    python export_sqlite.py                        # écrit data/dqm3.sqlite
+    python export_sqlite.py --output /tmp/dqm3.sqlite
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from dex.sources import charger_sources, empreinte_sources
+from dex.stockage_sqlite import FICHIER_SQLITE, exporter_sqlite
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Export des données vers SQLite")
+    parser.add_argument("--data", default="data", help="Dossier des fichiers JSON")
+    parser.add_argument("--output", default=FICHIER_SQLITE, help="Fichier SQLite à écrire")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    debut = time.perf_counter()
+    
+    try:
+        # Empreinte relevée avant la lecture : un fichier modifié entre les deux rend l'export périmé, jamais l'inverse
+        empreinte = empreinte_sources(args.data)
+        donnees = charger_sources(args.data)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Erreur lors du chargement des fichiers JSON: {e}", file=sys.stderr)
+        return 1
+    
+    exporter_sqlite(donnees, args.output, empreinte)
+    taille = os.path.getsize(args.output) / 1024
+    print(f"Base SQLite écrite dans {args.output} ({taille:.0f} Ko, {time.perf_counter() - debut:.2f}s)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
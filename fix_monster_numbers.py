@@ -5,7 +5,9 @@ Script pour corriger les incohérences entre monster ID et number dans les fichi
 """
 
 import json
-import os
+
+from dex.ecriture import ecrire_json
+from dex.reconciliation import joindre, rapprochement_courant
 
 def load_json_file(filepath):
     """Charge un fichier JSON"""
@@ -17,10 +19,9 @@ def load_json_file(filepath):
         return None
 
 def save_json_file(filepath, data):
-    """Sauvegarde un fichier JSON"""
+    """Sauvegarde un fichier JSON (écriture atomique, archive de l'ancienne version)"""
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        ecrire_json(filepath, data)
         return True
     except Exception as e:
         print(f"Erreur lors de la sauvegarde de {filepath}: {e}")
@@ -45,17 +46,12 @@ def analyze_inconsistencies():
     print(f"Nombre de monstres dans monsters.json: {len(monsters_data)}")
     print(f"Nombre d'entrées dans monster2.json: {len(monster2_data)}")
     
-    # Créer un mapping par nom et identifier pour monster2.json
-    monster2_by_name = {}
-    monster2_by_identifier = {}
-    
-    for monster in monster2_data:
-        if monster.get("Name"):
-            monster2_by_name[monster["Name"].lower()] = monster
-        if monster.get("Identifier"):
-            monster2_by_identifier[monster["Identifier"]] = monster
+    # Rapprochement indexé (crosswalk persisté s'il est à jour, sinon recalculé)
+    rapprochement = rapprochement_courant(monsters_data, monster2_data)
+    correspondances = joindre(rapprochement["crosswalk"], monster2_data)
     
-    print(f"\nMapping créé avec {len(monster2_by_name)} noms et {len(monster2_by_identifier)} identifiants")
+    print(f"\nRapprochement: {len(correspondances)} correspondances, "
+          f"{len(rapprochement['uncertain'])} incertaines, {len(rapprochement['unmatched'])} sans correspondance")
     
     # Analyser les incohérences entre les champs "number"
     inconsistencies = []
@@ -64,13 +60,7 @@ def analyze_inconsistencies():
     for monster_key, monster_data in monsters_data.items():
         current_number = monster_data.get("number")
         monster_name = monster_data.get("name", "")
-        
-        # Chercher par nom d'abord, puis par identifier
-        match = None
-        if monster_name.lower() in monster2_by_name:
-            match = monster2_by_name[monster_name.lower()]
-        elif monster_key in monster2_by_identifier:
-            match = monster2_by_identifier[monster_key]
+        match = correspondances.get(monster_key)
         
         if match:
             matches_found += 1
@@ -83,7 +73,8 @@ def analyze_inconsistencies():
                     "name": monster_name,
                     "current_number": current_number,
                     "correct_number": monster2_number,
-                    "identifier": match.get("Identifier")
+                    "identifier": match.get("Identifier"),
+                    "score": rapprochement["crosswalk"][monster_key]["score"]
                 })
     
     print(f"\nCorrespondances trouvées: {matches_found}")
@@ -96,7 +87,7 @@ def analyze_inconsistencies():
             print(f"  Nom: {inc['name']}")
             print(f"  Number actuel dans monsters.json: {inc['current_number']}")
             print(f"  Number correct dans monster2.json: {inc['correct_number']}")
-            print(f"  Identifier: {inc['identifier']}")
+            print(f"  Identifier: {inc['identifier']} (score {inc['score']})")
             print()
         
         if len(inconsistencies) > 10:
@@ -113,11 +104,7 @@ def fix_inconsistencies(inconsistencies, monsters_data):
     
     print(f"\nCorrection de {len(inconsistencies)} incohérences...")
     
-    # Créer une sauvegarde
-    backup_path = "data/monsters.json.backup"
-    if not os.path.exists(backup_path):
-        print("Création d'une sauvegarde...")
-        save_json_file(backup_path, monsters_data)
+    # La sauvegarde (archive compressée dans data/backups/) est faite à l'écriture
     
     # Appliquer les corrections
     corrections_applied = 0
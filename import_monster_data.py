@@ -5,7 +5,9 @@ Script pour importer les données manquantes de monster2.json vers monsters.json
 """
 
 import json
-import os
+
+from dex.ecriture import ecrire_json
+from dex.etl import description_cible
 
 def load_json_file(filepath):
     """Charge un fichier JSON"""
@@ -17,10 +19,9 @@ def load_json_file(filepath):
         return None
 
 def save_json_file(filepath, data):
-    """Sauvegarde un fichier JSON"""
+    """Sauvegarde un fichier JSON (écriture atomique, archive de l'ancienne version)"""
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        ecrire_json(filepath, data)
         return True
     except Exception as e:
         print(f"Erreur lors de la sauvegarde de {filepath}: {e}")
@@ -114,20 +115,13 @@ def import_monster_data():
             
             # 3. Nom français
             french_name = monster2_entry.get("FrenchName")
-            if french_name and french_name.strip():
-                updates['french_name'] = {'old': None, 'new': french_name}
+            if french_name and french_name.strip() and monster_data.get("french_name") != french_name:
+                updates['french_name'] = {'old': monster_data.get("french_name"), 'new': french_name}
             
-            # 4. Trivia (dans description)
-            trivia = monster2_entry.get("Trivia")
-            current_description = monster_data.get("description") or ""
-            if trivia and trivia.strip():
-                # Ajouter la trivia à la description existante
-                new_description = current_description
-                if current_description and not current_description.endswith('.'):
-                    new_description += ". "
-                elif current_description:
-                    new_description += " "
-                new_description += f"Trivia: {trivia}"
+            # 4. Trivia (dans description, ajoutée une seule fois)
+            current_description = monster_data.get("description")
+            new_description = description_cible(current_description, monster2_entry.get("Trivia"))
+            if new_description != current_description:
                 updates['description'] = {'old': current_description, 'new': new_description}
             
             # 5. Growth stats
@@ -155,8 +149,8 @@ def import_monster_data():
                 if monster2_value is not None:
                     max_stats[monsters_stat] = monster2_value
             
-            if max_stats:
-                updates['max_stats'] = {'old': None, 'new': max_stats}
+            if max_stats and monster_data.get("max_stats") != max_stats:
+                updates['max_stats'] = {'old': monster_data.get("max_stats"), 'new': max_stats}
             
             if updates:
                 updates_needed.append({
@@ -195,11 +189,7 @@ def apply_updates(updates_needed, monsters_data):
     
     print(f"\nApplication de {len(updates_needed)} mises à jour...")
     
-    # Créer une sauvegarde
-    backup_path = "data/monsters.json.backup2"
-    if not os.path.exists(backup_path):
-        print("Création d'une sauvegarde...")
-        save_json_file(backup_path, monsters_data)
+    # La sauvegarde (archive compressée dans data/backups/) est faite à l'écriture
     
     # Appliquer les mises à jour
     updates_applied = 0
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Test de charge local : N sessions Streamlit simultanées (sans navigateur ni service
+externe) qui rejouent des parcours réalistes, réparties sur un ou plusieurs
+processus worker
+
+Parcours : rechercher un monstre et déplier une compétence, ouvrir l'arbre de
+synthèse d'un monstre, filtrer la base de données.
+
+Usage :
+    python loadtest.py --sessions 8                  # 8 sessions dans un worker
+    python loadtest.py --sessions 16 --workers 4     # 4 sessions par worker
+    python loadtest.py --sessions 8 --report -       # rapport JSON sur la sortie standard
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from dex.banc import (centiles, choisir, choisir_page, cliquer, nouvelle_session, rss_kib, rss_max_kib, saisir,
+                      temps_cpu)
+from dex.sources import charger_sources
+
+def parcours_recherche(session, rng, catalogue, mesurer):
+    """Rechercher un monstre puis afficher le détail d'une compétence"""
+    mesurer("recherche.page", choisir_page, session, "Recherche de Monstres")
+    mesurer("recherche.saisie", saisir, session, 0, rng.choice(catalogue["noms"]))
+    if any("Détails" in bouton.label for bouton in session.button):
+        mesurer("recherche.competence", cliquer, session, "Détails")
+
+def parcours_synthese(session, rng, catalogue, mesurer):
+    """Ouvrir l'arbre de synthèse d'un monstre issu de synthèse"""
+    mesurer("synthese.page", choisir_page, session, "Synthèse")
+    mesurer("synthese.saisie", saisir, session, 0, rng.choice(catalogue["synthese"]))
+    mesurer("synthese.arbre", cliquer, session, "Rechercher")
+
+def parcours_base(session, rng, catalogue, mesurer):
+    """Filtrer la base de données par famille puis par nom"""
+    mesurer("base.page", choisir_page, session, "Base de Données")
+    mesurer("base.famille", choisir, session, "Famille", rng.choice(catalogue["familles"]))
+    mesurer("base.nom", saisir, session, 0, rng.choice(catalogue["noms"])[:4])
+
+PARCOURS = [parcours_recherche, parcours_synthese, parcours_base]
+
+def charger_catalogue():
+    """Valeurs saisies par les sessions simulées"""
+    donnees = charger_sources(noms=["monstres", "families"])
+    monstres = [m for m in donnees["monstres"].values() if m.get("name")]
+    return {
+        "noms": [m["name"] for m in monstres],
+        "synthese": [m["name"] for m in monstres if m.get("synthesis")],
+        "familles": ["Tous"] + [f["name"] for f in donnees["families"].values()],
+    }
+
+def simuler_session(indice, iterations, graine, catalogue, latences, erreurs, verrou):
+    """Une session : ouverture de l'application puis `iterations` parcours tirés au hasard"""
+    rng = random.Random(graine)
+    
+    def mesurer(etape, action, *args):
+        debut = time.perf_counter()
+        resultat = action(*args)
+        with verrou:
+            latences.setdefault(etape, []).append((time.perf_counter() - debut) * 1000)
+        return resultat
+    
+    try:
+        session = mesurer("ouverture", nouvelle_session)
+    except Exception as e:
+        with verrou:
+            erreurs.append(f"session {indice} ouverture: {e}")
+        return
+    for _ in range(iterations):
+        parcours = rng.choice(PARCOURS)
+        try:
+            parcours(session, rng, catalogue, mesurer)
+        except Exception as e:
+            with verrou:
+                erreurs.append(f"session {indice} {parcours.__name__}: {e}")
+
+def executer_worker(worker, nb_sessions, iterations, graine):
+    """Un processus worker : `nb_sessions` sessions simultanées (threads)"""
+    catalogue = charger_catalogue()
+    latences, erreurs, verrou = {}, [], threading.Lock()
+    cpu_debut, debut = temps_cpu(), time.perf_counter()
+    with ThreadPoolExecutor(max_workers=nb_sessions) as pool:
+        for i in range(nb_sessions):
+            pool.submit(simuler_session, i, iterations, graine * 1000 + worker * 100 + i, catalogue,
+                        latences, erreurs, verrou)
+    duree = time.perf_counter() - debut
+    cpu = temps_cpu() - cpu_debut
+    return {
+        "worker": worker,
+        "sessions": nb_sessions,
+        "duration_s": round(duree, 3),
+        "cpu_s": round(cpu, 3),
+        "cpu_percent": round(100 * cpu / duree, 1) if duree else None,
+        "rss_kib": rss_kib(),
+        "rss_max_kib": rss_max_kib(),
+        "errors": erreurs,
+        "latencies": latences,
+    }
+
+def agreger(workers, duree):
+    """Centiles de latence par étape et totaux"""
+    latences = {}
+    for worker in workers:
+        for etape, valeurs in worker.pop("latencies").items():
+            latences.setdefault(etape, []).extend(valeurs)
+    etapes = {
+        etape: {"count": len(valeurs), "mean_ms": round(sum(valeurs) / len(valeurs), 3),
+                **{cle: round(v, 1) for cle, v in centiles(valeurs).items()}, "max_ms": round(max(valeurs), 1)}
+        for etape, valeurs in sorted(latences.items())
+    }
+    requetes = sum(len(valeurs) for valeurs in latences.values())
+    return {
+        "duration_s": round(duree, 3),
+        "requests": requetes,
+        "requests_per_s": round(requetes / duree, 2) if duree else None,
+        "errors": sum(len(worker["errors"]) for worker in workers),
+        "steps": etapes,
+        "workers": workers,
+    }
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Test de charge local (sessions Streamlit simultanées)")
+    parser.add_argument("--sessions", type=int, default=4, help="Nombre total de sessions simultanées")
+    parser.add_argument("--workers", type=int, default=1, help="Nombre de processus worker")
+    parser.add_argument("--iterations", type=int, default=3, help="Parcours rejoués par session")
+    parser.add_argument("--seed", type=int, default=0, help="Graine du tirage des parcours")
+    parser.add_argument("--report", help="Écrire le rapport JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    sortie = sys.stderr if args.report == "-" else sys.stdout
+    
+    # Sessions réparties aussi également que possible entre les workers
+    nb_workers = max(1, min(args.workers, args.sessions))
+    repartition = [args.sessions // nb_workers + (1 if w < args.sessions % nb_workers else 0) for w in range(nb_workers)]
+    
+    debut = time.perf_counter()
+    if nb_workers == 1:
+        workers = [executer_worker(0, repartition[0], args.iterations, args.seed)]
+    else:
+        with ProcessPoolExecutor(max_workers=nb_workers) as pool:
+            futures = [pool.submit(executer_worker, w, n, args.iterations, args.seed) for w, n in enumerate(repartition)]
+            workers = [future.result() for future in futures]
+    rapport = agreger(workers, time.perf_counter() - debut)
+    
+    print(f"{args.sessions} session(s), {nb_workers} worker(s) : {rapport['requests']} requêtes en "
+          f"{rapport['duration_s']}s ({rapport['requests_per_s']}/s), {rapport['errors']} erreur(s)", file=sortie)
+    print(f"{'étape':24} {'n':>5} {'p50':>9} {'p90':>9} {'p95':>9} {'p99':>9} {'max':>9}  (ms)", file=sortie)
+    for etape, stats in rapport["steps"].items():
+        print(f"{etape:24} {stats['count']:5} {stats['p50']:9.1f} {stats['p90']:9.1f} {stats['p95']:9.1f} "
+              f"{stats['p99']:9.1f} {stats['max_ms']:9.1f}", file=sortie)
+    for worker in rapport["workers"]:
+        print(f"worker {worker['worker']}: {worker['sessions']} session(s), CPU {worker['cpu_s']}s "
+              f"({worker['cpu_percent']}%), RSS {worker['rss_kib']} Kio (pic {worker['rss_max_kib']} Kio)", file=sortie)
+        for erreur in worker["errors"][:5]:
+            print(f"  ✗ {erreur}", file=sortie)
+    
+    if args.report == "-":
+        json.dump(rapport, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(rapport, f, indent=2, ensure_ascii=False)
+    
+    return 1 if rapport["errors"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rapport d'empreinte mémoire : taille profonde de chaque jeu de données, taille
+sérialisée de chaque jeu (ce que coûterait un cache st.cache_data à chaque lecture),
+images décodées, état de session et sites d'allocation pendant le rendu d'une page
+
+Usage :
+    python memory_report.py
+    python memory_report.py --page "Synthèse" --search "Goonache Goodie" --top 20
+    python memory_report.py --no-page --report -
+"""
+
+import argparse
+import datetime
+import json
+import os
+import pickle
+import sys
+
+from dex import memoire
+from dex.banc import choisir_page, cliquer, nouvelle_session, rss_kib, rss_max_kib, saisir
+from dex.sources import DOSSIER_DONNEES, charger_sources, construire_donnees
+from dex.surveillance import DOSSIERS_IMAGES
+
+def rapport_donnees(dossier):
+    """Tailles en mémoire et sérialisées des sources et des structures dérivées"""
+    sources = charger_sources(dossier)
+    donnees = construire_donnees(sources)
+    tailles = memoire.tailles_donnees(donnees)
+    return {
+        "datasets": {
+            nom: {
+                "deep_bytes": octets,
+                "pickled_bytes": len(pickle.dumps(donnees[nom], pickle.HIGHEST_PROTOCOL)),
+                "derived": nom not in sources,
+            }
+            for nom, octets in tailles["datasets"].items()
+        },
+        "total_deep_bytes": tailles["total"],
+        "total_pickled_bytes": len(pickle.dumps(donnees, pickle.HIGHEST_PROTOCOL)),
+    }
+
+def rapport_images(dossier):
+    """Taille décodée des images de chaque dossier"""
+    return {nom: memoire.taille_images(os.path.join(dossier, nom)) for nom in DOSSIERS_IMAGES
+            if os.path.isdir(os.path.join(dossier, nom))}
+
+def rapport_page(libelle, recherche=None, top=15):
+    """Rendu d'une page dans une session sans navigateur : allocations, caches et état de session"""
+    session = nouvelle_session()
+    choisir_page(session, libelle)
+    if recherche:
+        saisir(session, 0, recherche)
+    # Exécution mesurée (caches déjà remplis, comme pour un utilisateur qui interagit) : le clic sur
+    # « Rechercher » s'il y en a un, le résultat n'étant rendu à coup sûr que pendant l'exécution du clic
+    depart = memoire.demarrer_suivi()
+    if recherche and any("Rechercher" in bouton.label for bouton in session.button):
+        cliquer(session, "Rechercher")
+    else:
+        session.run()
+    allocations = memoire.sites_allocation(depart, top)
+    return {
+        "page": libelle,
+        "search": recherche,
+        "allocations": allocations,
+        "caches": memoire.tailles_caches(),
+        "session_state_bytes": memoire.taille_profonde(session.session_state.to_dict()),
+    }
+
+def afficher(rapport, sortie):
+    """Résumé lisible du rapport"""
+    f = memoire.formater_octets
+    print(f"{'Jeu de données':24} {'en mémoire':>12} {'sérialisé':>12}", file=sortie)
+    for nom, tailles in rapport["data"]["datasets"].items():
+        print(f"{nom + (' *' if tailles['derived'] else ''):24} {f(tailles['deep_bytes']):>12} "
+              f"{f(tailles['pickled_bytes']):>12}", file=sortie)
+    print(f"{'total':24} {f(rapport['data']['total_deep_bytes']):>12} "
+          f"{f(rapport['data']['total_pickled_bytes']):>12}   (* structure dérivée)", file=sortie)
+
+    if rapport["images"]:
+        print(f"\n{'Images':24} {'nombre':>12} {'décodées':>12}", file=sortie)
+        for nom, images in rapport["images"].items():
+            print(f"{nom:24} {images['images']:>12} {f(images['decoded_bytes']):>12}", file=sortie)
+
+    page = rapport.get("page")
+    if page:
+        print(f"\nCaches après le rendu de « {page['page']} »", file=sortie)
+        for cache in page["caches"]:
+            print(f"{cache['cache']:40} {cache['entries']:>4} entrée(s) {f(cache['bytes']):>12}", file=sortie)
+        print(f"État de session : {f(page['session_state_bytes'])}", file=sortie)
+        print(f"\nAllocations pendant le rendu (pic {f(page['allocations']['peak_bytes'])})", file=sortie)
+        for site in page["allocations"]["top"]:
+            print(f"{f(site['bytes']):>12} {site['count']:>8}  {site['site']}", file=sortie)
+
+    print(f"\nRSS : {f((rapport['rss_kib'] or 0) * 1024)} (pic {f((rapport['rss_max_kib'] or 0) * 1024)})", file=sortie)
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Rapport d'empreinte mémoire de l'application")
+    parser.add_argument("--data", default=DOSSIER_DONNEES, help="Dossier des données")
+    parser.add_argument("--page", default="Recherche de Monstres", help="Page rendue pour le suivi des allocations")
+    parser.add_argument("--search", default="Slime", help="Texte saisi dans le premier champ de la page")
+    parser.add_argument("--no-page", action="store_true", help="Sans rendu de page Streamlit")
+    parser.add_argument("--top", type=int, default=15, help="Nombre de sites d'allocation affichés")
+    parser.add_argument("--report", help="Écrire le rapport JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    sortie = sys.stderr if args.report == "-" else sys.stdout
+
+    rapport = {
+        "meta": {"date": datetime.datetime.now().isoformat(timespec="seconds")},
+        "data": rapport_donnees(args.data),
+        "images": rapport_images(args.data),
+    }
+    if not args.no_page:
+        rapport["page"] = rapport_page(args.page, args.search, args.top)
+    rapport["rss_kib"] = rss_kib()
+    rapport["rss_max_kib"] = rss_max_kib()
+
+    afficher(rapport, sortie)
+
+    if args.report == "-":
+        json.dump(rapport, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(rapport, f, indent=2, ensure_ascii=False)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,9 @@
 import streamlit as st
-from PIL import Image
 import os
 
+# Page sans données JSON : l'application n'en charge aucune
+DONNEES = ()
+
 def show():
     st.title("Accueil - Dragon Quest Monsters")
     
@@ -9,8 +11,7 @@ def show():
     if os.path.exists("data/MonsterImages/Slime.1.jpg"):
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            img = Image.open("data/MonsterImages/Slime.1.jpg")
-            st.image(img, width=300, caption="Bienvenue dans le monde de DQM!")
+            st.image("data/MonsterImages/Slime.1.jpg", width=300, caption="Bienvenue dans le monde de DQM!")
     
     st.markdown("""
     ## Bienvenue dans la web app Dragon Quest Monsters!
@@ -1,2 +1,16 @@
-# Pages package
-from . import Accueil as accueil, recherche_monstres, base_donnees, synthese
+# Pages package : modules importés à la demande (`from page import synthese` ou
+# getattr(page, "synthese")), chaque page n'important ses dépendances lourdes
+# (pandas, PIL...) que lorsqu'elle est affichée
+import importlib
+
+# Noms d'import qui diffèrent du fichier du module
+ALIAS = {"accueil": "Accueil"}
+
+def __getattr__(nom):
+    module = f"{__name__}.{ALIAS.get(nom, nom)}"
+    try:
+        return importlib.import_module(module)
+    except ModuleNotFoundError as erreur:
+        if erreur.name != module:
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}") from None
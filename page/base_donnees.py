@@ -1,26 +1,38 @@
+import os
+
 import streamlit as st
 import pandas as pd
+from dex.export_arrow import SOURCES, chemin_table, empreinte_table, lire_table
+from dex.localisation import LANGUE_DEFAUT, cle_recherche
+from dex.matrices import STATS
+from dex.surveillance import empreinte_courante
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("monstres", "families", "resistances", "matrices", "localisation", "integrite")
+
+# Libellés des colonnes, dans l'ordre de dex.matrices.STATS
+STAT_LABELS = ["HP", "MP", "ATK", "DEF", "AGI", "WIS"]
 
-def get_maxstats_for_monster(monster_name, maxstats_data):
-    """Obtenir les statistiques maximales d'un monstre"""
-    if not maxstats_data:
-        print(f"DEBUG: maxstats_data est vide pour {monster_name}")
+@st.cache_resource
+def charger_table_monstres(chemin, mtime):
+    """Table Arrow des monstres mappée en mémoire, partagée entre les sessions"""
+    return lire_table(chemin)
+
+def dataframe_exporte(matrices, lignes):
+    """DataFrame adossé à la table Arrow exportée (sans copie), ou None si absente ou périmée"""
+    chemin = chemin_table("monsters")
+    if not os.path.exists(chemin):
         return None
-    
-    # Debug: afficher les premières entrées
-    if len(maxstats_data) > 0 and isinstance(maxstats_data[0], dict):
-        pass  # Données OK
-    else:
-        print(f"DEBUG: format de maxstats_data incorrect: {type(maxstats_data[0]) if maxstats_data else 'vide'}")
+    table = charger_table_monstres(chemin, os.path.getmtime(chemin))
+    if empreinte_table(table) != empreinte_courante(noms=SOURCES) or table.column("key").to_pylist() != matrices["cles"]:
         return None
     
-    for monster in maxstats_data:
-        if monster["name"].lower() == monster_name.lower():
-            return monster["stats"]
-    
-    # Debug: si pas trouvé
-    print(f"DEBUG: {monster_name} pas trouvé dans maxstats")
-    return None
+    colonnes = {"number": "Numéro", "rank": "Rang", "family_name": "Famille"}
+    colonnes.update({f"growth_{stat}": f"{label} Growth" for stat, label in zip(STATS, STAT_LABELS)})
+    colonnes.update({f"max_{stat}": f"{label} Max" for stat, label in zip(STATS, STAT_LABELS)})
+    df = table.take(lignes).select(list(colonnes)).to_pandas(types_mapper=pd.ArrowDtype).rename(columns=colonnes)
+    df["Famille"] = df["Famille"].fillna("Inconnue")
+    return df
 
 def show(donnees):
     st.title("Base de Données")
@@ -44,53 +56,31 @@ def show(donnees):
     with col3:
         search_name = st.text_input("Recherche par nom")
     
-    # Préparer les données des monstres
-    monsters_data = []
-    for key, monster in donnees["monstres"].items():
-        if monster.get("name"):
-            family_name = donnees["families"].get(monster.get("family", ""), {}).get("name", "Inconnue")
-            growth = monster.get("growth", {})
-            
-            # Obtenir les statistiques maximales
-            maxstats = get_maxstats_for_monster(monster["name"], donnees.get("maxstats", []))
-            
-            monster_data = {
-                "Nom": monster["name"],
-                "Numéro": monster.get("number", "?"),
-                "Rang": monster.get("rank", "?"),
-                "Famille": family_name,
-                "HP Growth": growth.get("hp", "?") if growth else "?",
-                "MP Growth": growth.get("mp", "?") if growth else "?",
-                "ATK Growth": growth.get("atk", "?") if growth else "?",
-                "DEF Growth": growth.get("def", "?") if growth else "?",
-                "AGI Growth": growth.get("agi", "?") if growth else "?",
-                "WIS Growth": growth.get("wis", "?") if growth else "?"
-            }
-            
-            # Ajouter les stats maximales si disponibles
-            if maxstats:
-                monster_data.update({
-                    "HP Max": maxstats.get("hp", "?"),
-                    "MP Max": maxstats.get("mp", "?"),
-                    "ATK Max": maxstats.get("attack", "?"),
-                    "DEF Max": maxstats.get("defense", "?"),
-                    "AGI Max": maxstats.get("agility", "?"),
-                    "WIS Max": maxstats.get("wisdom", "?")
-                })
-            else:
-                monster_data.update({
-                    "HP Max": "?",
-                    "MP Max": "?",
-                    "ATK Max": "?",
-                    "DEF Max": "?",
-                    "AGI Max": "?",
-                    "WIS Max": "?"
-                })
-            
-            monsters_data.append(monster_data)
-    
-    # Créer DataFrame
-    df = pd.DataFrame(monsters_data)
+    # Préparer les données des monstres à partir des matrices colonnaires
+    matrices = donnees["matrices"]
+    lignes = [i for i, key in enumerate(matrices["cles"]) if donnees["monstres"][key].get("name")]
+    monstres_valides = [donnees["monstres"][matrices["cles"][i]] for i in lignes]
+    cles_valides = [matrices["cles"][i] for i in lignes]
+    
+    # Noms et clés de recherche précalculés par langue
+    localisation = donnees["localisation"]
+    langue = st.session_state.get("langue", LANGUE_DEFAUT)
+    
+    # Table exportée (python export_arrow.py) si elle est à jour, sinon construction depuis les matrices
+    df = dataframe_exporte(matrices, lignes)
+    if df is None:
+        df = pd.DataFrame({
+            "Numéro": [monster.get("number", "?") for monster in monstres_valides],
+            "Rang": [monster.get("rank", "?") for monster in monstres_valides],
+            "Famille": [donnees["families"].get(monster.get("family", ""), {}).get("name", "Inconnue") for monster in monstres_valides]
+        })
+        
+        # Colonnes de croissance et de stats maximales (une tranche par matrice)
+        for j, label in enumerate(STAT_LABELS):
+            df[f"{label} Growth"] = matrices["growth"][lignes, j]
+        for j, label in enumerate(STAT_LABELS):
+            df[f"{label} Max"] = matrices["max_stats"][lignes, j]
+    df.insert(0, "Nom", [localisation["noms"][langue]["monstres"][key] for key in cles_valides])
     
     # Appliquer les filtres
     if selected_family != "Tous":
@@ -100,7 +90,13 @@ def show(donnees):
         df = df[df["Rang"] == selected_rank]
     
     if search_name:
-        df = df[df["Nom"].str.contains(search_name, case=False, na=False)]
+        # Recherche sans accents ni casse, sur les noms anglais et traduits
+        recherche = cle_recherche(search_name)
+        cles_filtrees = [cles_valides[i] for i in df.index]
+        masque = [recherche in localisation["cles_noms"]["en"]["monstres"][key]
+                  or recherche in localisation["cles_noms"][langue]["monstres"][key]
+                  for key in cles_filtrees]
+        df = df[masque]
     
     # Afficher les résultats
     st.subheader(f"Résultats ({len(df)} monstres)")
@@ -108,6 +104,8 @@ def show(donnees):
     if len(df) > 0:
         # Options d'affichage
         col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            taille_resistances = st.radio("Résistances", ["Aucune", "Petite taille", "Grande taille"], horizontal=True)
         with col2:
             show_growth = st.checkbox("Stats croissance", value=True)
         with col3:
@@ -124,6 +122,17 @@ def show(donnees):
         if show_maxstats:
             columns_to_show.extend(max_columns)
         
+        # Résistances petite/grande taille : simple tranche de la matrice précalculée
+        if taille_resistances != "Aucune":
+            nom_matrice = "res_large" if taille_resistances == "Grande taille" else "res"
+            res = matrices[nom_matrice][lignes][df.index]
+            resistance_columns = {}
+            for j, res_key in enumerate(matrices["resistances"]):
+                res_name = donnees["resistances"].get(res_key, {}).get("name", res_key)
+                resistance_columns[res_name] = res[:, j]
+            df = df.assign(**resistance_columns)
+            columns_to_show.extend(resistance_columns.keys())
+        
         # Afficher le DataFrame avec les colonnes sélectionnées
         st.dataframe(
             df[columns_to_show],
@@ -0,0 +1,124 @@
+import streamlit as st
+import pandas as pd
+from dex.matrices import tranche
+from dex.localisation import LANGUE_DEFAUT, nom
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("monstres", "talents", "traits", "resistances", "matrices", "localisation")
+
+STAT_LABELS = {"hp": "HP", "mp": "MP", "atk": "ATK", "def": "DEF", "agi": "AGI", "wis": "WIS"}
+TAILLES = {"small": "S", "large": "L"}
+
+# Couleurs de mise en évidence
+COULEUR_MEILLEUR = "background-color: rgba(76, 175, 80, 0.35)"
+COULEUR_PIRE = "background-color: rgba(244, 67, 54, 0.35)"
+COULEUR_DIFFERENCE = "background-color: rgba(255, 193, 7, 0.25)"
+
+def surligner_extremes(ligne):
+    """Meilleure valeur en vert, pire en rouge (rien si toutes égales)"""
+    valeurs = pd.to_numeric(ligne, errors="coerce")
+    if valeurs.isna().all() or valeurs.max() == valeurs.min():
+        return [""] * len(ligne)
+    return [COULEUR_MEILLEUR if v == valeurs.max() else COULEUR_PIRE if v == valeurs.min() else "" for v in valeurs]
+
+def surligner_differences(ligne):
+    """Surligner les lignes qui ne sont pas communes à tous les monstres"""
+    if all(v == ligne.iloc[0] for v in ligne):
+        return [""] * len(ligne)
+    return [COULEUR_DIFFERENCE] * len(ligne)
+
+def libelles_uniques(libelles, cles):
+    """Libellés sans doublon (pandas Styler refuse les index et colonnes non uniques) : clé ajoutée en cas de collision"""
+    nombres = {}
+    for libelle in libelles:
+        nombres[libelle] = nombres.get(libelle, 0) + 1
+    return [f"{libelle} ({cle})" if nombres[libelle] > 1 else libelle for libelle, cle in zip(libelles, cles)]
+
+def tableau_matrice(valeurs, labels, noms):
+    """DataFrame lignes = stats/résistances, colonnes = monstres"""
+    return pd.DataFrame(valeurs.T, index=labels, columns=noms)
+
+def show(donnees):
+    st.title("Comparaison de monstres")
+    
+    st.markdown("Comparez de 2 à 6 monstres côte à côte. Les meilleures valeurs sont en vert, les moins bonnes en rouge.")
+    
+    matrices = donnees["matrices"]
+    localisation = donnees["localisation"]
+    langue = st.session_state.get("langue", LANGUE_DEFAUT)
+    
+    # Noms traduits non uniques (fizzy et nokturnus : « Nokturnus ») : numéro du monstre, puis clé en cas de
+    # collision. Les libellés doivent être uniques pour le sélecteur comme pour les colonnes des tableaux
+    libelles = dict(zip(matrices["cles"], libelles_uniques(
+        [f"{nom(localisation, langue, 'monstres', key)} (#{donnees['monstres'][key].get('number') or '?'})"
+         for key in matrices["cles"]],
+        matrices["cles"])))
+    
+    cles = st.multiselect(
+        "Monstres à comparer",
+        matrices["cles"],
+        max_selections=6,
+        format_func=libelles.get
+    )
+    
+    if len(cles) < 2:
+        st.info("Sélectionnez au moins 2 monstres")
+        return
+    
+    noms = [libelles[key] for key in cles]
+    # Une seule indexation par matrice pour tous les monstres comparés
+    sous_matrices = tranche(matrices, cles)
+    stat_labels = [STAT_LABELS[s] for s in matrices["stats"]]
+    
+    col_max, col_growth = st.columns(2)
+    with col_max:
+        st.subheader("Statistiques maximales")
+        df = tableau_matrice(sous_matrices["max_stats"], stat_labels, noms)
+        st.dataframe(df.style.apply(surligner_extremes, axis=1).format(precision=0), use_container_width=True)
+    with col_growth:
+        st.subheader("Croissance")
+        df = tableau_matrice(sous_matrices["growth"], stat_labels, noms)
+        st.dataframe(df.style.apply(surligner_extremes, axis=1).format(precision=0), use_container_width=True)
+    
+    st.subheader("Résistances")
+    taille = st.radio("Taille", ["Petite", "Grande"], horizontal=True, key="taille_comparaison")
+    res_labels = libelles_uniques([donnees["resistances"].get(r, {}).get("name", r) for r in matrices["resistances"]],
+                                  matrices["resistances"])
+    df = tableau_matrice(sous_matrices["res_large" if taille == "Grande" else "res"], res_labels, noms)
+    st.dataframe(df.style.apply(surligner_extremes, axis=1).format(precision=0), use_container_width=True, height=min(40 + 35 * len(res_labels), 720))
+    
+    # Talents : présence par monstre
+    st.subheader("Talents")
+    talents_par_monstre = [donnees["monstres"][key].get("talents") or [] for key in cles]
+    talent_keys = list(dict.fromkeys(t for talents in talents_par_monstre for t in talents))
+    if talent_keys:
+        df = pd.DataFrame(
+            [["✓" if t in talents else "" for talents in talents_par_monstre] for t in talent_keys],
+            index=libelles_uniques([donnees["talents"].get(t, {}).get("name", t) for t in talent_keys], talent_keys),
+            columns=noms
+        )
+        st.dataframe(df.style.apply(surligner_differences, axis=1), use_container_width=True)
+    else:
+        st.info("Aucun talent")
+    
+    # Traits : niveau par monstre, une ligne par trait et par taille (un trait peut exister dans les deux)
+    st.subheader("Traits")
+    traits_par_monstre = []
+    for key in cles:
+        traits = {}
+        for size in TAILLES:
+            for trait_key, level in ((donnees["monstres"][key].get("traits") or {}).get(size) or {}).items():
+                traits[(trait_key, size)] = f"Niv.{level}"
+        traits_par_monstre.append(traits)
+    trait_keys = list(dict.fromkeys(t for traits in traits_par_monstre for t in traits))
+    if trait_keys:
+        df = pd.DataFrame(
+            [[traits.get(t, "") for traits in traits_par_monstre] for t in trait_keys],
+            index=libelles_uniques(
+                [f"{donnees['traits'].get(t, {}).get('name', t)} ({TAILLES[size]})" for t, size in trait_keys],
+                [f"{t} ({TAILLES[size]})" for t, size in trait_keys]),
+            columns=noms
+        )
+        st.dataframe(df.style.apply(surligner_differences, axis=1), use_container_width=True)
+    else:
+        st.info("Aucun trait")
@@ -0,0 +1,92 @@
+import streamlit as st
+import pandas as pd
+from dex.localisation import LANGUE_DEFAUT, nom
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("talents", "skills", "traits", "index", "localisation")
+
+TAILLES = {"small": "Petite", "large": "Grande"}
+
+def nom_monstre(key, donnees):
+    """Nom d'affichage d'un monstre à partir de sa clé"""
+    return nom(donnees["localisation"], st.session_state.get("langue", LANGUE_DEFAUT), "monstres", key)
+
+def nom_talent(key, donnees):
+    """Nom d'affichage d'un talent à partir de sa clé"""
+    return donnees["talents"].get(key, {}).get("name", key)
+
+def afficher_competence(skill_key, donnees):
+    """Afficher les talents et monstres qui apprennent une compétence"""
+    index = donnees["index"]
+    skill = donnees["skills"].get(skill_key, {})
+    
+    if skill.get("description"):
+        st.info(skill["description"])
+    st.write(f"**Type :** {skill.get('type', 'Inconnu')} | **MP :** {skill.get('mp_cost', '?')}")
+    
+    st.write("**Talents :**")
+    for entree in index["skill_talents"].get(skill_key, []):
+        st.write(f"• {nom_talent(entree['talent'], donnees)} (Niveau {entree['niveau']})")
+    
+    entrees = index["skill_monstres"].get(skill_key, [])
+    st.subheader(f"Monstres ({len(entrees)})")
+    if entrees:
+        st.dataframe(pd.DataFrame([{
+            "Monstre": nom_monstre(e["monstre"], donnees),
+            "Talent": nom_talent(e["talent"], donnees),
+            "Niveau": e["niveau"]
+        } for e in entrees]), use_container_width=True, hide_index=True)
+    else:
+        st.info("Aucun monstre ne possède de talent avec cette compétence")
+
+def afficher_trait(trait_key, donnees):
+    """Afficher les monstres qui possèdent un trait (propre ou via un talent)"""
+    index = donnees["index"]
+    trait = donnees["traits"].get(trait_key, {})
+    
+    if trait.get("description"):
+        st.info(trait["description"])
+    
+    propres = index["trait_monstres"].get(trait_key, [])
+    st.subheader(f"Monstres avec ce trait ({len(propres)})")
+    if propres:
+        st.dataframe(pd.DataFrame([{
+            "Monstre": nom_monstre(e["monstre"], donnees),
+            "Taille": TAILLES.get(e["taille"], e["taille"]),
+            "Niveau": e["niveau"]
+        } for e in propres]), use_container_width=True, hide_index=True)
+    else:
+        st.info("Aucun monstre ne possède ce trait directement")
+    
+    via_talents = index["trait_talent_monstres"].get(trait_key, [])
+    if via_talents:
+        st.subheader(f"Obtenu via un talent ({len(via_talents)})")
+        st.dataframe(pd.DataFrame([{
+            "Monstre": nom_monstre(e["monstre"], donnees),
+            "Talent": nom_talent(e["talent"], donnees),
+            "Paliers": ", ".join(str(n) for n in e["niveaux"])
+        } for e in via_talents]), use_container_width=True, hide_index=True)
+
+def show(donnees):
+    st.title("Compétences & Traits")
+    
+    st.markdown("Retrouvez quels monstres apprennent une compétence ou possèdent un trait.")
+    
+    index = donnees["index"]
+    tab_skills, tab_traits = st.tabs(["Compétences", "Traits"])
+    
+    with tab_skills:
+        skill_keys = sorted(index["skill_talents"].keys(),
+                            key=lambda k: donnees["skills"].get(k, {}).get("name", k))
+        skill_key = st.selectbox("Compétence", skill_keys,
+                                 format_func=lambda k: donnees["skills"].get(k, {}).get("name", k))
+        if skill_key:
+            afficher_competence(skill_key, donnees)
+    
+    with tab_traits:
+        trait_keys = sorted(set(index["trait_monstres"]) | set(index["trait_talent_monstres"]),
+                            key=lambda k: donnees["traits"].get(k, {}).get("name", k))
+        trait_key = st.selectbox("Trait", trait_keys,
+                                 format_func=lambda k: donnees["traits"].get(k, {}).get("name", k))
+        if trait_key:
+            afficher_trait(trait_key, donnees)
@@ -0,0 +1,63 @@
+import streamlit as st
+import pandas as pd
+from dex.equipe import optimiser_equipe
+from dex.localisation import LANGUE_DEFAUT, nom
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("resistances", "matrices", "localisation")
+
+def show(donnees):
+    st.title("Optimiseur d'équipe")
+    
+    st.markdown("Trouvez les équipes dont les résistances combinées couvrent les éléments de l'ennemi.")
+    
+    matrices = donnees["matrices"]
+    
+    # Paramètres de la recherche
+    elements = st.multiselect(
+        "Éléments à couvrir",
+        matrices["resistances"],
+        format_func=lambda r: donnees["resistances"].get(r, {}).get("name", r)
+    )
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        taille = st.selectbox("Taille de l'équipe", [3, 4])
+    with col2:
+        seuil = st.selectbox("Résistance minimale", [25, 50, 75, 100], index=1,
+                             help="Un élément est couvert si au moins un membre atteint cette résistance")
+    with col3:
+        nb_equipes = st.number_input("Nombre d'équipes", min_value=1, max_value=20, value=5)
+    with col4:
+        grande_taille = st.checkbox("Grande taille", value=False,
+                                    help="Appliquer le bonus de résistance des grands monstres")
+    
+    if st.button("Optimiser", type="primary", disabled=not elements):
+        with st.spinner("Recherche des meilleures équipes..."):
+            resultat = optimiser_equipe(
+                matrices, elements, taille=taille, nb_equipes=int(nb_equipes), seuil=seuil,
+                grande_taille=grande_taille
+            )
+        
+        if not resultat["complet"]:
+            st.warning("Budget de temps atteint : meilleures équipes trouvées jusqu'ici.")
+        st.caption(f"Recherche effectuée en {resultat['duree'] * 1000:.0f} ms")
+        
+        if not resultat["equipes"]:
+            st.info("Aucune équipe trouvée.")
+        
+        for i, equipe in enumerate(resultat["equipes"], start=1):
+            langue = st.session_state.get("langue", LANGUE_DEFAUT)
+            noms = [nom(donnees["localisation"], langue, "monstres", key) for key in equipe["membres"]]
+            st.subheader(f"Équipe {i} : {' + '.join(noms)}")
+            st.write(f"**Éléments couverts :** {equipe['couverts']}/{len(elements)} | **Résistance totale :** {equipe['total']}")
+            
+            # Résistances de chaque membre sur les éléments demandés
+            rows = []
+            for key, nom_membre in zip(equipe["membres"], noms):
+                row = {"Monstre": nom_membre}
+                for element, valeur in equipe["resistances"][key].items():
+                    row[donnees["resistances"].get(element, {}).get("name", element)] = valeur
+                rows.append(row)
+            st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+            st.markdown("---")
@@ -2,6 +2,15 @@ import streamlit as st
 import json
 import os
 from urllib.parse import quote, unquote
+from dex.localisation import LANGUE_DEFAUT, nom as nom_localise
+from dex.catalogue import TOUTES_CATEGORIES, construire_catalogue, filtrer_catalogue, paginer
+from dex.sources import DOSSIER_DONNEES
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("items", "catalogue", "index", "monstres", "localisation")
+
+# Nombre d'objets rendus par page (budget fixe de widgets)
+OBJETS_PAR_PAGE = 24
 
 def charger_donnees():
     """Charger les données des objets depuis le fichier JSON"""
@@ -15,7 +24,41 @@ def charger_donnees():
         st.error("Erreur lors du chargement du fichier items.json")
         return {}
 
-def afficher_objet_detail(item_key, item_data):
+def chemin_image_monstre(nom, dossier_donnees=DOSSIER_DONNEES):
+    """Chemin de l'image d'un monstre (None si absente)"""
+    for variation in [nom, nom.replace(' ', '_'), nom.replace('-', '_'), nom.replace(' ', '_').replace('-', '_')]:
+        img_path = os.path.join(dossier_donnees, "MonsterImages", f"{variation}.1.jpg")
+        if os.path.exists(img_path):
+            return img_path
+    return None
+
+def afficher_sources_objet(item_key, donnees):
+    """Afficher les monstres qui lâchent un objet (drop normal et rare) avec leurs vignettes"""
+    sources = donnees["index"]["drops"].get(item_key)
+    st.write("**Monstres qui lâchent cet objet :**")
+    if not sources:
+        st.info("Aucun monstre connu ne lâche cet objet")
+        return
+    
+    for rarete, label in [("normal", "Drop normal"), ("rare", "Drop rare")]:
+        monster_keys = sources[rarete]
+        if not monster_keys:
+            continue
+        st.write(f"*{label} ({len(monster_keys)})*")
+        cols_per_row = 6
+        for i in range(0, len(monster_keys), cols_per_row):
+            cols = st.columns(cols_per_row)
+            for j, monster_key in enumerate(monster_keys[i:i + cols_per_row]):
+                with cols[j]:
+                    nom = donnees["monstres"].get(monster_key, {}).get("name", monster_key)
+                    nom_affiche = nom_localise(donnees["localisation"], st.session_state.get("langue", LANGUE_DEFAUT), "monstres", monster_key)
+                    img_path = chemin_image_monstre(nom)
+                    if img_path:
+                        st.image(img_path, width=70, caption=nom_affiche)
+                    else:
+                        st.caption(nom_affiche)
+
+def afficher_objet_detail(item_key, item_data, donnees=None):
     """Afficher les détails d'un objet"""
     item_name = item_data.get("name", item_key)
     st.subheader(f"📦 {item_name}")
@@ -29,16 +72,20 @@ def afficher_objet_detail(item_key, item_data):
     if "type" in item_data:
         st.write(f"**Type :** {item_data['type']}")
     
+    # Sources de l'objet (index inversé des drops)
+    if donnees is not None:
+        afficher_sources_objet(item_key, donnees)
+    
     # Retour à la liste
     if st.button("🔙 Retour à la liste des objets"):
         st.session_state.selected_item = None
         st.rerun()
 
-def main():
+def main(donnees=None):
     st.title("📦 Base de données des objets")
     
-    # Charger les données
-    items_data = charger_donnees()
+    # Charger les données (déjà en cache si fournies par l'application)
+    items_data = donnees["items"] if donnees is not None else charger_donnees()
     
     if not items_data:
         return
@@ -58,70 +105,52 @@ def main():
     if st.session_state.selected_item:
         item_key = st.session_state.selected_item
         if item_key in items_data:
-            afficher_objet_detail(item_key, items_data[item_key])
+            afficher_objet_detail(item_key, items_data[item_key], donnees)
             return
         else:
             st.error(f"Objet '{item_key}' introuvable")
             st.session_state.selected_item = None
     
-    # Organiser les objets par catégorie
-    categories = {}
-    for item_key, item_data in items_data.items():
-        category = item_data.get("type", "Autres")
-        if category not in categories:
-            categories[category] = []
-        categories[category].append((item_key, item_data))
-    
-    # Trier les catégories
-    sorted_categories = sorted(categories.keys())
+    # Tri et regroupement par catégorie précalculés au chargement
+    catalogue = donnees["catalogue"] if donnees is not None else construire_catalogue(items_data)
     
     # Afficher le sélecteur de catégorie
     selected_category = st.selectbox(
         "Choisir une catégorie :",
-        ["Toutes les catégories"] + sorted_categories
+        [TOUTES_CATEGORIES] + catalogue["categories_triees"]
     )
     
     # Barre de recherche
     search_term = st.text_input("🔍 Rechercher un objet :", placeholder="Nom de l'objet...")
     
-    # Filtrer et afficher les objets
-    if selected_category == "Toutes les catégories":
-        items_to_show = []
-        for category, items in categories.items():
-            items_to_show.extend(items)
-    else:
-        items_to_show = categories.get(selected_category, [])
-    
-    # Appliquer le filtre de recherche
-    if search_term:
-        items_to_show = [
-            (key, data) for key, data in items_to_show
-            if search_term.lower() in data.get("name", key).lower()
-        ]
+    # Filtrer les objets (clés déjà triées par nom)
+    items_to_show = filtrer_catalogue(catalogue, selected_category, search_term)
     
-    # Trier par nom
-    items_to_show.sort(key=lambda x: x[1].get("name", x[0]))
+    # Revenir à la première page quand les filtres changent
+    filtres = (selected_category, search_term)
+    if st.session_state.get("filtres_objets") != filtres:
+        st.session_state.filtres_objets = filtres
+        st.session_state.page_objets = 1
     
     # Afficher les résultats
     if items_to_show:
+        items_page, page, nb_pages = paginer(items_to_show, st.session_state.get("page_objets", 1), OBJETS_PAR_PAGE)
         st.write(f"**{len(items_to_show)} objet(s) trouvé(s)**")
         
-        # Afficher les objets en colonnes
+        # Afficher seulement les objets de la page courante, en colonnes
         cols = st.columns(3)
-        for i, (item_key, item_data) in enumerate(items_to_show):
+        for i, item_key in enumerate(items_page):
             with cols[i % 3]:
                 # Créer une carte pour chaque objet
+                item_data = items_data[item_key]
                 item_name = item_data.get("name", item_key)
                 category = item_data.get("type", "Autres")
-                description = item_data.get("description", "Aucune description disponible")
-                
-                # Limiter la longueur de la description affichée
-                short_description = description[:100] + "..." if len(description) > 100 else description
+                short_description = catalogue["resumes"][item_key]
                 
                 # Bouton pour sélectionner l'objet
                 if st.button(
                     f"📦 {item_name}",
-                    key=f"item_{i}",
+                    key=f"item_{item_key}",
                     help=short_description
                 ):
                     st.session_state.selected_item = item_key
@@ -131,6 +160,20 @@ def main():
                 st.caption(f"**{category}**")
                 st.caption(short_description)
                 st.markdown("---")
+        
+        # Navigation entre les pages
+        if nb_pages > 1:
+            col_prev, col_page, col_next = st.columns([1, 2, 1])
+            with col_prev:
+                if st.button("◀ Précédent", disabled=page <= 1):
+                    st.session_state.page_objets = page - 1
+                    st.rerun()
+            with col_page:
+                st.write(f"Page {page} / {nb_pages}")
+            with col_next:
+                if st.button("Suivant ▶", disabled=page >= nb_pages):
+                    st.session_state.page_objets = page + 1
+                    st.rerun()
     else:
         if search_term:
             st.warning(f"Aucun objet trouvé pour '{search_term}'")
@@ -141,8 +184,8 @@ def main():
     with st.expander("📊 Statistiques"):
         st.write(f"**Total des objets :** {len(items_data)}")
         st.write("**Objets par catégorie :**")
-        for category, items in sorted(categories.items()):
-            st.write(f"- {category}: {len(items)} objets")
+        for category in catalogue["categories_triees"]:
+            st.write(f"- {category}: {len(catalogue['categories'][category])} objets")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,78 @@
+import streamlit as st
+import pandas as pd
+from dex.projection import NIVEAU_MAX, classement, exposants
+from dex.localisation import LANGUE_DEFAUT, nom
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("monstres", "families", "matrices", "localisation")
+
+STAT_LABELS = {"hp": "HP", "mp": "MP", "atk": "ATK", "def": "DEF", "agi": "AGI", "wis": "WIS"}
+
+def entier_ou_inconnu(valeur):
+    """Valeur entière, "?" si manquante (NaN)"""
+    return "?" if valeur != valeur else int(valeur)
+
+def show(donnees):
+    st.title("Projection des statistiques")
+    
+    st.markdown("Estimation des statistiques de chaque monstre à un niveau donné, à partir de sa croissance et plafonnée par ses stats maximales.")
+    
+    matrices = donnees["matrices"]
+    
+    # Exposants de la courbe calculés une fois par état des données (recalculés après un rechargement)
+    croissance, exposants_courbe = st.session_state.get("projection_exposants", (None, None))
+    if croissance is not matrices["growth"]:
+        exposants_courbe = exposants(matrices)
+        st.session_state.projection_exposants = (matrices["growth"], exposants_courbe)
+    
+    col1, col2, col3 = st.columns([2, 1, 1])
+    
+    with col1:
+        niveau = st.slider("Niveau", 1, NIVEAU_MAX, 50)
+    
+    with col2:
+        stat = st.selectbox("Statistique", list(STAT_LABELS.keys()), index=2, format_func=lambda s: STAT_LABELS[s])
+    
+    with col3:
+        top_n = st.number_input("Nombre de monstres", min_value=5, max_value=100, value=20, step=5)
+    
+    # Filtres optionnels (masques booléens sur les colonnes famille / rang)
+    col1, col2 = st.columns(2)
+    families_list = ["Tous"] + list(donnees["families"].keys())
+    ranks_list = ["Tous"] + sorted(set(r for r in matrices["rangs"] if r))
+    
+    with col1:
+        selected_family = st.selectbox("Famille", families_list,
+                                       format_func=lambda f: donnees["families"].get(f, {}).get("name", f))
+    with col2:
+        selected_rank = st.selectbox("Rang", ranks_list)
+    
+    masque = None
+    if selected_family != "Tous":
+        masque = matrices["familles"] == selected_family
+    if selected_rank != "Tous":
+        masque_rang = matrices["rangs"] == selected_rank
+        masque = masque_rang if masque is None else masque & masque_rang
+    
+    resultats = classement(matrices, niveau, stat, int(top_n), masque, exposants_courbe)
+    
+    st.subheader(f"Top {len(resultats)} - {STAT_LABELS[stat]} au niveau {niveau}")
+    
+    if resultats:
+        j = matrices["stat_index"][stat]
+        rows = []
+        for rang_classement, (key, valeur) in enumerate(resultats, start=1):
+            monster = donnees["monstres"][key]
+            i = matrices["index"][key]
+            rows.append({
+                "#": rang_classement,
+                "Nom": nom(donnees["localisation"], st.session_state.get("langue", LANGUE_DEFAUT), "monstres", key),
+                "Rang": monster.get("rank") or "?",
+                "Famille": donnees["families"].get(monster.get("family", ""), {}).get("name", "Inconnue"),
+                f"{STAT_LABELS[stat]} Niv.{niveau}": int(valeur),
+                f"{STAT_LABELS[stat]} Max": entier_ou_inconnu(matrices["max_stats"][i, j]),
+                "Croissance": entier_ou_inconnu(matrices["growth"][i, j])
+            })
+        st.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
+    else:
+        st.warning("Aucun monstre trouvé avec ces filtres.")
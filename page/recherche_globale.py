@@ -0,0 +1,43 @@
+import streamlit as st
+from dex.recherche import rechercher
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("monstres", "skills", "traits", "items", "recherche")
+
+# Type de document -> (libellé, jeu de données)
+TYPES = {
+    "monstre": ("Monstre", "monstres"),
+    "skill": ("Compétence", "skills"),
+    "trait": ("Trait", "traits"),
+    "objet": ("Objet", "items")
+}
+
+def show(donnees):
+    st.title("Recherche globale")
+    
+    st.markdown("Recherchez dans les noms et descriptions des monstres, compétences, traits et objets.")
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        requete = st.text_input("Rechercher", placeholder="Ex: frizzle, restores hp, tactical...")
+    with col2:
+        types = st.multiselect("Types", list(TYPES.keys()), default=list(TYPES.keys()),
+                               format_func=lambda t: TYPES[t][0])
+    
+    if not requete:
+        st.info("Entrez un ou plusieurs mots pour lancer la recherche")
+        return
+    
+    resultats = rechercher(donnees["recherche"], requete, n=30, types=set(types))
+    
+    st.subheader(f"Résultats ({len(resultats)})")
+    if not resultats:
+        st.warning(f"Aucun résultat pour '{requete}'")
+        return
+    
+    for resultat in resultats:
+        label, dataset = TYPES[resultat["type"]]
+        description = donnees[dataset].get(resultat["key"], {}).get("description") or "Aucune description disponible"
+        short_description = description[:200] + "..." if len(description) > 200 else description
+        st.markdown(f"`{label}` **{resultat['name']}**")
+        st.caption(short_description)
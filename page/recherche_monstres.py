@@ -5,6 +5,15 @@ import base64
 from io import BytesIO
 from urllib.parse import quote
 import json
+from dex.matrices import resistances_monstre
+from page.objets import afficher_sources_objet
+from dex.localisation import LANGUE_DEFAUT, nom, trouver_cle
+from dex.voisins import monstres_similaires
+from dex.chrono import etape, mesurer
+
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("monstres", "families", "maxstats", "talents", "skills", "traits", "resistances", "matrices",
+           "localisation", "voisins", "index")
 
 def get_maxstats(monstre_name, maxstats_data):
     """Obtenir les statistiques maximales d'un monstre"""
@@ -58,7 +67,7 @@ def creer_lien_objet(item_name):
         return f'<span style="color: #1f77b4; text-decoration: underline; cursor: pointer;" onclick="console.log(\'{item_name}\')">{item_name} 🔗</span>'
     return item_name
 
-def afficher_objet_detail(item_key):
+def afficher_objet_detail(item_key, donnees=None):
     """Afficher les détails d'un objet avec le format des résistances"""
     items_data = charger_items()
     if item_key in items_data:
@@ -82,6 +91,10 @@ def afficher_objet_detail(item_key):
             st.info(item_data["description"])
         else:
             st.info("Aucune description disponible")
+        
+        # Monstres qui lâchent cet objet
+        if donnees is not None:
+            afficher_sources_objet(item_key, donnees)
     else:
         st.error(f"Objet '{item_key}' introuvable")
     
@@ -141,7 +154,7 @@ def get_traits_info(monstre, traits_db):
     traits_info = {"small": [], "large": []}
     
     for size in ["small", "large"]:
-        if size in monstre.get("traits", {}):
+        if size in (monstre.get("traits") or {}):
             traits_data = monstre["traits"][size]
             if traits_data is not None:
                 for trait_key, level in traits_data.items():
@@ -190,6 +203,7 @@ def get_synthesis_info(monstre, families, monstres):
     
     return f"Synthèse: {synthesis}", []
 
+@mesurer("images")
 def afficher_image_monstre(nom):
     """Afficher l'image d'un monstre"""
     # Essayer plusieurs variations du nom de fichier
@@ -207,6 +221,7 @@ def afficher_image_monstre(nom):
     
     return None
 
+@mesurer("images")
 def get_family_icon(family_key):
     """Obtenir l'icône d'une famille"""
     if not family_key:
@@ -221,6 +236,7 @@ def get_family_icon(family_key):
     
     return None
 
+@mesurer("images")
 def get_rank_icon(rank):
     """Obtenir l'icône d'un rang"""
     if not rank:
@@ -232,6 +248,7 @@ def get_rank_icon(rank):
     
     return None
 
+@mesurer("images")
 def get_resistance_icon(resistance_key):
     """Obtenir l'icône d'une résistance"""
     if not resistance_key:
@@ -282,7 +299,7 @@ def show(donnees):
     # Vérifier si on doit afficher les détails d'un objet
     if 'show_item_page' in st.session_state and st.session_state.show_item_page:
         if 'selected_item' in st.session_state and st.session_state.selected_item:
-            afficher_objet_detail(st.session_state.selected_item)
+            afficher_objet_detail(st.session_state.selected_item, donnees)
             return
     
     # Initialiser la session state pour la recherche
@@ -295,7 +312,7 @@ def show(donnees):
     with col1:
         nom_monstre = st.text_input("Nom du monstre", 
                                    value=st.session_state.search_query,
-                                   placeholder="Ex: Slime, Goonache Goodie...")
+                                   placeholder="Ex: Slime, Gluant, Goonache Goodie...")
         # Mettre à jour la session state si l'utilisateur tape quelque chose
         if nom_monstre != st.session_state.search_query:
             st.session_state.search_query = nom_monstre
@@ -305,27 +322,33 @@ def show(donnees):
         rechercher = st.button("Rechercher", type="primary")
     
     if nom_monstre and (rechercher or nom_monstre):
-        monstre = get_monstre(nom_monstre, donnees["monstres"])
+        etape("recherche")
+        # Recherche par nom anglais ou français (accents et casse ignorés)
+        monstre_key = trouver_cle(donnees["localisation"], "monstres", nom_monstre)
+        monstre = donnees["monstres"].get(monstre_key) if monstre_key else None
         
         if not monstre:
             st.error(f"Monstre '{nom_monstre}' non trouvé.")
             st.info("Essayez avec un nom exact, par exemple: 'Slime', 'Goonache Goodie', 'Shell Slime'")
             return
         
+        nom_affiche = nom(donnees["localisation"], st.session_state.get("langue", LANGUE_DEFAUT), "monstres", monstre_key)
+        
         # Colonnes pour l'affichage
+        etape("en-tête")
         col_img, col_info = st.columns([1, 2])
         
         # Image du monstre
         with col_img:
             img = afficher_image_monstre(monstre["name"])
             if img:
-                st.image(img, width=250, caption=monstre["name"])
+                st.image(img, width=250, caption=nom_affiche)
             else:
                 st.info("Image non disponible")
         
         # Informations générales
         with col_info:
-            st.subheader(f"{monstre['name']}")
+            st.subheader(f"{nom_affiche}")
             
             # Informations de base avec icônes en ligne
             family_key = monstre.get("family", "")
@@ -382,6 +405,7 @@ def show(donnees):
                 st.write(monstre['description'])
 
         # Statistiques - Max à gauche, Croissance à droite
+        etape("statistiques")
         col_stats_max, col_stats_growth = st.columns(2)
         
         with col_stats_max:
@@ -425,6 +449,7 @@ def show(donnees):
                 st.info("Données de croissance non disponibles")
         
         # Talents et Skills
+        etape("talents")
         st.subheader("Talents et Compétences")
         talent_details = get_skills(monstre, donnees["talents"], donnees["skills"])
         if talent_details:
@@ -463,6 +488,7 @@ def show(donnees):
             st.info("Aucun talent disponible")
         
         # Traits
+        etape("traits")
         st.subheader("Traits")
         traits_info = get_traits_info(monstre, donnees["traits"])
         
@@ -487,8 +513,12 @@ def show(donnees):
                 st.info("Aucun trait large")
         
         # Résistances
+        etape("résistances")
         st.subheader("Résistances")
-        resistances = monstre.get("resistances", {})
+        taille = st.radio("Taille", ["Petite", "Grande"], horizontal=True, key="taille_resistances",
+                          help="Les grands monstres gagnent un bonus sur certaines résistances")
+        # Vecteurs précalculés au chargement (petite et grande taille)
+        resistances = resistances_monstre(donnees["matrices"], monstre_key, grande_taille=(taille == "Grande"))
         if resistances is not None:
             # Organiser les résistances en deux colonnes
             resistance_items = list(resistances.items())
@@ -572,6 +602,7 @@ def show(donnees):
             st.info("Données de résistances non disponibles")
         
         # Drops
+        etape("drops")
         st.subheader("Drops")
         drops = monstre.get("drops", {})
         if drops is not None:
@@ -609,6 +640,7 @@ def show(donnees):
             st.info("Aucun drop disponible")
         
         # Synthèse
+        etape("synthèse")
         st.subheader("Informations de synthèse")
         synthesis_info, synthesis_items = get_synthesis_info(monstre, donnees["families"], donnees["monstres"])
         
@@ -617,6 +649,26 @@ def show(donnees):
             show_synthesis_images(synthesis_items, donnees["families"])
         else:
             st.info("Aucune synthèse disponible")
+        
+        # Monstres similaires (voisins précalculés au chargement)
+        etape("similaires")
+        st.subheader("Monstres similaires")
+        similaires = monstres_similaires(donnees["voisins"], donnees["matrices"], monstre_key, k=5)
+        if similaires:
+            cols = st.columns(len(similaires))
+            for i, (similaire_key, similarite) in enumerate(similaires):
+                similaire = donnees["monstres"][similaire_key]
+                with cols[i]:
+                    img = afficher_image_monstre(similaire["name"])
+                    if img:
+                        st.image(img, width=100)
+                    st.caption(f"Similarité : {similarite:.0%}")
+                    if st.button(nom(donnees["localisation"], st.session_state.get("langue", LANGUE_DEFAUT), "monstres", similaire_key),
+                                 key=f"similaire_{similaire_key}"):
+                        st.session_state.search_query = similaire["name"]
+                        st.rerun()
+        else:
+            st.info("Aucun monstre similaire")
     
     else:
         # Page d'aide quand aucune recherche
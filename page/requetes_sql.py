@@ -0,0 +1,68 @@
+import os
+import sqlite3
+from contextlib import closing
+
+import streamlit as st
+import pandas as pd
+from dex.surveillance import empreinte_courante
+from dex.stockage_sqlite import EXEMPLES, FICHIER_SQLITE, meta, ouvrir_lecture, rechercher_texte, requete
+
+# Page sans données JSON : l'application n'en charge aucune
+DONNEES = ()
+
+# Libellés des jeux de données de la table FTS5
+DATASETS = {"monstres": "Monstre", "skills": "Compétence", "traits": "Trait", "items": "Objet"}
+
+def show():
+    st.title("Requêtes SQL")
+    
+    st.markdown("Interrogez la base SQLite exportée (lecture seule) : filtres, jointures et recherche plein texte.")
+    
+    if not os.path.exists(FICHIER_SQLITE):
+        st.info(f"Base SQLite absente. Générez-la avec `python export_sqlite.py` ({FICHIER_SQLITE}).")
+        return
+    
+    # Connexion propre à chaque exécution de la page (pas de partage entre sessions ni entre threads)
+    with closing(ouvrir_lecture(FICHIER_SQLITE)) as conn:
+        afficher(conn)
+
+def afficher(conn):
+    """Contenu de la page sur une connexion ouverte"""
+    infos = meta(conn)
+    st.caption(f"Construite le {infos.get('built', '?')} — empreinte des sources {infos.get('sources_sha1', '?')}")
+    if infos.get("sources_sha1") != empreinte_courante():
+        st.warning("La base ne correspond plus aux fichiers de données actuels : relancez `python export_sqlite.py`.")
+    
+    tab_texte, tab_sql = st.tabs(["Recherche plein texte", "Requête SQL"])
+    
+    with tab_texte:
+        texte = st.text_input("Rechercher", placeholder="Ex: gluant, fire breath...")
+        if texte:
+            resultats = rechercher_texte(conn, texte, n=30)
+            if resultats:
+                st.dataframe(pd.DataFrame([{"Type": DATASETS.get(dataset, dataset), "Clé": key, "Nom": name}
+                                           for dataset, key, name in resultats]),
+                             use_container_width=True, hide_index=True)
+            else:
+                st.warning(f"Aucun résultat pour '{texte}'")
+    
+    with tab_sql:
+        exemple = st.selectbox("Exemples", list(EXEMPLES.keys()))
+        sql = st.text_area("Requête (SELECT uniquement)", value=EXEMPLES[exemple], height=160)
+        
+        if st.button("Exécuter"):
+            try:
+                colonnes, lignes = requete(conn, sql)
+            except (sqlite3.Error, ValueError) as e:
+                st.error(f"Erreur : {e}")
+            else:
+                st.caption(f"{len(lignes)} ligne(s) (1000 au maximum)")
+                st.dataframe(pd.DataFrame(lignes, columns=colonnes), use_container_width=True, hide_index=True)
+        
+        with st.expander("Schéma"):
+            tables = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'search_%' ORDER BY name"
+            ).fetchall()
+            for (table,) in tables:
+                colonnes = [ligne[1] for ligne in conn.execute(f"PRAGMA table_info('{table}')")]
+                st.markdown(f"**{table}** : {', '.join(colonnes)}")
@@ -1,7 +1,14 @@
 import streamlit as st
 from PIL import Image
 import os
+from dex.localisation import LANGUE_DEFAUT, nom, trouver_cle
+from dex.chrono import etape, mesurer, section
+from dex.synthese import etapes_synthese, get_synthesis_tree
 
+# Jeux de données lus par la page (chargés par l'application avec leurs dépendances)
+DONNEES = ("monstres", "families", "localisation")
+
+@mesurer("images")
 def afficher_image_monstre(nom):
     """Afficher l'image d'un monstre"""
     # Essayer plusieurs variations du nom de fichier
@@ -19,88 +26,14 @@ def afficher_image_monstre(nom):
     
     return None
 
-def get_synthesis_tree(monster_key, donnees, visited=None, depth=0):
-    """Obtenir l'arbre de synthèse complet d'un monstre"""
-    if visited is None:
-        visited = set()
-    
-    # Éviter les boucles infinies
-    if monster_key in visited or depth > 5:
-        return None
-    
-    visited.add(monster_key)
-    
-    monster = donnees["monstres"].get(monster_key)
-    if not monster:
-        return None
-    
-    tree = {
-        "key": monster_key,
-        "name": monster.get("name", monster_key),
-        "rank": monster.get("rank", "?"),
-        "synthesis": monster.get("synthesis"),
-        "parents": []
-    }
-    
-    # Si ce monstre a des parents (synthèse), les ajouter récursivement
-    synthesis = monster.get("synthesis")
-    if synthesis and isinstance(synthesis, list):
-        for combination in synthesis:
-            if isinstance(combination, list):
-                parent_combination = []
-                for parent_key in combination:
-                    if parent_key.startswith("_"):
-                        # C'est une famille
-                        family_name = donnees["families"].get(parent_key, {}).get("name", parent_key)
-                        parent_combination.append({
-                            "key": parent_key,
-                            "name": f"{family_name} (Famille)",
-                            "rank": "Famille",
-                            "is_family": True,
-                            "parents": []
-                        })
-                    else:
-                        # C'est un monstre spécifique
-                        parent_tree = get_synthesis_tree(parent_key, donnees, visited.copy(), depth + 1)
-                        if parent_tree:
-                            parent_combination.append(parent_tree)
-                
-                if parent_combination:
-                    tree["parents"].append(parent_combination)
-    
-    return tree
-
-def afficher_arbre_synthese_inverse(tree, donnees, etape_counter=None):
+def afficher_arbre_synthese_inverse(tree, donnees):
     """Afficher l'arbre de synthèse dans l'ordre chronologique (parents -> enfant)"""
-    if not tree:
-        return
-    
-    # Initialiser le compteur d'étapes si c'est le premier appel
-    if etape_counter is None:
-        etape_counter = {"count": 1}
-    
-    # D'abord afficher les parents (récursivement)
-    if tree["parents"]:
-        # Vérifier si cette combinaison nécessite seulement des familles
-        has_only_families = True
-        for combination in tree["parents"]:
-            for parent in combination:
-                if not parent.get("is_family", False) and parent.get("parents"):
-                    has_only_families = False
-                    break
-            if not has_only_families:
-                break
-        
-        # Afficher les étapes parents d'abord (seulement si ce ne sont pas que des familles)
-        if not has_only_families:
-            for comb_idx, combination in enumerate(tree["parents"]):
-                for parent_idx, parent in enumerate(combination):
-                    afficher_arbre_synthese_inverse(parent, donnees, etape_counter)
-    
-    # Ensuite afficher le monstre actuel
-    etape_actuelle = etape_counter["count"]
-    etape_counter["count"] += 1
-    
+    # Même ordre des étapes que l'export statique et l'API
+    for etape_actuelle, noeud in enumerate(etapes_synthese(tree), start=1):
+        afficher_etape_synthese(noeud, etape_actuelle)
+
+def afficher_etape_synthese(tree, etape_actuelle):
+    """Afficher une étape du plan de synthèse (capture ou synthèse d'un monstre)"""
     # Créer un identifiant unique
     unique_id = f"step_{etape_actuelle}_{tree['key']}"
     
@@ -253,30 +186,32 @@ def show(donnees):
         st.write("")  # Espacement
         search_synthesis = st.button("Rechercher", type="primary")
     
+    # Recherche gardée dans la session : le plan reste affiché aux exécutions suivantes
+    # (bouton « Voir détails », filtre par rang...) tant que le texte saisi ne change pas
     if target_monster and search_synthesis:
-        # Rechercher le monstre cible
-        target = None
-        target_key = None
-        for key, monster in donnees["monstres"].items():
-            if monster.get("name", "").lower() == target_monster.lower():
-                target = monster
-                target_key = key
-                break
+        st.session_state["synthese_recherche"] = target_monster
+    
+    if target_monster and st.session_state.get("synthese_recherche") == target_monster:
+        etape("recherche")
+        # Rechercher le monstre cible (nom anglais ou français)
+        target_key = trouver_cle(donnees["localisation"], "monstres", target_monster)
+        target = donnees["monstres"].get(target_key) if target_key else None
         
         if target:
-            st.success(f"Synthèse trouvée pour {target['name']}")
+            nom_affiche = nom(donnees["localisation"], st.session_state.get("langue", LANGUE_DEFAUT), "monstres", target_key)
+            st.success(f"Synthèse trouvée pour {nom_affiche}")
             
             # Afficher l'image du monstre cible
             col1, col2 = st.columns([1, 3])
             with col1:
                 img = afficher_image_monstre(target["name"])
                 if img:
-                    st.image(img, width=150, caption=f"{target['name']} (Rang {target.get('rank', '?')})")
+                    st.image(img, width=150, caption=f"{nom_affiche} (Rang {target.get('rank', '?')})")
                 else:
                     st.info("Image non disponible")
             
             with col2:
-                st.write(f"**Nom:** {target['name']}")
+                st.write(f"**Nom:** {nom_affiche}")
                 st.write(f"**Rang:** {target.get('rank', '?')}")
                 st.write(f"**Famille:** {donnees['families'].get(target.get('family', ''), {}).get('name', 'Inconnue')}")
                 if target.get("description"):
@@ -285,7 +220,8 @@ def show(donnees):
             st.markdown("---")
             
             # Obtenir et afficher l'arbre de synthèse complet
-            synthesis_tree = get_synthesis_tree(target_key, donnees)
+            with section("calcul de l'arbre"):
+                synthesis_tree = get_synthesis_tree(target_key, donnees)
             
             if synthesis_tree and synthesis_tree["parents"]:
                 st.subheader("Arbre de synthèse complet")
@@ -293,9 +229,11 @@ def show(donnees):
                 
                 # Afficher l'arbre
                 st.write("**Plan de synthèse étape par étape :**")
-                afficher_arbre_synthese_inverse(synthesis_tree, donnees)
+                with section("affichage de l'arbre"):
+                    afficher_arbre_synthese_inverse(synthesis_tree, donnees)
                 
                 # Résumé des monstres de base nécessaires
+                etape("monstres de base")
                 st.subheader("Résumé - Monstres de base nécessaires")
                 base_monsters = set()
                 
@@ -329,6 +267,7 @@ def show(donnees):
             st.error(f"Monstre '{target_monster}' non trouvé.")
     
     # Liste des synthèses disponibles
+    etape("liste des synthèses")
     st.subheader("📋 Synthèses disponibles")
     
     synthesis_data = []
@@ -372,6 +311,7 @@ def show(donnees):
         st.write("**Cliquez sur un monstre pour voir son arbre de synthèse complet**")
         
         # Affichage en grille
+        etape("grille des synthèses")
         cols_per_row = 3
         for i in range(0, len(synthesis_data), cols_per_row):
             cols = st.columns(cols_per_row)
@@ -415,10 +355,12 @@ def show(donnees):
                     break
             
             if target_key:
-                synthesis_tree = get_synthesis_tree(target_key, donnees)
+                with section("calcul de l'arbre"):
+                    synthesis_tree = get_synthesis_tree(target_key, donnees)
                 if synthesis_tree:
                     st.write("📋 **Plan de synthèse étape par étape :**")
-                    afficher_arbre_synthese_inverse(synthesis_tree, donnees)
+                    with section("affichage de l'arbre"):
+                        afficher_arbre_synthese_inverse(synthesis_tree, donnees)
                     
                     if st.button("❌ Fermer l'arbre"):
                         del st.session_state['show_tree_for']
@@ -429,6 +371,7 @@ def show(donnees):
         st.warning("Aucune synthèse disponible dans la base de données.")
     
     # Guide de synthèse
+    etape("guide")
     with st.expander("❓ Guide de synthèse"):
         st.markdown("""
         ### Comment fonctionne la synthèse ?
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Profil de démarrage : imports (python -X importtime) et durée du premier rendu de
+chaque page, chaque page étant mesurée dans un processus neuf
+
+Le premier rendu est celui de l'accueil (démarrage à froid) ; la page demandée est
+ensuite sélectionnée, et seuls les imports déclenchés par ce second rendu lui sont
+attribués.
+
+Usage :
+    python profile_imports.py                       # toutes les pages
+    python profile_imports.py --page "Synthèse" --top 10
+    python profile_imports.py --app /autre/arbre/app.py --report -
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+from dex.banc import FICHIER_APP
+
+# Modules dont la présence après un rendu est signalée
+MODULES_LOURDS = ["pandas", "numpy", "PIL", "pyarrow"]
+
+MARQUEUR = "#profil "
+
+# Exécuté dans le processus mesuré : marqueurs sur stderr, entrelacés avec les lignes d'importtime
+SCRIPT = """
+import json, os, sys, time
+from streamlit.testing.v1 import AppTest
+os.chdir(os.path.dirname(os.path.abspath({app!r})))
+def marquer(etape, debut):
+    sys.stderr.write({marqueur!r} + json.dumps({{"step": etape, "ms": (time.perf_counter() - debut) * 1000,
+                                               "heavy": [m for m in {lourds!r} if m in sys.modules]}}) + "\\n")
+    sys.stderr.flush()
+marquer("outils", time.perf_counter())
+session = AppTest.from_file({app!r}, default_timeout=120)
+debut = time.perf_counter()
+session.run()
+marquer("accueil", debut)
+page = {page!r}
+if page:
+    selecteur = next(s for s in session.sidebar.selectbox if s.label == "Choisir une page")
+    selecteur.set_value(next(o for o in selecteur.options if page in o))
+    debut = time.perf_counter()
+    session.run()
+    marquer("page", debut)
+if session.exception:
+    raise SystemExit(session.exception[0].value)
+"""
+
+LIGNE_IMPORT = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+def libelles_pages(app):
+    """Libellés du sélecteur de page, lus dans le dictionnaire `pages` de l'application"""
+    with open(app, encoding="utf-8") as f:
+        bloc = re.search(r"^pages = \{(.*?)^\}", f.read(), re.S | re.M).group(1)
+    return re.findall(r'"([^"]+)":', bloc)
+
+def analyser(stderr, top):
+    """Imports et durées de chaque étape à partir de la sortie d'importtime"""
+    etapes, imports = [], []
+    for ligne in stderr.splitlines():
+        if ligne.startswith(MARQUEUR):
+            etape = json.loads(ligne[len(MARQUEUR):])
+            racines = {}
+            # Imports de premier niveau (les modules imbriqués sont inclus dans leur temps cumulé)
+            for nom, cumule in imports:
+                racine = nom.split(".")[0]
+                racines[racine] = racines.get(racine, 0) + cumule
+            etapes.append({
+                "step": etape["step"],
+                "render_ms": round(etape["ms"], 1),
+                "import_ms": round(sum(racines.values()) / 1000, 1),
+                "heavy_modules": etape["heavy"],
+                "top_imports": [{"module": nom, "ms": round(us / 1000, 1)}
+                                for nom, us in sorted(racines.items(), key=lambda r: -r[1])[:top]],
+            })
+            imports = []
+            continue
+        correspondance = LIGNE_IMPORT.match(ligne)
+        if correspondance and not correspondance.group(3):
+            imports.append((correspondance.group(4), int(correspondance.group(2))))
+    return {etape.pop("step"): etape for etape in etapes}
+
+def profiler(app, page=None, top=8):
+    """Profil d'un processus neuf : démarrage (accueil) puis page demandée"""
+    script = SCRIPT.format(app=app, page=page or "", marqueur=MARQUEUR, lourds=MODULES_LOURDS)
+    resultat = subprocess.run([sys.executable, "-X", "importtime", "-c", script], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+    if resultat.returncode:
+        raise RuntimeError(resultat.stderr.strip().splitlines()[-1])
+    etapes = analyser(resultat.stderr, top)
+    etapes.pop("outils", None)
+    return etapes
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Profil des imports et du premier rendu des pages")
+    parser.add_argument("--app", default=FICHIER_APP, help="Script Streamlit profilé (par défaut app.py de ce dépôt)")
+    parser.add_argument("--page", help="Ne profiler que la page dont le libellé contient ce texte")
+    parser.add_argument("--top", type=int, default=8, help="Nombre d'imports les plus coûteux affichés")
+    parser.add_argument("--report", help="Écrire les résultats JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    sortie = sys.stderr if args.report == "-" else sys.stdout
+    app = os.path.abspath(args.app)
+
+    # L'accueil est la page par défaut : son profil est celui du démarrage
+    libelles = [l for l in libelles_pages(app) if not args.page or args.page in l]
+    resultats = {}
+    for libelle in libelles:
+        etapes = profiler(app, None if "Accueil" in libelle else libelle, args.top)
+        resultats[libelle] = etapes.get("page") or etapes["accueil"]
+        resultats[libelle]["cold_start"] = "page" not in etapes
+        mesure = resultats[libelle]
+        print(f"{libelle:28} rendu {mesure['render_ms']:8.0f} ms   imports {mesure['import_ms']:7.0f} ms   "
+              f"lourds: {', '.join(mesure['heavy_modules']) or '-'}", file=sortie)
+        for entree in mesure["top_imports"]:
+            print(f"{'':30}{entree['ms']:8.1f} ms  {entree['module']}", file=sortie)
+
+    if args.report == "-":
+        json.dump(resultats, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(resultats, f, indent=2, ensure_ascii=False)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Rapprochement de monster2.json avec monsters.json et persistance du crosswalk
+
+Usage :
+    python reconcile_monsters.py               # résumé et correspondances incertaines
+    python reconcile_monsters.py --write       # écrit data/crosswalk.json
+    python reconcile_monsters.py --report -    # résultat JSON sur la sortie standard
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from dex.ecriture import ecrire_json
+from dex.reconciliation import FICHIER_CROSSWALK, reconcilier
+
+def load_json_file(filepath):
+    """Charge un fichier JSON"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Rapprochement de monster2.json avec monsters.json")
+    parser.add_argument("--monsters", default="data/monsters.json", help="Fichier des monstres (monsters.json)")
+    parser.add_argument("--source", default="data/monster2.json", help="Fichier source (monster2.json)")
+    parser.add_argument("--output", default=FICHIER_CROSSWALK, help="Fichier du crosswalk")
+    parser.add_argument("--write", action="store_true", help="Écrire le crosswalk (sinon simulation)")
+    parser.add_argument("--report", help="Écrire le résultat JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    debut = time.perf_counter()
+    
+    try:
+        monsters_data = load_json_file(args.monsters)
+        monster2_data = load_json_file(args.source)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Erreur lors du chargement des fichiers JSON: {e}", file=sys.stderr)
+        return 1
+    
+    rapprochement = reconcilier(monsters_data, monster2_data)
+    duree = round(time.perf_counter() - debut, 4)
+    
+    if args.write:
+        # Fichier dérivé absent des exports : pas de nouvelle version des données
+        ecrire_json(args.output, rapprochement, versionner=False)
+    
+    sortie_resume = sys.stderr if args.report == "-" else sys.stdout
+    resume = rapprochement["summary"]
+    print(f"{resume['matched']}/{resume['monsters']} monstre(s) rapproché(s), {resume['uncertain']} incertain(s), "
+          f"{resume['unmatched']} sans correspondance ({'écrit' if args.write else 'simulation'}, {duree}s)",
+          file=sortie_resume)
+    for key in rapprochement["uncertain"]:
+        lien = rapprochement["crosswalk"][key]
+        print(f"  ? {key} -> {lien['identifier']} (score {lien['score']}, {lien['method']})", file=sortie_resume)
+    for key in rapprochement["unmatched"]:
+        print(f"  ✗ {key}", file=sortie_resume)
+    
+    if args.report == "-":
+        json.dump(rapprochement, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(rapprochement, f, indent=2, ensure_ascii=False)
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
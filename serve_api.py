@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API JSON locale en lecture seule (monstres, requêtes filtrées, plans de synthèse,
+recherches inverses) pour les outils qui ne passent pas par Streamlit
+
+Usage :
+    python serve_api.py                             # http://127.0.0.1:8600
+    curl -s "http://127.0.0.1:8600/monsters/Slime%20Knight/synthesis?lang=en"
+    curl -s "http://127.0.0.1:8600/monsters?rank=S&min_atk=800&sort=-atk&limit=5"
+    python serve_api.py --bench 20000 --connections 32 --report -   # débit en local
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from dex.api import HOTE, PORT, creer_api, demarrer
+from dex.banc import centiles, rss_kib
+from dex.sources import DOSSIER_DONNEES
+
+# Mélange de requêtes du banc : (poids, gabarit de chemin)
+MELANGE = [
+    (4, "/monsters/{monstre}"),
+    (2, "/monsters/{monstre}/synthesis"),
+    (1, "/monsters/{monstre}/used-in"),
+    (1, "/monsters?rank={rang}&sort=-atk&limit=20"),
+    (1, "/items/{objet}"),
+    (1, "/search?q={mot}"),
+]
+
+async def client(hote, port, chemins, latences, etags):
+    """Connexion persistante qui envoie ses requêtes une à une (revalidation par ETag)"""
+    lecteur, ecrivain = await asyncio.open_connection(hote, port)
+    try:
+        for chemin in chemins:
+            entetes = f"GET {chemin} HTTP/1.1\r\nHost: {hote}\r\nAccept-Encoding: gzip\r\n"
+            if chemin in etags:
+                entetes += f"If-None-Match: {etags[chemin]}\r\n"
+            debut = time.perf_counter()
+            ecrivain.write((entetes + "\r\n").encode("latin-1"))
+            tete = (await lecteur.readuntil(b"\r\n\r\n")).decode("latin-1")
+            champs = dict(l.split(": ", 1) for l in tete.split("\r\n")[1:] if ": " in l)
+            await lecteur.readexactly(int(champs.get("Content-Length", 0)))
+            latences.append((time.perf_counter() - debut) * 1000)
+            if "ETag" in champs:
+                etags[chemin] = champs["ETag"]
+    finally:
+        ecrivain.close()
+
+async def banc(api, nb_requetes, nb_connexions, graine=0):
+    """Débit et latences sur un serveur lancé dans ce processus (port libre)"""
+    serveur = await demarrer(api, HOTE, 0)
+    port = serveur.sockets[0].getsockname()[1]
+    donnees = api["donnees"]
+    rng = random.Random(graine)
+    valeurs = {
+        "monstre": [m.get("name") or k for k, m in donnees["monstres"].items()],
+        "rang": ["S", "A", "B", "C", "D,E", "F,G"],
+        "objet": list(donnees["items"]),
+        "mot": ["slime", "fire", "heal", "dragon", "metal", "sleep"],
+    }
+    poids, gabarits = zip(*MELANGE)
+    chemins = []
+    for gabarit in rng.choices(gabarits, poids, k=nb_requetes):
+        champs = {nom: rng.choice(liste) for nom, liste in valeurs.items()}
+        chemins.append(gabarit.format(**{k: v.replace(" ", "%20") for k, v in champs.items()}))
+
+    latences, etags = [], {}
+    debut = time.perf_counter()
+    async with serveur:
+        await asyncio.gather(*[client(HOTE, port, chemins[i::nb_connexions], latences, etags)
+                               for i in range(nb_connexions)])
+    duree = time.perf_counter() - debut
+    return {
+        "requests": nb_requetes,
+        "connections": nb_connexions,
+        "distinct_paths": len(set(chemins)),
+        "seconds": round(duree, 3),
+        "requests_per_second": round(nb_requetes / duree),
+        "latency_ms": centiles(latences),
+        "cached_responses": len(api["reponses"]),
+        "rss_kib": rss_kib(),
+    }
+
+async def servir(api, hote, port):
+    serveur = await demarrer(api, hote, port)
+    print(f"API en écoute sur http://{hote}:{port}/ (Ctrl+C pour arrêter)", file=sys.stderr)
+    async with serveur:
+        await serveur.serve_forever()
+
+def parse_args(argv=None):
+    """Arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="API JSON locale en lecture seule sur les données du guide")
+    parser.add_argument("--host", default=HOTE, help="Adresse d'écoute")
+    parser.add_argument("--port", type=int, default=PORT, help="Port d'écoute")
+    parser.add_argument("--data", default=DOSSIER_DONNEES, help="Dossier des données")
+    parser.add_argument("--bench", type=int, metavar="N", help="Mesurer le débit sur N requêtes au lieu de servir")
+    parser.add_argument("--connections", type=int, default=16, help="Connexions simultanées du banc")
+    parser.add_argument("--report", help="Écrire le résultat du banc en JSON dans ce fichier ('-' pour la sortie standard)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Fonction principale"""
+    args = parse_args(argv)
+    sortie = sys.stderr if args.report == "-" else sys.stdout
+    api = creer_api(args.data)
+
+    if not args.bench:
+        try:
+            asyncio.run(servir(api, args.host, args.port))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    resultat = asyncio.run(banc(api, args.bench, args.connections))
+    latences = resultat["latency_ms"]
+    print(f"{resultat['requests']} requêtes ({resultat['distinct_paths']} chemins distincts) sur "
+          f"{resultat['connections']} connexions en {resultat['seconds']} s : "
+          f"{resultat['requests_per_second']} req/s", file=sortie)
+    print("Latence : " + "   ".join(f"{niveau} {valeur:.2f} ms" for niveau, valeur in latences.items()), file=sortie)
+
+    if args.report == "-":
+        json.dump(resultat, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+    elif args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(resultat, f, indent=2, ensure_ascii=False)
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Tests des routes de l'API JSON (dex.api), sur les données du dépôt"""
+
+import asyncio
+import gzip
+import json
+import os
+
+import pytest
+
+from dex.api import ROUTES, creer_api, demarrer, reponse, router, traiter
+
+DOSSIER_DONNEES = os.path.join(os.path.dirname(__file__), "..", "data")
+
+
+@pytest.fixture(scope="module")
+def api():
+    return creer_api(DOSSIER_DONNEES)
+
+
+@pytest.mark.parametrize("cible", [
+    "/talents/does-not-exist",
+    "/families/nope",
+    "/monsters?family=nope",
+    "/monsters?talent=typo_here",
+])
+def test_noms_inconnus_introuvables(api, cible):
+    statut, contenu = router(api, cible)
+    assert statut == 404 and "introuvable" in contenu["error"]
+
+
+def test_resolution_par_cle_ou_par_nom(api):
+    for cible in ["/families/_slime", "/families/Slime", "/families/slime"]:
+        statut, contenu = router(api, cible)
+        assert (statut, contenu["key"]) == (200, "_slime")
+    statut, contenu = router(api, "/talents/Frizz%20Afficionado")
+    assert (statut, contenu["key"]) == (200, "frizz_afficionado")
+
+
+def requete(api, cible, methode="GET", **entetes):
+    """(statut, en-têtes, corps) de la réponse HTTP de traiter"""
+    brut = traiter(api, methode, cible, {nom.replace("_", "-"): valeur for nom, valeur in entetes.items()}, True)
+    tete, _, corps = brut.partition(b"\r\n\r\n")
+    premiere, *lignes = tete.decode("latin-1").split("\r\n")
+    return int(premiere.split(" ")[1]), dict(ligne.split(": ", 1) for ligne in lignes), corps
+
+
+def test_statuts(api):
+    statut, contenu = router(api, "/monsters/Slime%20Knight")
+    assert (statut, contenu["key"]) == (200, "slime_knight")
+    assert router(api, "/monsters?rank=S&sort=-atk&limit=3")[1]["limit"] == 3
+    assert router(api, "/monsters?limit=abc")[0] == 400
+    assert router(api, "/monsters/slime?lang=xx")[0] == 400
+    assert router(api, "/nowhere")[0] == 404
+    assert requete(api, "/monsters/slime", methode="POST")[0] == 405
+
+
+def test_revalidation_etag(api):
+    statut, entetes, corps = requete(api, "/monsters/slime")
+    assert statut == 200 and json.loads(corps)["key"] == "slime"
+    assert int(entetes["Content-Length"]) == len(corps)
+
+    statut, entetes_304, corps = requete(api, "/monsters/slime", if_none_match=entetes["ETag"])
+    assert (statut, corps) == (304, b"")
+    assert entetes_304["ETag"] == entetes["ETag"]
+    assert "Content-Length" not in entetes_304 and "Content-Type" not in entetes_304
+    # ETag périmé : réponse complète
+    assert requete(api, "/monsters/slime", if_none_match='"perime"')[0] == 200
+    # HEAD : mêmes en-têtes, sans corps
+    statut, entetes_head, corps = requete(api, "/monsters/slime", methode="HEAD")
+    assert (statut, corps) == (200, b"") and entetes_head["ETag"] == entetes["ETag"]
+
+
+def test_gzip(api):
+    cible = "/monsters?sort=-atk&limit=50"
+    statut, entetes, corps = requete(api, cible, accept_encoding="br, gzip")
+    assert statut == 200 and entetes["Content-Encoding"] == "gzip" and entetes["ETag"].endswith('-gzip"')
+    assert json.loads(gzip.decompress(corps))["limit"] == 50
+
+    # Le 304 répète l'ETag de la version gzip
+    statut, entetes_304, _ = requete(api, cible, accept_encoding="gzip", if_none_match=entetes["ETag"])
+    assert statut == 304 and entetes_304["ETag"] == entetes["ETag"]
+
+    # q=0 refuse gzip : corps non compressé
+    for refus in ["gzip;q=0", "identity", "*;q=0"]:
+        statut, entetes, corps = requete(api, cible, accept_encoding=refus)
+        assert "Content-Encoding" not in entetes and json.loads(corps)["limit"] == 50
+    # Petites réponses jamais compressées
+    assert "Content-Encoding" not in requete(api, "/health", accept_encoding="gzip")[1]
+
+
+def test_erreur_interne_et_cache(api, monkeypatch):
+    # Une KeyError dans une route est une erreur interne, pas une entrée introuvable
+    def route_cassee(donnees, params, langue, texte):
+        return {}["rank"]
+    monkeypatch.setitem(ROUTES, ("items", None), route_cassee)
+    statut, contenu = router(api, "/items/anything")
+    assert statut == 500 and contenu["error"].startswith("KeyError")
+
+    # Seules les réponses 200 des données restent en cache
+    for cible in ["/items/anything", "/families/nope", "/health"]:
+        reponse(api, cible)
+        assert cible not in api["reponses"]
+    reponse(api, "/families/_slime")
+    assert "/families/_slime" in api["reponses"]
+
+
+def echanger(api, requete):
+    """Envoie une requête brute au serveur et lit tout jusqu'à la fermeture (délai de 5 s)"""
+    async def scenario():
+        serveur = await demarrer(api, "127.0.0.1", 0)
+        port = serveur.sockets[0].getsockname()[1]
+        try:
+            lecteur, ecrivain = await asyncio.open_connection("127.0.0.1", port)
+            ecrivain.write(requete)
+            await ecrivain.drain()
+            donnees = await asyncio.wait_for(lecteur.read(), 5)
+            ecrivain.close()
+            return donnees
+        finally:
+            serveur.close()
+            await serveur.wait_closed()
+    return asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("entete,statut", [
+    (b"Content-Length: -5", b"400"),
+    (b"Content-Length: abc", b"400"),
+    (b"Content-Length: 1000000000", b"413"),
+    (b"Transfer-Encoding: chunked", b"501"),
+])
+def test_corps_refuses(api, entete, statut):
+    # Le corps n'est pas lu : la connexion est fermée sans traiter la requête suivante pipelinée
+    reponses = echanger(api, b"GET /health HTTP/1.1\r\nHost: x\r\n" + entete + b"\r\n\r\n"
+                             b"5\r\nGET /\r\n0\r\n\r\nGET /health HTTP/1.1\r\nHost: x\r\n\r\n")
+    assert reponses.startswith(b"HTTP/1.1 " + statut)
+    assert b"Connection: close" in reponses
+    assert reponses.count(b"HTTP/1.1") == 1
+
+
+def test_connexion_persistante(api):
+    reponses = echanger(api, b"GET /health HTTP/1.1\r\nHost: x\r\n\r\n"
+                             b"GET /health HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+    assert reponses.count(b"HTTP/1.1 200") == 2
@@ -0,0 +1,37 @@
+"""Tests des mesures de rendu par section (dex.chrono)"""
+
+import time
+
+from dex import chrono
+
+
+def test_sections_imbriquees_sans_double_compte():
+    chrono.demarrer("test")
+    chrono.etape("page")
+    with chrono.section("arbre"):
+        time.sleep(0.02)
+        with chrono.section("images"):
+            time.sleep(0.02)
+    time.sleep(0.01)
+    mesures = chrono.terminer(fichier=None)
+
+    sections = mesures["sections"]
+    assert sections["images"]["ms"] == sections["images"]["self_ms"] >= 20
+    assert sections["arbre"]["ms"] >= 40
+    assert 20 <= sections["arbre"]["self_ms"] < sections["arbre"]["ms"] - 15
+    assert 10 <= sections["page"]["self_ms"] < sections["page"]["ms"] - 35
+    # Les temps propres s'additionnent sans dépasser la durée de l'exécution
+    assert sum(s["self_ms"] for s in sections.values()) <= mesures["total_ms"]
+
+
+def test_fonction_mesuree_et_inactif():
+    @chrono.mesurer("calcul")
+    def calcul(n):
+        return n * 2
+
+    chrono.demarrer("test")
+    assert [calcul(i) for i in range(3)] == [0, 2, 4]
+    assert chrono.terminer(fichier=None)["sections"]["calcul"]["calls"] == 3
+
+    chrono.demarrer("test", actif=False)
+    assert calcul(2) == 4 and chrono.terminer(fichier=None) is None
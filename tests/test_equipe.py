@@ -0,0 +1,67 @@
+"""Tests de l'optimiseur d'équipe (dex.equipe)"""
+
+import itertools
+
+import numpy as np
+
+from dex import equipe
+
+ELEMENTS = ["fire", "ice", "wind", "earth", "dark"]
+
+
+def matrices_aleatoires(n=14, graine=0):
+    """Matrices minimales (résistances seulement) de n monstres"""
+    rng = np.random.default_rng(graine)
+    res = rng.choice([-25.0, 0.0, 25.0, 50.0, 100.0], size=(n, len(ELEMENTS)))
+    res[3] = np.nan  # résistances inconnues : jamais candidat
+    return {
+        "cles": [f"m{i}" for i in range(n)],
+        "resistance_index": {e: j for j, e in enumerate(ELEMENTS)},
+        "res": res,
+        "res_large": res + 25,
+    }
+
+
+def force_brute(matrices, taille, seuil, nb_equipes):
+    """Scores de toutes les équipes, triés (référence de l'élagage)"""
+    res = matrices["res"]
+    lignes = [i for i in range(len(res)) if not np.isnan(res[i]).all()]
+    scores = []
+    for membres in itertools.combinations(lignes, taille):
+        valeurs = res[list(membres)]
+        couverts = int(((valeurs >= seuil).any(axis=0)).sum())
+        scores.append(couverts * equipe.POIDS_COUVERTURE + int(valeurs.sum()))
+    return sorted(scores, reverse=True)[:nb_equipes]
+
+
+def score(resultat_equipe):
+    return resultat_equipe["couverts"] * equipe.POIDS_COUVERTURE + resultat_equipe["total"]
+
+
+def test_optimum_identique_a_la_force_brute():
+    matrices = matrices_aleatoires()
+    resultat = equipe.optimiser_equipe(matrices, ELEMENTS, taille=3, nb_equipes=5, seuil=50, processus=1)
+    assert resultat["complet"]
+    assert [score(e) for e in resultat["equipes"]] == force_brute(matrices, 3, 50, 5)
+    assert all("m3" not in e["membres"] for e in resultat["equipes"])
+
+
+def test_masque_et_grande_taille():
+    matrices = matrices_aleatoires()
+    masque = np.array([i % 2 == 0 for i in range(len(matrices["cles"]))])
+    resultat = equipe.optimiser_equipe(matrices, ELEMENTS, taille=2, masque=masque, grande_taille=True, processus=1)
+    membres = {m for e in resultat["equipes"] for m in e["membres"]}
+    assert membres and all(int(m[1:]) % 2 == 0 for m in membres)
+    premiere = resultat["equipes"][0]
+    assert premiere["meilleures_resistances"] == {
+        el: max(premiere["resistances"][m][el] for m in premiere["membres"]) for el in ELEMENTS}
+
+
+def test_moins_de_candidats_que_la_taille():
+    matrices = matrices_aleatoires(n=4)
+    assert equipe.optimiser_equipe(matrices, ELEMENTS, taille=4, processus=1)["equipes"] == []
+
+
+def test_pool_reutilise_entre_les_optimisations():
+    assert equipe.pool_processus(2) is equipe.pool_processus(2)
+    assert equipe.pool_processus(2) is not equipe.pool_processus(3)
@@ -0,0 +1,53 @@
+"""Tests de l'import incrémental monster2.json -> monsters.json (dex.etl)"""
+
+import copy
+
+from dex import etl
+
+
+def sources():
+    monsters = {
+        "slime": {"name": "Slime", "number": 1, "rank": "G", "family": "_slime",
+                  "description": "A blob.", "growth": {"hp": 1, "mp": 1}},
+        "dracky": {"name": "Dracky", "number": 2, "rank": "G", "family": "_nature", "description": "Bat."},
+        "orphelin": {"name": "Orphan", "number": 99, "description": "Absent de monster2."},
+    }
+    monster2 = [
+        {"MonsterId": 10, "Name": "Slime", "Identifier": "slime", "Number": 1, "RankId": 1, "FamilyId": 1, "FrenchName": "Gluant",
+         "Trivia": "Loves to bounce.", "HP": 2, "MaxHP": 900},
+        {"MonsterId": 11, "Name": "Dracky", "Identifier": "dracky", "Number": 2, "RankId": 2, "FamilyId": 3, "Trivia": ""},
+    ]
+    return monsters, monster2
+
+
+def test_description_cible_idempotente():
+    une_fois = etl.description_cible("A blob.", "Loves to bounce.")
+    assert une_fois == "A blob. Trivia: Loves to bounce."
+    assert etl.description_cible(une_fois, "Loves to bounce.") == une_fois
+    # Trivia déjà présente dans la description : rien n'est ajouté
+    assert etl.description_cible("A blob. Loves to bounce.", "Loves to bounce.") == "A blob. Loves to bounce."
+    # Séparateur "?." de l'ancien script d'import corrigé
+    assert etl.description_cible("Who?.", "") == "Who?"
+
+
+def test_plan_limite_aux_champs_modifies():
+    monsters, monster2 = sources()
+    plan = etl.calculer_changements(monsters, monster2)
+    par_cle = {c["key"]: c["fields"] for c in plan["changes"]}
+    assert set(par_cle["slime"]) == {"french_name", "description", "growth", "max_stats"}
+    assert par_cle["slime"]["growth"]["new"] == {"hp": 2, "mp": 1}
+    assert par_cle["dracky"] == {"rank": {"old": "G", "new": "F"}}
+    assert plan["unmatched"] == ["orphelin"]
+    assert plan["summary"]["fields_changed"] == 5
+
+
+def test_appliquer_puis_recalculer_ne_change_plus_rien():
+    monsters, monster2 = sources()
+    avant = copy.deepcopy(monsters)
+    plan = etl.calculer_changements(monsters, monster2)
+    assert etl.appliquer_changements(monsters, plan["changes"]) == 2
+    assert monsters["orphelin"] == avant["orphelin"]
+    assert monsters["slime"]["family"] == "_slime"
+    second = etl.calculer_changements(monsters, monster2)
+    assert second["changes"] == []
+    assert second["summary"]["unchanged"] == 2
@@ -0,0 +1,54 @@
+"""Tests de la recherche plein texte BM25 (dex.recherche)"""
+
+from dex import recherche
+
+
+def index_test():
+    donnees = {
+        "skills": {
+            "frizz": {"name": "Frizz", "description": "Inflicts minor fire damage on a single enemy."},
+            "heal": {"name": "Heal", "description": "Restores at least 30 HP to a single ally."},
+            "zap": {"name": "Zap", "description": "Lightning damage on all enemies. Heal nothing."},
+        },
+        "traits": {"firewall": {"name": "Firewall", "description": "Reduces fire damage."}},
+        "items": {"herb": {"name": "Medicinal Herb", "description": "Restores 30 HP."}},
+        "monstres": {"slime": {"name": "Slime", "description": "A friendly blob."}},
+    }
+    return recherche.construire_index_recherche(donnees)
+
+
+def cles(resultats):
+    return [r["key"] for r in resultats]
+
+
+def test_nom_prioritaire_sur_la_description():
+    assert cles(recherche.rechercher(index_test(), "heal"))[:2] == ["heal", "zap"]
+
+
+def test_accents_et_mots_vides_ignores():
+    assert recherche.tokeniser("Éclair of the Héros") == ["eclair", "heros"]
+    assert recherche.rechercher(index_test(), "the of") == []
+
+
+def test_dernier_terme_en_prefixe():
+    assert set(cles(recherche.rechercher(index_test(), "fir"))) == {"frizz", "firewall"}
+    assert cles(recherche.rechercher(index_test(), "restores 30 h"))[0] in {"heal", "herb"}
+
+
+def test_filtre_par_type_et_nombre():
+    index = index_test()
+    assert cles(recherche.rechercher(index, "fire", types={"trait"})) == ["firewall"]
+    assert len(recherche.rechercher(index, "damage", n=1)) == 1
+
+
+def test_expansion_prefixe_garde_les_termes_les_plus_frequents(monkeypatch):
+    donnees = {"skills": {
+        "rare1": {"name": "Alpha", "description": "paa"},
+        "rare2": {"name": "Beta", "description": "pab"},
+        **{f"commun{i}": {"name": f"Q{i}", "description": "pazz"} for i in range(5)},
+    }}
+    index = recherche.construire_index_recherche(donnees)
+    monkeypatch.setattr(recherche, "MAX_EXPANSION_PREFIXE", 1)
+    # Par ordre alphabétique, "paa" serait seul retenu ; "pazz" est le plus fréquent
+    assert recherche._termes_prefixe(index, "pa") == ["pazz"]
+    assert all(cle.startswith("commun") for cle in cles(recherche.rechercher(index, "pa")))
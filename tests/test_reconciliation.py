@@ -0,0 +1,39 @@
+"""Tests du crosswalk persisté (dex.reconciliation)"""
+
+import json
+
+from dex import reconciliation
+from dex.ecriture import ecrire_json, lire_version
+
+
+def sources():
+    monsters = {
+        "slime": {"name": "Slime", "number": 1},
+        "dracky": {"name": "Dracky", "number": 2},
+    }
+    monster2 = [
+        {"MonsterId": 10, "Name": "Slime", "Identifier": "slime", "Number": 1},
+        {"MonsterId": 11, "Name": "Dracky", "Identifier": "dracky", "Number": 2},
+    ]
+    return monsters, monster2
+
+
+def test_crosswalk_perime_si_monster2_change():
+    monsters, monster2 = sources()
+    rapprochement = reconciliation.reconcilier(monsters, monster2)
+    assert reconciliation.a_jour(rapprochement, monsters, monster2)
+    # Même contenu relu depuis le disque : toujours à jour
+    assert reconciliation.a_jour(json.loads(json.dumps(rapprochement)), monsters, json.loads(json.dumps(monster2)))
+    monster2[1]["Name"] = "Drackmage"
+    assert not reconciliation.a_jour(rapprochement, monsters, monster2)
+    # Crosswalk d'avant l'empreinte : recalculé
+    del rapprochement["source_sha1"]
+    assert not reconciliation.a_jour(rapprochement, monsters, sources()[1])
+
+
+def test_ecriture_crosswalk_sans_nouvelle_version(tmp_path):
+    monsters, monster2 = sources()
+    chemin = tmp_path / "crosswalk.json"
+    assert ecrire_json(str(chemin), reconciliation.reconcilier(monsters, monster2), versionner=False) is None
+    assert lire_version(str(tmp_path)) == {}
+    assert reconciliation.rapprochement_courant(monsters, monster2, str(chemin))["crosswalk"]["slime"]["monster_id"] == 10
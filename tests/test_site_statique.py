@@ -0,0 +1,49 @@
+"""Tests des images de l'export statique (dex.site_statique)"""
+
+import os
+
+from PIL import Image
+
+from dex import site_statique
+from page.objets import chemin_image_monstre
+
+
+def test_images_du_dossier_de_donnees(tmp_path):
+    donnees, sortie = tmp_path / "donnees", tmp_path / "site"
+    (donnees / "MonsterImages").mkdir(parents=True)
+    Image.new("RGB", (400, 300), "green").save(donnees / "MonsterImages" / "Slime_Knight.1.jpg")
+    for dossier in site_statique.FORMATS_IMAGES:
+        (sortie / "images" / dossier).mkdir(parents=True)
+
+    chemin = chemin_image_monstre("Slime Knight", str(donnees))
+    assert chemin == os.path.join(str(donnees), "MonsterImages", "Slime_Knight.1.jpg")
+    assert chemin_image_monstre("Slime Knight", str(tmp_path)) is None
+
+    # Une image de monstre donne un fichier WebP par format (image et vignette)
+    site_statique._etat["images"] = {"slime_knight": chemin}
+    type_page, fichiers, octets = site_statique._rendre_lot("image", ["slime_knight"], str(sortie))
+    assert (type_page, fichiers) == ("image", 2) and octets > 0
+    with Image.open(sortie / "images" / "vignettes" / "slime_knight.webp") as vignette:
+        assert max(vignette.size) == site_statique.TAILLE_VIGNETTE
+
+
+def test_fichiers_obsoletes_supprimes(tmp_path):
+    donnees, sortie = tmp_path / "donnees", tmp_path / "site"
+    (donnees / "FamilyIcons").mkdir(parents=True)
+    (donnees / "FamilyIcons" / "slime.png").write_bytes(b"")
+    for dossier in ["monstres", "objets", "synthese", "images/monstres", "images/vignettes", "images/FamilyIcons"]:
+        (sortie / dossier).mkdir(parents=True)
+    # Export précédent : un monstre et un objet renommés depuis, une icône retirée
+    anciens = ["monstres/slime.html", "monstres/ancien_nom.html", "monstres/index.html", "synthese/ancien_nom.html",
+               "objets/herbe.html", "objets/ancien_objet.html", "images/monstres/ancien_nom.webp",
+               "images/vignettes/slime.webp", "images/FamilyIcons/slime.png", "images/FamilyIcons/retiree.png"]
+    for fichier in anciens:
+        (sortie / fichier).write_text("")
+
+    taches = [("image", ["slime"]), ("monstre", ["slime"]), ("synthese", []), ("objet", ["herbe"]),
+              *[("page", [nom_page]) for nom_page in site_statique.PAGES_UNIQUES]]
+    attendus = site_statique._fichiers_attendus(taches, str(donnees))
+    assert site_statique.supprimer_obsoletes(str(sortie), attendus) == 5
+    restants = sorted(str(chemin.relative_to(sortie)) for chemin in sortie.rglob("*") if chemin.is_file())
+    assert restants == ["images/FamilyIcons/slime.png", "images/vignettes/slime.webp", "monstres/index.html",
+                        "monstres/slime.html", "objets/herbe.html"]
@@ -0,0 +1,25 @@
+"""Tests de l'empreinte des fichiers sources enregistrée dans les exports (dex.sources)"""
+
+import json
+import os
+
+from dex.sources import FICHIERS, empreinte_sources
+
+
+def test_empreinte_suit_le_contenu(tmp_path):
+    for nom, fichier in FICHIERS.items():
+        (tmp_path / fichier).write_text(json.dumps({"nom": nom}), encoding="utf-8")
+    initiale = empreinte_sources(str(tmp_path))
+    chemin = tmp_path / FICHIERS["monstres"]
+    infos = os.stat(chemin)
+
+    # Modification à la main de même taille et même date : détectée quand même
+    chemin.write_text(json.dumps({"nom": "monstrE"}), encoding="utf-8")
+    os.utime(chemin, ns=(infos.st_atime_ns, infos.st_mtime_ns))
+    assert empreinte_sources(str(tmp_path)) != initiale
+    # Restreinte aux jeux exportés : un autre fichier ne compte pas
+    assert empreinte_sources(str(tmp_path), ["items"]) != empreinte_sources(str(tmp_path), ["monstres"])
+
+    # Même contenu réécrit (copie, retour arrière) : à nouveau à jour
+    chemin.write_text(json.dumps({"nom": "monstres"}), encoding="utf-8")
+    assert empreinte_sources(str(tmp_path)) == initiale
@@ -0,0 +1,37 @@
+"""Tests de l'accès en lecture seule à la base SQLite (dex.stockage_sqlite)"""
+
+import sqlite3
+import time
+
+import pytest
+
+from dex import stockage_sqlite
+
+
+@pytest.fixture
+def conn(tmp_path):
+    donnees = {"monstres": {"slime": {"name": "Slime", "number": 1, "rank": "G", "family": "_slime"}}}
+    chemin = stockage_sqlite.exporter_sqlite(donnees, str(tmp_path / "dqm3.sqlite"), empreinte="v1")
+    conn = stockage_sqlite.ouvrir_lecture(chemin)
+    yield conn
+    conn.close()
+
+
+def test_requete_lecture(conn):
+    colonnes, lignes = stockage_sqlite.requete(conn, "SELECT key, rank FROM monsters")
+    assert colonnes == ["key", "rank"] and lignes == [("slime", "G")]
+    assert stockage_sqlite.meta(conn)["sources_sha1"] == "v1"
+    with pytest.raises(ValueError):
+        stockage_sqlite.requete(conn, "DELETE FROM monsters")
+    with pytest.raises(sqlite3.OperationalError):
+        stockage_sqlite.requete(conn, "WITH x AS (SELECT 1) INSERT INTO families VALUES ('a', 'b')")
+
+
+def test_requete_sans_fin_interrompue(conn):
+    debut = time.monotonic()
+    with pytest.raises(sqlite3.OperationalError, match="interrompue"):
+        stockage_sqlite.requete(conn, "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c) "
+                                      "SELECT COUNT(*) FROM c", delai=0.2)
+    assert time.monotonic() - debut < 2
+    # Le gestionnaire est retiré : la connexion reste utilisable
+    assert stockage_sqlite.requete(conn, "SELECT COUNT(*) FROM monsters")[1] == [(1,)]
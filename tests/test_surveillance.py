@@ -0,0 +1,28 @@
+"""Tests des clés de cache des fichiers sources (dex.surveillance)"""
+
+import json
+import os
+
+from dex import surveillance
+from dex.ecriture import ecrire_json
+from dex.sources import FICHIERS
+
+
+def test_version_tamponnee_dans_les_cles(tmp_path):
+    for nom, fichier in FICHIERS.items():
+        (tmp_path / fichier).write_text(json.dumps({"nom": nom}), encoding="utf-8")
+    chemin = tmp_path / FICHIERS["monstres"]
+    assert surveillance.cle_fichier(surveillance.relever(str(tmp_path)), "monstres")[1] is None
+
+    ecrire_json(str(chemin), {"nom": "monstre"})
+    infos = os.stat(chemin)
+    ancien = surveillance.relever(str(tmp_path))
+    # Écriture de même taille dont la date est restaurée : seule la version tamponnée change
+    ecrire_json(str(chemin), {"nom": "monstrE"})
+    os.utime(chemin, ns=(infos.st_atime_ns, infos.st_mtime_ns))
+    nouveau = surveillance.relever(str(tmp_path), ancien)
+
+    assert nouveau["fichiers"]["monstres"] == ancien["fichiers"]["monstres"]
+    modifies = surveillance.changements(ancien, nouveau)
+    assert modifies["files"] == ["monstres"] and "matrices" in modifies["derived"]
+    assert surveillance.cle(nouveau, "talents") == surveillance.cle(ancien, "talents")
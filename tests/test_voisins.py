@@ -0,0 +1,18 @@
+"""Tests de l'index des monstres similaires (dex.voisins)"""
+
+import numpy as np
+
+from dex.voisins import monstres_similaires
+
+
+def test_similarites_bornees():
+    matrices = {"cles": ["a", "b", "c", "d"], "index": {"a": 0, "b": 1, "c": 2, "d": 3}}
+    voisins = {
+        "voisins": np.array([[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]], dtype=np.int32),
+        "similarites": np.array([[1.0000001, 0.4, -0.12]] * 4, dtype=np.float32),
+    }
+    similaires = monstres_similaires(voisins, matrices, "a", k=3)
+    assert [cle for cle, _ in similaires] == ["b", "c", "d"]
+    assert [s for _, s in similaires] == [1.0, np.float32(0.4), 0.0]
+    assert f"{similaires[-1][1]:.0%}" == "0%"
+    assert monstres_similaires(voisins, matrices, "inconnu") == []